@@ -0,0 +1,102 @@
+from typing import Any, Dict, Optional, Type
+
+from django.db.models import Model, OuterRef, QuerySet, Subquery
+
+from apps.players.models import Player
+from apps.teams.models import Team
+
+from .models import PlayerImage, TeamImage
+
+# 목록 응답에서 함께 내려주는 이미지 카테고리
+LOADED_IMAGE_CATEGORIES = ("profile", "background")
+
+
+def image_url_attr(category: str) -> str:
+    # annotate 로 붙는 속성 이름 (모델 필드와 겹치지 않도록 접두사 사용)
+    return f"latest_{category}_image_url"
+
+
+def image_variants_attr(category: str) -> str:
+    return f"latest_{category}_image_variants"
+
+
+def latest_image_url_subquery(
+    image_model: Type[Model], owner_field: str, category: str, field: str = "image_url"
+) -> Subquery:
+    """
+    owner 별 가장 최근 이미지 URL 을 가져오는 상관 서브쿼리
+
+    Args:
+        image_model (Type[Model]): PlayerImage / TeamImage
+        owner_field (str): 이미지가 바라보는 FK 이름 ("player", "team")
+        category (str): 이미지 카테고리
+        field (str): 가져올 컬럼 (image_url / variants)
+
+    Returns:
+        Subquery: 바깥 쿼리의 pk 를 기준으로 field 값 1개를 반환하는 서브쿼리
+    """
+    images = image_model._default_manager.filter(**{owner_field: OuterRef("pk"), "category": category})
+    return Subquery(images.order_by("-uploaded_at", "-id").values(field)[:1])
+
+
+def image_annotations(image_model: Type[Model], owner_field: str) -> Dict[str, Subquery]:
+    # 카테고리 별 최근 이미지 URL 과 파생 이미지 URL (srcset)
+    annotations = {}
+    for category in LOADED_IMAGE_CATEGORIES:
+        annotations[image_url_attr(category)] = latest_image_url_subquery(image_model, owner_field, category)
+        annotations[image_variants_attr(category)] = latest_image_url_subquery(
+            image_model, owner_field, category, "variants"
+        )
+    return annotations
+
+
+def with_player_images(queryset: QuerySet[Player]) -> QuerySet[Player]:
+    """
+    선수 queryset 에 프로필 / 배경 이미지 URL 과 파생 이미지 URL 을 annotate
+
+    선수 수와 상관없이 선수 조회 쿼리 1번으로 이미지 URL 까지 함께 가져옵니다.
+    """
+    return queryset.annotate(**image_annotations(PlayerImage, "player"))
+
+
+def with_team_images(queryset: QuerySet[Team]) -> QuerySet[Team]:
+    """팀 queryset 에 프로필 / 배경 이미지 URL 과 파생 이미지 URL 을 annotate"""
+    return queryset.annotate(**image_annotations(TeamImage, "team"))
+
+
+def load_latest_image(obj: Any, category: str) -> None:
+    # 단건 조회 등 loader 를 거치지 않은 경우 직접 조회해 annotate 와 같은 속성으로 저장 (URL / srcset 이 1번만 조회)
+    if isinstance(obj, Player):
+        images = obj.player_images.all()
+    else:
+        images = obj.team_images.all()
+    image = images.filter(category=category).order_by("-uploaded_at", "-id").first()
+    setattr(obj, image_url_attr(category), image.image_url if image else None)
+    setattr(obj, image_variants_attr(category), image.variants if image else None)
+
+
+def get_image_url(obj: Any, category: str) -> Optional[str]:
+    """
+    annotate 된 이미지 URL 을 반환하고, annotate 되지 않은 객체라면 직접 조회
+
+    Args:
+        obj (Any): Player / Team 객체
+        category (str): 이미지 카테고리
+
+    Returns:
+        Optional[str]: 이미지 URL 또는 None
+    """
+    attr = image_url_attr(category)
+    if not hasattr(obj, attr):
+        load_latest_image(obj, category)
+    return getattr(obj, attr)  # type: ignore[no-any-return]
+
+
+def get_image_srcset(obj: Any, category: str) -> Dict[str, Dict[str, str]]:
+    """
+    가장 최근 이미지의 파생 이미지 URL ({포맷: {너비: URL}}) 을 반환 (아직 생성되지 않았다면 빈 dict)
+    """
+    attr = image_variants_attr(category)
+    if not hasattr(obj, attr):
+        load_latest_image(obj, category)
+    return getattr(obj, attr) or {}
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cloud_images", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerimage",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="teamimage",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="userimage",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:55
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cloud_images", "0005_image_object"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="S3DeletionOutbox",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("key", models.CharField(max_length=255)),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("available_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "s3_deletion_outbox",
+                "indexes": [models.Index(fields=["available_at", "id"], name="s3_deletion_outbox_due_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cloud_images", "0006_s3_deletion_outbox"),
+        ("players", "0006_player_partial_indexes"),
+        ("teams", "0003_team_subscriber_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="playerimage",
+            index=models.Index(fields=["player", "category", "uploaded_at", "id"], name="player_image_latest_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="teamimage",
+            index=models.Index(fields=["team", "category", "uploaded_at", "id"], name="team_image_latest_idx"),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:42
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_updated_at(apps, schema_editor):
+    # 기존 이미지는 업로드 시각으로 채움 (마이그레이션 시각으로 두면 모든 상세 조회의 ETag 가 한 번에 바뀜)
+    for model_name in ("UserImage", "PlayerImage", "TeamImage"):
+        apps.get_model("cloud_images", model_name).objects.update(updated_at=F("uploaded_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cloud_images", "0007_image_latest_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerimage",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="teamimage",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="userimage",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
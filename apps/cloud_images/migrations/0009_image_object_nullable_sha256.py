@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cloud_images", "0008_image_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="imageobject",
+            name="sha256",
+            field=models.CharField(max_length=64, null=True, unique=True),
+        ),
+    ]
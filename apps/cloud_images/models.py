@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from apps.players.models import Player
 from apps.teams.models import Team
@@ -11,11 +12,51 @@ IMAGE_CATEGORIES = [
 ]
 
 
+class ImageObject(models.Model):
+    # 내용 해시 -> S3 객체 인덱스 (같은 파일을 다시 올리면 기존 객체를 재사용)
+    # presigned 업로드처럼 서버가 내용을 읽지 않은 객체는 해시 없이 key 로만 등록
+    sha256 = models.CharField(max_length=64, unique=True, null=True)
+    key = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField()
+    # 이 객체를 image_url 로 참조하는 이미지 행 수 (0 이 되면 행과 S3 객체를 삭제)
+    ref_count = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.ref_count})"
+
+    class Meta:
+        db_table = "image_object"
+
+
+class S3DeletionOutbox(models.Model):
+    # 삭제할 S3 객체 (요청 / 명령어는 DB 트랜잭션 안에서 행만 추가하고, drain_s3_deletions 명령어가 일괄 삭제)
+    key = models.CharField(max_length=255)
+    attempts = models.PositiveIntegerField(default=0)
+    # 다음 시도 가능 시각 (실패하면 지수 백오프로 미룸)
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.attempts})"
+
+    class Meta:
+        db_table = "s3_deletion_outbox"
+        indexes = [
+            models.Index(fields=["available_at", "id"], name="s3_deletion_outbox_due_idx"),
+        ]
+
+
 class UserImage(models.Model):
     # User Profile Image Model
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="user_images")
     image_url = models.URLField()
+    # 크기 별 파생 이미지 URL {포맷: {너비: URL}} (업로드 후 variants.generate_variants 가 채움)
+    variants = models.JSONField(default=dict, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # 파생 이미지 생성 등 행이 바뀐 시각 (상세 조회 ETag / Last-Modified 검증 값)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"User {self.user.id} - {self.image_url}"
@@ -29,7 +70,11 @@ class PlayerImage(models.Model):
     player = models.ForeignKey(Player, on_delete=models.CASCADE, related_name="player_images")
     category = models.CharField(max_length=20, choices=IMAGE_CATEGORIES)
     image_url = models.URLField()
+    # 크기 별 파생 이미지 URL {포맷: {너비: URL}} (업로드 후 variants.generate_variants 가 채움)
+    variants = models.JSONField(default=dict, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # 파생 이미지 생성 등 행이 바뀐 시각 (상세 조회 ETag / Last-Modified 검증 값)
+    updated_at = models.DateTimeField(auto_now=True)
     uploaded_by = models.ForeignKey(
         User, null=True, blank=True, on_delete=models.CASCADE, related_name="uploaded_player_images"
     )
@@ -39,6 +84,10 @@ class PlayerImage(models.Model):
 
     class Meta:
         db_table = "player_images"
+        indexes = [
+            # 갤러리 최신순 keyset 페이지네이션 / 가장 최근 프로필, 배경 이미지 조회 (player + category 조건에 (uploaded_at, id) 역순)
+            models.Index(fields=["player", "category", "uploaded_at", "id"], name="player_image_latest_idx"),
+        ]
 
 
 class TeamImage(models.Model):
@@ -46,7 +95,11 @@ class TeamImage(models.Model):
     team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="team_images")
     category = models.CharField(max_length=20, choices=IMAGE_CATEGORIES)
     image_url = models.URLField()
+    # 크기 별 파생 이미지 URL {포맷: {너비: URL}} (업로드 후 variants.generate_variants 가 채움)
+    variants = models.JSONField(default=dict, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # 파생 이미지 생성 등 행이 바뀐 시각 (상세 조회 ETag / Last-Modified 검증 값)
+    updated_at = models.DateTimeField(auto_now=True)
     uploaded_by = models.ForeignKey(
         User, null=True, blank=True, on_delete=models.CASCADE, related_name="uploaded_team_images"
     )
@@ -56,3 +109,7 @@ class TeamImage(models.Model):
 
     class Meta:
         db_table = "team_images"
+        indexes = [
+            # 갤러리 최신순 keyset 페이지네이션 / 가장 최근 프로필, 배경 이미지 조회 (team + category 조건에 (uploaded_at, id) 역순)
+            models.Index(fields=["team", "category", "uploaded_at", "id"], name="team_image_latest_idx"),
+        ]
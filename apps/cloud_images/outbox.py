@@ -0,0 +1,106 @@
+"""
+S3 객체 삭제 큐 (outbox)
+
+이미지 교체 / 삭제, 파생 이미지 정리, 영구 삭제 명령어는 S3 를 직접 호출하지 않고 삭제할 key 를
+같은 DB 트랜잭션 안에서 s3_deletion_outbox 에 추가합니다. (요청 지연에 S3 왕복이 더해지지 않고,
+롤백되면 삭제 예약도 함께 취소되며, S3 장애로 요청이 실패하지 않음)
+
+drain_s3_deletions 명령어가 큐를 delete_objects 한 번에 최대 1000개씩 비우고, 실패한 key 는 지수 백오프로 다시 시도합니다.
+"""
+
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.db import transaction
+from django.utils import timezone
+
+from config.settings import base
+
+from .models import S3DeletionOutbox
+
+# delete_objects 한 번에 지울 수 있는 최대 key 수
+MAX_KEYS_PER_REQUEST = 1000
+# 실패한 key 의 재시도 대기 시간 (시도 횟수마다 2배, 최대 1일)
+RETRY_BASE_DELAY = timedelta(minutes=1)
+RETRY_MAX_DELAY = timedelta(days=1)
+DEFAULT_MAX_ATTEMPTS = 8
+
+
+def enqueue_s3_deletion(keys: Iterable[str]) -> int:
+    # 삭제할 key 를 큐에 추가하고 추가한 수를 반환 (호출한 쪽의 트랜잭션과 함께 커밋)
+    rows = [S3DeletionOutbox(key=key) for key in dict.fromkeys(keys) if key]
+    S3DeletionOutbox.objects.bulk_create(rows)
+    return len(rows)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    delay: timedelta = RETRY_BASE_DELAY * 2 ** min(max(attempts - 1, 0), 16)
+    return min(delay, RETRY_MAX_DELAY)
+
+
+def drain_batch(batch_size: int = MAX_KEYS_PER_REQUEST, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Tuple[int, int]:
+    """
+    시도 가능한 삭제 요청을 batch_size 개까지 꺼내 delete_objects 한 번으로 삭제하고 (삭제, 실패) 수를 반환
+
+    SKIP LOCKED 로 꺼내므로 여러 프로세스가 동시에 실행해도 같은 행을 처리하지 않습니다.
+    성공한 행은 지우고, 실패한 행은 attempts / last_error 를 기록한 뒤 다음 시도 시각을 미룹니다.
+    """
+    batch_size = min(batch_size, MAX_KEYS_PER_REQUEST)
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            S3DeletionOutbox.objects.select_for_update(skip_locked=True)
+            .filter(available_at__lte=now, attempts__lt=max_attempts)
+            .order_by("available_at", "id")[:batch_size]
+        )
+        if not rows:
+            return 0, 0
+        # 같은 key 가 여러 번 예약된 경우 한 번만 요청
+        keys = list(dict.fromkeys(row.key for row in rows))
+        errors: Dict[str, str] = {}
+        try:
+            response = base.s3_client.delete_objects(
+                Bucket=base.AWS_S3_BUCKET_NAME, Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+            )
+            for error in response.get("Errors", []):
+                errors[error["Key"]] = f"{error.get('Code')}: {error.get('Message')}"
+        except (BotoCoreError, ClientError) as e:
+            errors = {key: str(e) for key in keys}
+
+        failed: List[S3DeletionOutbox] = []
+        done: List[int] = []
+        for row in rows:
+            if row.key in errors:
+                row.attempts += 1
+                row.available_at = now + retry_delay(row.attempts)
+                row.last_error = errors[row.key]
+                failed.append(row)
+            else:
+                done.append(row.pk)
+        S3DeletionOutbox.objects.filter(pk__in=done).delete()
+        S3DeletionOutbox.objects.bulk_update(failed, ["attempts", "available_at", "last_error"])
+    return len(done), len(failed)
+
+
+def drain_s3_deletions(
+    batch_size: int = MAX_KEYS_PER_REQUEST,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    max_batches: Optional[int] = None,
+) -> Tuple[int, int]:
+    # 시도 가능한 삭제 요청이 없을 때까지 (또는 max_batches 번) drain_batch 를 반복하고 전체 (삭제, 실패) 수를 반환
+    deleted = failed = batches = 0
+    while max_batches is None or batches < max_batches:
+        batch_deleted, batch_failed = drain_batch(batch_size, max_attempts)
+        deleted += batch_deleted
+        failed += batch_failed
+        batches += 1
+        # 실패한 행은 다음 시도 시각이 미뤄지므로 같은 실행에서 다시 꺼내지 않음
+        if batch_deleted + batch_failed < min(batch_size, MAX_KEYS_PER_REQUEST):
+            break
+    return deleted, failed
+
+
+def stuck_deletions(max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+    # 재시도 횟수를 모두 써서 더 이상 처리하지 않는 삭제 요청 수 (last_error 확인 후 attempts 를 0 으로 돌리면 재시도)
+    return S3DeletionOutbox.objects.filter(attempts__gte=max_attempts).count()
@@ -0,0 +1,352 @@
+from io import BytesIO, StringIO
+from typing import Any
+from unittest import mock
+
+import boto3
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from moto import mock_aws
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.players.models import Player
+from apps.users.models import User
+from config.settings import base
+
+from .models import ImageObject, PlayerImage, S3DeletionOutbox, UserImage
+from .outbox import drain_s3_deletions
+from .utils import register_image_object
+from .variants import variant_formats
+
+BUCKET = "test-bucket"
+DOMAIN = f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com"
+
+
+class S3TestCase(APITestCase):
+    """S3 를 moto 로 대체"""
+
+    def setUp(self) -> None:
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        self.s3: Any = boto3.client(
+            "s3", region_name="ap-northeast-2", aws_access_key_id="test", aws_secret_access_key="test"
+        )
+        self.s3.create_bucket(Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+        for name, value in (("s3_client", self.s3), ("AWS_S3_BUCKET_NAME", BUCKET), ("AWS_S3_CUSTOM_DOMAIN", DOMAIN)):
+            patcher = mock.patch.object(base, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(email="uploader@example.com", password="pass", nickname="uploader")
+        self.player = Player.objects.create(
+            realname="이상혁",
+            nickname="Faker",
+            gamename="Hide on bush",
+            position="mid",
+            date_of_birth="1996-05-07",
+            debut_date="2013-02-13",
+        )
+        self.client.force_authenticate(self.user)
+
+
+class PresignedUploadTest(S3TestCase):
+    """presigned 발급 -> 직접 업로드 -> 업로드 확인 흐름을 검증"""
+
+    def presign(self, category: str = "gallery", filename: str = "photo.png") -> Any:
+        url = reverse("player_image_upload", args=[self.player.id])
+        return self.client.post(url, {"filename": filename, "category": category}, format="json")
+
+    def confirm(self, key: str, category: str = "gallery") -> Any:
+        url = reverse("player_image_upload_confirm", args=[self.player.id])
+        return self.client.post(url, {"key": key, "category": category}, format="json")
+
+    def test_gallery_upload_flow(self) -> None:
+        response = self.presign()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        key = response.data["key"]
+        self.assertTrue(key.startswith("players_images/Faker/gallery/"))
+        self.assertEqual(response.data["fields"]["Content-Type"], "image/png")
+
+        # 클라이언트가 S3 에 직접 업로드
+        self.s3.put_object(Bucket=BUCKET, Key=key, Body=b"\x89PNG data", ContentType="image/png")
+
+        response = self.confirm(key)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        image = PlayerImage.objects.get(player=self.player)
+        self.assertEqual(image.image_url, f"{DOMAIN}/{key}")
+        self.assertEqual(image.uploaded_by, self.user)
+
+        # 같은 업로드를 다시 확인해도 이미지가 중복 저장되지 않음
+        self.assertEqual(self.confirm(key).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(PlayerImage.objects.count(), 1)
+
+    def test_confirm_rejects_invalid_objects(self) -> None:
+        # 업로드하지 않은 key / 발급 범위 밖의 key
+        key = self.presign().data["key"]
+        self.assertEqual(self.confirm(key).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.confirm("teams_images/T1/gallery/x.png").status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 선언한 형식과 다른 객체는 거부하고 S3 에서 삭제
+        self.s3.put_object(Bucket=BUCKET, Key=key, Body=b"<html>", ContentType="text/html")
+        self.assertEqual(self.confirm(key).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.s3.list_objects_v2(Bucket=BUCKET).get("KeyCount"), 0)
+        self.assertFalse(PlayerImage.objects.exists())
+
+    def test_presign_validation(self) -> None:
+        self.assertEqual(self.presign(filename="script.exe").status_code, status.HTTP_400_BAD_REQUEST)
+        # 프로필 이미지는 관리자만
+        self.assertEqual(self.presign(category="profile").status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_user_profile_upload_replaces_existing(self) -> None:
+        keys = []
+        for _ in range(2):
+            response = self.client.post(reverse("user_profile_upload"), {"filename": "me.jpg"}, format="json")
+            key = response.data["key"]
+            self.s3.put_object(Bucket=BUCKET, Key=key, Body=b"jpeg", ContentType="image/jpeg")
+            response = self.client.post(reverse("user_profile_upload_confirm"), {"key": key}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            keys.append(key)
+
+        self.assertEqual(list(UserImage.objects.values_list("image_url", flat=True)), [f"{DOMAIN}/{keys[1]}"])
+        # 교체된 이미지는 삭제 큐를 비울 때 S3 에서 삭제
+        self.assertEqual(list(S3DeletionOutbox.objects.values_list("key", flat=True)), [keys[0]])
+        drain_s3_deletions()
+        self.assertEqual([item["Key"] for item in self.s3.list_objects_v2(Bucket=BUCKET)["Contents"]], [keys[1]])
+
+    def test_confirm_claims_key_once(self) -> None:
+        key = self.client.post(reverse("user_profile_upload"), {"filename": "me.png"}, format="json").data["key"]
+        self.s3.put_object(Bucket=BUCKET, Key=key, Body=b"\x89PNG data", ContentType="image/png")
+        confirm_url = reverse("user_profile_upload_confirm")
+
+        # 다른 요청이 먼저 key 를 등록한 경우 (동시 확인) 이미지 행을 만들지 않음
+        self.assertTrue(register_image_object(key, 9))
+        self.assertEqual(
+            self.client.post(confirm_url, {"key": key}, format="json").status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.assertFalse(UserImage.objects.exists())
+        ImageObject.objects.filter(key=key).delete()
+
+        response = self.client.post(confirm_url, {"key": key}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(ImageObject.objects.get(key=key).sha256, None)
+
+        # 삭제 후 삭제 큐에서 기다리는 key 는 다시 확인할 수 없음
+        self.assertEqual(self.client.delete(reverse("user_profile")).status_code, status.HTTP_200_OK)
+        self.assertEqual(list(S3DeletionOutbox.objects.values_list("key", flat=True)), [key])
+        self.assertEqual(
+            self.client.post(confirm_url, {"key": key}, format="json").status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.assertFalse(UserImage.objects.exists())
+        self.assertFalse(ImageObject.objects.filter(key=key).exists())
+
+
+@override_settings(IMAGE_VARIANT_WORKERS=0, IMAGE_VARIANT_WIDTHS=(64, 256, 1024))
+class ImageVariantTest(S3TestCase):
+    """이미지 저장 커밋 이후 파생 이미지가 생성 / 삭제되는지 검증 (워커 0 = 같은 스레드에서 실행)"""
+
+    def upload_original(self, key: str, size: tuple[int, int] = (400, 300)) -> str:
+        buffer = BytesIO()
+        Image.new("RGB", size, (200, 30, 30)).save(buffer, format="PNG")
+        self.s3.put_object(Bucket=BUCKET, Key=key, Body=buffer.getvalue(), ContentType="image/png")
+        return f"{DOMAIN}/{key}"
+
+    def s3_keys(self) -> list[str]:
+        return sorted(item["Key"] for item in self.s3.list_objects_v2(Bucket=BUCKET).get("Contents", []))
+
+    def test_variants_generated_on_commit(self) -> None:
+        image_url = self.upload_original("players_images/Faker/profile/a.png")
+        with self.captureOnCommitCallbacks(execute=True):
+            image = PlayerImage.objects.create(player=self.player, category="profile", image_url=image_url)
+
+        image.refresh_from_db()
+        # 원본(400px) 보다 큰 너비는 만들지 않음
+        self.assertEqual(set(image.variants), set(variant_formats()))
+        self.assertEqual(set(image.variants["webp"]), {"64", "256", "400"})
+        self.assertEqual(image.variants["webp"]["256"], f"{DOMAIN}/players_images/Faker/profile/a_256.webp")
+        self.assertIn("players_images/Faker/profile/a_64.webp", self.s3_keys())
+
+        head = self.s3.head_object(Bucket=BUCKET, Key="players_images/Faker/profile/a_256.webp")
+        self.assertEqual(head["ContentType"], "image/webp")
+        with Image.open(
+            BytesIO(self.s3.get_object(Bucket=BUCKET, Key="players_images/Faker/profile/a_256.webp")["Body"].read())
+        ) as variant:
+            self.assertEqual(variant.size, (256, 192))
+
+        # 선수 상세 응답의 srcset
+        response = self.client.get(reverse("player-detail", args=[self.player.id]))
+        self.assertEqual(response.data["profile_image_srcset"], image.variants)
+
+        # 이미지 삭제 시 파생 이미지도 함께 삭제
+        image.delete()
+        drain_s3_deletions()
+        self.assertEqual(self.s3_keys(), ["players_images/Faker/profile/a.png"])
+
+    def test_backfill_command(self) -> None:
+        image_url = self.upload_original("players_images/Faker/gallery/b.png", size=(100, 100))
+        # on_commit 콜백을 실행하지 않으면 variants 가 비어 있는 상태
+        with self.captureOnCommitCallbacks(execute=False):
+            image = PlayerImage.objects.create(player=self.player, category="gallery", image_url=image_url)
+            missing = PlayerImage.objects.create(
+                player=self.player, category="gallery", image_url=f"{DOMAIN}/players_images/Faker/gallery/none.png"
+            )
+        self.assertEqual(image.variants, {})
+
+        call_command("generate_image_variants", stdout=StringIO())
+
+        image.refresh_from_db()
+        missing.refresh_from_db()
+        self.assertEqual(set(image.variants["webp"]), {"64", "100"})
+        self.assertEqual(missing.variants, {})
+
+
+class ContentDedupTest(S3TestCase):
+    """같은 내용의 업로드가 S3 객체 하나를 참조 수로 공유하는지 검증"""
+
+    def upload(self, content: bytes, filename: str = "photo.png") -> Any:
+        url = reverse("player_gallery", args=[self.player.id])
+        image = SimpleUploadedFile(filename, content, content_type="image/png")
+        return self.client.post(url, {"category": "gallery", "image": image}, format="multipart")
+
+    def delete(self, image_id: int) -> Any:
+        return self.client.delete(reverse("player_gallery_details", args=[self.player.id, image_id]))
+
+    def s3_keys(self) -> list[str]:
+        return sorted(item["Key"] for item in self.s3.list_objects_v2(Bucket=BUCKET).get("Contents", []))
+
+    def test_duplicate_upload_reuses_object(self) -> None:
+        first = self.upload(b"same photo")
+        second = self.upload(b"same photo", filename="copy.png")
+        other = self.upload(b"other photo")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(first.data["image_url"], second.data["image_url"])
+        self.assertNotEqual(first.data["image_url"], other.data["image_url"])
+
+        # 중복 업로드는 S3 에 남지 않음
+        drain_s3_deletions()
+        self.assertEqual(len(self.s3_keys()), 2)
+        shared = ImageObject.objects.get(key=first.data["image_url"].removeprefix(f"{DOMAIN}/"))
+        self.assertEqual(shared.ref_count, 2)
+        self.assertEqual(shared.size, len(b"same photo"))
+
+        # 마지막 참조가 지워질 때만 객체 삭제
+        self.assertEqual(self.delete(first.data["id"]).status_code, status.HTTP_200_OK)
+        drain_s3_deletions()
+        self.assertIn(shared.key, self.s3_keys())
+        self.assertEqual(ImageObject.objects.get(pk=shared.pk).ref_count, 1)
+
+        self.assertEqual(self.delete(second.data["id"]).status_code, status.HTTP_200_OK)
+        drain_s3_deletions()
+        self.assertNotIn(shared.key, self.s3_keys())
+        self.assertFalse(ImageObject.objects.filter(pk=shared.pk).exists())
+
+        # 삭제된 뒤 다시 올리면 새 객체로 등록
+        again = self.upload(b"same photo")
+        self.assertIn(again.data["image_url"].removeprefix(f"{DOMAIN}/"), self.s3_keys())
+        self.assertEqual(ImageObject.objects.count(), 2)
+
+
+class S3DeletionOutboxTest(S3TestCase):
+    """이미지 교체 / 삭제가 S3 를 바로 호출하지 않고 삭제 큐에 쌓이고, drain 명령어가 일괄 삭제 / 재시도하는지 검증"""
+
+    def put(self, *keys: str) -> None:
+        for key in keys:
+            self.s3.put_object(Bucket=BUCKET, Key=key, Body=b"data")
+
+    def s3_keys(self) -> list[str]:
+        return sorted(item["Key"] for item in self.s3.list_objects_v2(Bucket=BUCKET).get("Contents", []))
+
+    def test_profile_replace_defers_s3_delete(self) -> None:
+        self.user.is_staff = True
+        self.user.save()
+        url = reverse("player_profile", args=[self.player.id])
+        urls = []
+        for content in (b"first", b"second"):
+            image = SimpleUploadedFile("profile.png", content, content_type="image/png")
+            with mock.patch.object(self.s3, "delete_object", wraps=self.s3.delete_object) as delete_object:
+                response = self.client.post(url, {"category": "profile", "image": image}, format="multipart")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            # 요청 중에는 S3 삭제를 호출하지 않음
+            delete_object.assert_not_called()
+            urls.append(response.data["image_url"])
+
+        old_key = urls[0].removeprefix(f"{DOMAIN}/")
+        self.assertEqual(list(S3DeletionOutbox.objects.values_list("key", flat=True)), [old_key])
+        self.assertEqual(len(self.s3_keys()), 2)
+
+        out = StringIO()
+        call_command("drain_s3_deletions", stdout=out)
+        self.assertIn("1개 삭제 완료", out.getvalue())
+        self.assertEqual(self.s3_keys(), [urls[1].removeprefix(f"{DOMAIN}/")])
+        self.assertFalse(S3DeletionOutbox.objects.exists())
+
+    def test_drain_batches_and_retries(self) -> None:
+        keys = [f"players_images/Faker/gallery/{i}.png" for i in range(5)]
+        self.put(*keys)
+        S3DeletionOutbox.objects.bulk_create(S3DeletionOutbox(key=key) for key in keys)
+
+        with mock.patch.object(self.s3, "delete_objects", wraps=self.s3.delete_objects) as delete_objects:
+            self.assertEqual(drain_s3_deletions(batch_size=2), (5, 0))
+        self.assertEqual(delete_objects.call_count, 3)
+        self.assertEqual(self.s3_keys(), [])
+
+        # 실패한 key 는 시도 횟수를 기록하고 다음 시도 시각을 미룸
+        S3DeletionOutbox.objects.create(key="players_images/Faker/gallery/fail.png")
+        with mock.patch.object(
+            self.s3,
+            "delete_objects",
+            return_value={
+                "Errors": [
+                    {"Key": "players_images/Faker/gallery/fail.png", "Code": "AccessDenied", "Message": "denied"}
+                ]
+            },
+        ):
+            self.assertEqual(drain_s3_deletions(), (0, 1))
+        row = S3DeletionOutbox.objects.get()
+        self.assertEqual(row.attempts, 1)
+        self.assertEqual(row.last_error, "AccessDenied: denied")
+        self.assertEqual(drain_s3_deletions(), (0, 0))
+
+        # 재시도 시각이 지나면 다시 시도
+        S3DeletionOutbox.objects.update(available_at=row.created_at)
+        self.assertEqual(drain_s3_deletions(), (1, 0))
+        self.assertFalse(S3DeletionOutbox.objects.exists())
+
+
+class GalleryPaginationTest(APITestCase):
+    """갤러리 목록이 최신순 keyset 페이지네이션으로 조회되는지 검증"""
+
+    def test_gallery_pages_latest_first(self) -> None:
+        player = Player.objects.create(
+            realname="이상혁",
+            nickname="Faker",
+            gamename="Hide on bush",
+            position="mid",
+            date_of_birth="1996-05-07",
+            debut_date="2013-02-13",
+        )
+        images = PlayerImage.objects.bulk_create(
+            [PlayerImage(player=player, category="gallery", image_url=f"{DOMAIN}/{i}.png") for i in range(5)]
+        )
+        # 같은 시각에 올라온 이미지는 id 역순
+        PlayerImage.objects.filter(pk=images[0].pk).update(uploaded_at=images[0].uploaded_at.replace(year=2020))
+        PlayerImage.objects.create(player=player, category="profile", image_url=f"{DOMAIN}/profile.png")
+
+        url = reverse("player_gallery", args=[player.id])
+        seen: list[int] = []
+        response = self.client.get(url, {"page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(item["id"] for item in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        expected = list(
+            PlayerImage.objects.filter(category="gallery").order_by("-uploaded_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertEqual(seen[-1], images[0].pk)
@@ -3,13 +3,19 @@ from django.urls import path
 from .views import (
     PlayerGalleryDetailView,
     PlayerGalleryImageView,
+    PlayerImageUploadConfirmView,
+    PlayerImageUploadView,
     PlayerProfileImageDetailView,
     PlayerProfileImageView,
     TeamGalleryDetailView,
     TeamGalleryImageView,
+    TeamImageUploadConfirmView,
+    TeamImageUploadView,
     TeamProfileImageDetailView,
     TeamProfileImageView,
     UserImageDetailView,
+    UserImageUploadConfirmView,
+    UserImageUploadView,
     UserImageView,
 )
 
@@ -33,4 +39,15 @@ urlpatterns = [
     # 팀 갤러리
     path("teams/<int:team_id>/gallery/", TeamGalleryImageView.as_view(), name="team_gallery"),
     path("teams/<int:team_id>/gallery/<int:image_id>/", TeamGalleryDetailView.as_view(), name="team_gallery_details"),
+    # S3 직접 업로드 (presigned POST 발급 / 업로드 확인)
+    path("users/profile/upload/", UserImageUploadView.as_view(), name="user_profile_upload"),
+    path("users/profile/upload/confirm/", UserImageUploadConfirmView.as_view(), name="user_profile_upload_confirm"),
+    path("players/<int:player_id>/upload/", PlayerImageUploadView.as_view(), name="player_image_upload"),
+    path(
+        "players/<int:player_id>/upload/confirm/",
+        PlayerImageUploadConfirmView.as_view(),
+        name="player_image_upload_confirm",
+    ),
+    path("teams/<int:team_id>/upload/", TeamImageUploadView.as_view(), name="team_image_upload"),
+    path("teams/<int:team_id>/upload/confirm/", TeamImageUploadConfirmView.as_view(), name="team_image_upload_confirm"),
 ]
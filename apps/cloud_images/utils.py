@@ -1,10 +1,25 @@
+import hashlib
 import uuid
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from config.settings import base
 
+from .models import ImageObject, S3DeletionOutbox
+from .outbox import enqueue_s3_deletion
+
 # 허용된 확장자 목록
 ALLOWED_EXTENSIONS = {"jpeg", "png", "jpg", "gif"}
+# 확장자 별 Content-Type (presigned 업로드 시 S3 객체의 Content-Type 으로 강제)
+CONTENT_TYPES = {"jpeg": "image/jpeg", "jpg": "image/jpeg", "png": "image/png", "gif": "image/gif"}
+# 업로드 최대 크기 (nginx client_max_body_size 20M 과 동일)
+MAX_UPLOAD_SIZE = 20 * 1024 * 1024
+# presigned 업로드 URL 유효 시간 (초)
+PRESIGNED_UPLOAD_EXPIRES = 600
 
 
 def validate_file_extension(filename: str) -> Optional[Tuple[str, str]]:
@@ -21,10 +36,120 @@ def validate_file_extension(filename: str) -> Optional[Tuple[str, str]]:
     return file_name, file_extension
 
 
+def s3_path_prefix(category: str, instance_type: str, object_identifier: int | str) -> str:
+    # S3 저장 경로 (파일 이름 제외)
+    if instance_type == "users":
+        return f"users_images/{object_identifier}/"
+    elif instance_type == "players":
+        return f"players_images/{object_identifier}/{category}/"
+    elif instance_type == "teams":
+        return f"teams_images/{object_identifier}/{category}/"
+    raise ValueError(f"Invalid instance type: {instance_type}")
+
+
+def build_s3_path(category: str, instance_type: str, object_identifier: int | str, file_extension: str) -> str:
+    # 새 업로드 파일의 S3 저장 경로 (파일 이름은 uuid)
+    return f"{s3_path_prefix(category, instance_type, object_identifier)}{uuid.uuid4()}.{file_extension}"
+
+
+class HashingReader:
+    """
+    읽히는 바이트로 SHA-256 과 크기를 계산하는 파일 래퍼
+
+    upload_fileobj 가 업로드하면서 읽는 chunk 를 그대로 해시하므로 파일을 두 번 읽지 않습니다.
+    (seek 를 제공하지 않아 boto3 가 처음부터 순서대로 읽음)
+    """
+
+    def __init__(self, file: Any) -> None:
+        self.file = file
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk: bytes = self.file.read(size)
+        self.hash.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
+
+
+def acquire_image_object(sha256: str, key: str, size: int) -> str:
+    """
+    내용 해시로 S3 객체를 등록하고 이미지 행이 사용할 key 를 반환
+
+    같은 해시가 이미 있으면 참조 수만 1 늘리고 기존 key 를, 없으면 key 를 새로 등록해 그대로 반환합니다.
+    (INSERT ... ON CONFLICT 한 문장이라 동시에 같은 파일이 올라와도 객체는 하나만 남음)
+    """
+    table = connection.ops.quote_name(ImageObject._meta.db_table)
+    sql = f"""
+        INSERT INTO {table} (sha256, key, size, ref_count, created_at)
+        VALUES (%s, %s, %s, 1, %s)
+        ON CONFLICT (sha256) DO UPDATE SET ref_count = {table}.ref_count + 1
+        RETURNING key
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [sha256, key, size, timezone.now()])
+        (existing_key,) = cursor.fetchone()
+    return str(existing_key)
+
+
+def register_image_object(key: str, size: int) -> bool:
+    """
+    내용 해시 없이 key 로 S3 객체를 등록하고, 새로 등록했는지 반환 (presigned 업로드 확인)
+
+    이미 등록된 key (확인된 업로드) 나 삭제 큐에 있는 key 면 False 를 반환합니다.
+    (INSERT ... ON CONFLICT 한 문장이라 같은 업로드를 동시에 확인해도 한 요청만 등록됨)
+    """
+    table = connection.ops.quote_name(ImageObject._meta.db_table)
+    sql = f"""
+        INSERT INTO {table} (sha256, key, size, ref_count, created_at)
+        VALUES (NULL, %s, %s, 1, %s)
+        ON CONFLICT (key) DO NOTHING
+        RETURNING id
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [key, size, timezone.now()])
+            registered = cursor.fetchone() is not None
+        # 확인 후 삭제되어 삭제 큐에서 기다리는 객체는 다시 확인할 수 없음
+        if registered and S3DeletionOutbox.objects.filter(key=key).exists():
+            transaction.set_rollback(True)
+            return False
+    return registered
+
+
+def release_image_object(key: str) -> bool:
+    """
+    이미지 행 하나가 더 이상 key 를 참조하지 않을 때 호출하고, S3 객체를 삭제해야 하는지 반환
+
+    참조 수를 1 줄이고 마지막 참조였다면 인덱스 행을 지웁니다.
+    인덱스에 없는 객체 (인덱스 도입 이전 업로드) 는 이미지 행 하나만 참조하므로 바로 삭제 대상입니다.
+    """
+    with transaction.atomic():
+        image_object = ImageObject.objects.select_for_update().filter(key=key).first()
+        if image_object is None:
+            return True
+        if image_object.ref_count > 1:
+            ImageObject.objects.filter(pk=image_object.pk).update(ref_count=F("ref_count") - 1)
+            return False
+        image_object.delete()
+        return True
+
+
+def is_shared_image(image_url: str) -> bool:
+    # 다른 이미지 행이 아직 같은 S3 객체를 참조하는지 (파생 이미지 삭제 여부 판단)
+    return ImageObject.objects.filter(key=s3_key_from_url(image_url)).exists()
+
+
 def upload_image_to_s3(file: Any, category: str, instance_type: str, object_identifier: int | str) -> Optional[str]:
     """
     S3 에 이미지 업로드 후 URL 반환
 
+    업로드하면서 내용의 SHA-256 을 계산하고, 같은 내용의 객체가 이미 있으면 방금 올린 객체를 지우고 기존 객체의 URL 을 반환합니다.
+    반환된 URL 은 참조 수가 1 늘어난 상태이므로 이미지 행을 지울 때 delete_file_from_s3 를 호출해야 합니다.
+
     Args:
         file (Any); 업로드할 파일 객체
         category (str): 이미지 카테고리
@@ -41,29 +166,39 @@ def upload_image_to_s3(file: Any, category: str, instance_type: str, object_iden
         raise ValueError(f"Invalid file extension: {file.name.split('.')[-1].lower()}")
 
     file_name, file_extension = validation_result
-    new_filename = f"{uuid.uuid4()}.{file_extension}"
-
-    # S3 저장 경로 설정
-    if instance_type == "users":
-        s3_path = f"users_images/{object_identifier}/{new_filename}"
-    elif instance_type == "players":
-        s3_path = f"players_images/{object_identifier}/{category}/{new_filename}"
-    elif instance_type == "teams":
-        s3_path = f"teams_images/{object_identifier}/{category}/{new_filename}"
-    else:
-        raise ValueError(f"Invalid instance type: {instance_type}")
+    s3_path = build_s3_path(category, instance_type, object_identifier, file_extension)
+    reader = HashingReader(file)
 
     try:
-        base.s3_client.upload_fileobj(file, base.AWS_S3_BUCKET_NAME, s3_path)
-        return f"{base.AWS_S3_CUSTOM_DOMAIN}/{s3_path}"
+        base.s3_client.upload_fileobj(
+            reader, base.AWS_S3_BUCKET_NAME, s3_path, ExtraArgs={"ContentType": CONTENT_TYPES[file_extension]}
+        )
+        key = acquire_image_object(reader.hexdigest(), s3_path, reader.size)
+        if key != s3_path:
+            # 같은 내용의 객체가 이미 있음 - 방금 올린 객체는 삭제 큐로
+            enqueue_s3_deletion([s3_path])
+        return f"{base.AWS_S3_CUSTOM_DOMAIN}/{key}"
     except Exception as e:
         raise RuntimeError(f"S3 Upload Error: {e}")
 
 
+def s3_key_from_url(image_url: str) -> str:
+    # 이미지 URL 에서 S3 key 추출
+    return image_url.replace(base.AWS_S3_CUSTOM_DOMAIN + "/", "")
+
+
+def variant_keys(variants: Dict[str, Dict[str, str]]) -> List[str]:
+    # 파생 이미지 {포맷: {너비: URL}} 의 S3 key 목록
+    return [s3_key_from_url(url) for urls in variants.values() for url in urls.values()]
+
+
 def delete_file_from_s3(image_url: str) -> bool:
     """
     S3 에서 이미지 삭제
 
+    S3 를 바로 호출하지 않고 삭제 큐 (outbox) 에 추가하므로 이미지 행 삭제와 같은 트랜잭션에서 호출해야 합니다.
+    같은 내용으로 업로드된 다른 이미지 행이 객체를 참조하고 있으면 참조 수만 줄이고 객체는 남깁니다.
+
     Args:
         image_url (str): 삭제할 이미지의 S3 URL
 
@@ -71,9 +206,93 @@ def delete_file_from_s3(image_url: str) -> bool:
         bool: 삭제 성공 여부
     """
 
+    s3_path = s3_key_from_url(image_url)
+    if release_image_object(s3_path):
+        enqueue_s3_deletion([s3_path])
+    return True
+
+
+def discard_image(image: Any) -> bool:
+    # 이미지 행 삭제와 S3 객체 삭제 예약을 한 트랜잭션으로 (파생 이미지는 post_delete 시그널이 예약)
+    with transaction.atomic():
+        delete_file_from_s3(image.image_url)
+        image.delete()
+    return True
+
+
+def release_images(images: Iterable[Tuple[str, Dict[str, Dict[str, str]]]]) -> int:
+    """
+    시그널 없이 한꺼번에 지워지는 이미지 행 (영구 삭제 명령어) 의 (image_url, variants) 로 참조를 해제하고
+    더 이상 참조되지 않는 원본 / 파생 이미지를 삭제 큐에 추가한 뒤, 추가한 key 수를 반환
+    """
+    keys: List[str] = []
+    for image_url, variants in images:
+        key = s3_key_from_url(image_url)
+        if release_image_object(key):
+            keys.append(key)
+            keys.extend(variant_keys(variants or {}))
+    return enqueue_s3_deletion(keys)
+
+
+def create_presigned_upload(
+    filename: str, category: str, instance_type: str, object_identifier: int | str
+) -> Dict[str, Any]:
+    """
+    클라이언트가 S3 에 직접 업로드할 presigned POST 발급
+
+    upload_image_to_s3 와 같은 경로에 uuid 파일 이름으로 key 를 만들고,
+    Content-Type 과 크기(content-length-range)를 정책 조건으로 걸어 다른 형식 / 큰 파일은 S3 에서 거부되도록 합니다.
+
+    Returns:
+        Dict[str, Any]: {"key", "url", "fields", "expires_in"} - url 로 fields + file 을 multipart POST
+
+    Raises:
+        ValueError: 허용되지 않은 확장자
+    """
+    validation_result = validate_file_extension(filename)
+    if validation_result is None:
+        raise ValueError(f"Invalid file extension: {filename}")
+    _, file_extension = validation_result
+    key = build_s3_path(category, instance_type, object_identifier, file_extension)
+    content_type = CONTENT_TYPES[file_extension]
+
+    presigned = base.s3_client.generate_presigned_post(
+        Bucket=base.AWS_S3_BUCKET_NAME,
+        Key=key,
+        Fields={"Content-Type": content_type},
+        Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, MAX_UPLOAD_SIZE]],
+        ExpiresIn=PRESIGNED_UPLOAD_EXPIRES,
+    )
+    return {"key": key, "url": presigned["url"], "fields": presigned["fields"], "expires_in": PRESIGNED_UPLOAD_EXPIRES}
+
+
+def confirm_uploaded_image(
+    key: str, category: str, instance_type: str, object_identifier: int | str
+) -> Tuple[str, int]:
+    """
+    presigned 업로드가 끝난 객체를 HEAD 로 검증하고 (이미지 URL, 크기) 반환
+
+    key 가 발급 범위(대상 / 카테고리 경로) 안에 있는지, 객체가 있는지, 크기와 Content-Type 이 허용 범위인지 확인하며
+    검증에 실패한 객체는 S3 에서 삭제합니다.
+
+    Raises:
+        ValueError: 검증 실패
+    """
+    prefix = s3_path_prefix(category, instance_type, object_identifier)
+    filename = key[len(prefix) :]
+    if not key.startswith(prefix) or not filename or "/" in filename:
+        raise ValueError("Invalid upload key")
+    validation_result = validate_file_extension(filename)
+    if validation_result is None:
+        raise ValueError(f"Invalid file extension: {filename}")
+    _, file_extension = validation_result
+
     try:
-        s3_path = image_url.replace(base.AWS_S3_CUSTOM_DOMAIN + "/", "")
-        base.s3_client.delete_object(Bucket=base.AWS_S3_BUCKET_NAME, Key=s3_path)
-        return True
-    except Exception as e:
-        raise RuntimeError(f"S3 Delete Error: {e}")
+        head = base.s3_client.head_object(Bucket=base.AWS_S3_BUCKET_NAME, Key=key)
+    except ClientError:
+        raise ValueError("Uploaded file not found")
+
+    if not 0 < head["ContentLength"] <= MAX_UPLOAD_SIZE or head.get("ContentType") != CONTENT_TYPES[file_extension]:
+        base.s3_client.delete_object(Bucket=base.AWS_S3_BUCKET_NAME, Key=key)
+        raise ValueError("Uploaded file must be an image of the declared type up to 20MB")
+    return f"{base.AWS_S3_CUSTOM_DOMAIN}/{key}", int(head["ContentLength"])
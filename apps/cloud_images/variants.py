@@ -0,0 +1,172 @@
+"""
+업로드된 이미지의 크기 별 파생 이미지 (WebP / AVIF) 생성
+
+이미지 행이 저장되면 (upload_image_to_s3 / presigned 업로드 확인) 커밋 이후 프로세스 내 워커 스레드에서
+원본을 S3 에서 내려받아 settings.IMAGE_VARIANT_WIDTHS 너비로 줄이고 포맷 별로 인코딩해 원본 옆 경로에 올립니다.
+결과는 이미지 행의 variants 에 {포맷: {너비: URL}} 형태로 저장되며, 응답의 srcset 으로 내려갑니다.
+
+원본보다 큰 너비는 만들지 않고 (원본 너비로 대체), AVIF 는 Pillow 가 지원하는 환경에서만 만듭니다.
+생성에 실패한 이미지는 variants 가 비어 있으므로 generate_image_variants 명령어로 다시 만들 수 있습니다.
+이미지가 삭제되면 파생 이미지는 S3 삭제 큐 (outbox) 로 지웁니다.
+"""
+
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Type
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Model
+from PIL import Image, ImageOps, features
+
+from config.settings import base
+
+from .outbox import enqueue_s3_deletion
+from .utils import s3_key_from_url, variant_keys
+
+logger = logging.getLogger(__name__)
+
+# 파생 이미지는 key 가 바뀌지 않는 한 내용이 바뀌지 않으므로 오래 캐시
+VARIANT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# {포맷: {너비(str): URL}}
+Variants = Dict[str, Dict[str, str]]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def variant_widths() -> Tuple[int, ...]:
+    return tuple(getattr(settings, "IMAGE_VARIANT_WIDTHS", (64, 256, 1024)))
+
+
+def variant_formats() -> Tuple[str, ...]:
+    return ("webp", "avif") if features.check("avif") else ("webp",)
+
+
+def variant_key(key: str, width: int, image_format: str) -> str:
+    # players_images/Faker/profile/<uuid>.png -> players_images/Faker/profile/<uuid>_256.webp
+    return f"{key.rsplit('.', 1)[0]}_{width}.{image_format}"
+
+
+def render_variants(
+    data: bytes, widths: Sequence[int], formats: Sequence[str], quality: int = 80
+) -> Iterator[Tuple[int, str, bytes]]:
+    """
+    원본 이미지 바이트로 (너비, 포맷, 인코딩된 바이트) 를 만듦
+
+    JPEG 는 draft 로 디코딩 단계에서 미리 줄여 큰 원본도 메모리 / CPU 를 적게 쓰며, EXIF 회전을 반영합니다.
+    애니메이션 GIF 는 첫 프레임만 사용합니다.
+    """
+    with Image.open(BytesIO(data)) as original:
+        original.draft("RGB", (max(widths), max(widths)))
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+        for width in sorted({min(width, image.width) for width in widths}):
+            resized = image
+            if width != image.width:
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            for image_format in formats:
+                buffer = BytesIO()
+                resized.save(buffer, format=image_format.upper(), quality=quality)
+                yield width, image_format, buffer.getvalue()
+
+
+def generate_variants(image_model: Type[Model], pk: int) -> Variants:
+    """
+    이미지 행 하나의 파생 이미지를 만들어 S3 에 올리고 variants 에 저장
+
+    같은 원본을 참조하는 다른 행의 파생 이미지가 있으면 그대로 사용하고,
+    생성하는 동안 이미지가 삭제된 경우에는 올린 파생 이미지를 다시 지웁니다.
+    """
+    image: Any = image_model._default_manager.filter(pk=pk).first()
+    if image is None:
+        return {}
+    # 같은 원본 (내용 해시로 재사용된 객체) 의 파생 이미지가 이미 있으면 다시 만들지 않음
+    existing = (
+        image_model._default_manager.filter(image_url=image.image_url)
+        .exclude(pk=pk)
+        .exclude(variants={})
+        .values_list("variants", flat=True)
+        .first()
+    )
+    if existing:
+        image.variants = existing
+        image.save(update_fields=["variants", "updated_at"])
+        return image.variants  # type: ignore[no-any-return]
+    key = s3_key_from_url(image.image_url)
+    data = base.s3_client.get_object(Bucket=base.AWS_S3_BUCKET_NAME, Key=key)["Body"].read()
+
+    variants: Variants = defaultdict(dict)
+    quality = int(getattr(settings, "IMAGE_VARIANT_QUALITY", 80))
+    for width, image_format, body in render_variants(data, variant_widths(), variant_formats(), quality):
+        path = variant_key(key, width, image_format)
+        base.s3_client.put_object(
+            Bucket=base.AWS_S3_BUCKET_NAME,
+            Key=path,
+            Body=body,
+            ContentType=f"image/{image_format}",
+            CacheControl=VARIANT_CACHE_CONTROL,
+        )
+        variants[image_format][str(width)] = f"{base.AWS_S3_CUSTOM_DOMAIN}/{path}"
+    image.variants = dict(variants)
+    try:
+        # save 로 저장해야 post_save 시그널로 이미지가 포함된 응답 캐시도 무효화됨
+        image.save(update_fields=["variants", "updated_at"])
+    except DatabaseError:
+        # 생성하는 동안 이미지가 삭제됨
+        enqueue_s3_deletion(variant_keys(image.variants))
+        return {}
+    return image.variants  # type: ignore[no-any-return]
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(getattr(settings, "IMAGE_VARIANT_WORKERS", 2)), thread_name_prefix="image-variants"
+            )
+        return _executor
+
+
+def run_task(task: Callable[..., Any], *args: Any) -> None:
+    # 요청 흐름 밖에서 실행되므로 실패는 로그만 남김 (variants 가 빈 이미지는 명령어로 재생성)
+    try:
+        task(*args)
+    except Exception:
+        logger.exception("image variant task failed: %s%s", task.__name__, args)
+
+
+def run_in_worker(task: Callable[..., Any], *args: Any) -> None:
+    try:
+        run_task(task, *args)
+    finally:
+        # 워커 스레드의 DB 연결은 요청 사이클 밖이라 자동으로 닫히지 않음
+        connections.close_all()
+
+
+def submit(task: Callable[..., Any], *args: Any) -> None:
+    """커밋 이후 워커 스레드에서 task 실행 (IMAGE_VARIANT_WORKERS 가 0 이면 같은 스레드에서 바로 실행)"""
+
+    def start() -> None:
+        if int(getattr(settings, "IMAGE_VARIANT_WORKERS", 2)) <= 0:
+            run_task(task, *args)
+        else:
+            get_executor().submit(run_in_worker, task, *args)
+
+    transaction.on_commit(start)
+
+
+def schedule_variants(image_model: Type[Model], pk: int) -> None:
+    submit(generate_variants, image_model, pk)
+
+
+def schedule_variant_deletion(variants: Variants) -> None:
+    # 이미지 행 삭제와 같은 트랜잭션에서 삭제 큐에 추가 (drain_s3_deletions 가 삭제)
+    enqueue_s3_deletion(variant_keys(variants))
@@ -1,19 +1,39 @@
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiParameter, OpenApiRequest, extend_schema
+from drf_spectacular.utils import (
+    OpenApiExample,
+    OpenApiParameter,
+    OpenApiRequest,
+    extend_schema,
+)
 from rest_framework import status
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..common.pagination import KeysetPagination
 from ..players.models import Player
 from ..teams.models import Team
 from .models import PlayerImage, TeamImage, UserImage
 from .serializers import PlayerImageSerializer, TeamImageSerializer, UserImageSerializer
-from .utils import delete_file_from_s3, upload_image_to_s3
+from .utils import (
+    confirm_uploaded_image,
+    create_presigned_upload,
+    discard_image,
+    register_image_object,
+    upload_image_to_s3,
+)
+
+# 갤러리 목록 정렬 ({owner}_image_latest_idx 를 역순으로 읽음)
+GALLERY_ORDERINGS: Dict[str, Tuple[str, ...]] = {"latest": ("-uploaded_at", "-id")}
+GALLERY_PAGINATION_PARAMETERS = [
+    OpenApiParameter("cursor", type=str, description="다음 페이지 커서"),
+    OpenApiParameter("page_size", type=int, description="페이지 크기 (기본 20, 최대 100)"),
+]
 
 """ 유저 프로필 조회 """
 
@@ -57,20 +77,18 @@ class UserImageDetailView(APIView):
         if not file:
             return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 기존 이미지 삭제 (1개 제한)
-        existing_image = UserImage.objects.filter(user=request.user).first()
-
-        if existing_image:
-            delete_file_from_s3(existing_image.image_url)
-            existing_image.delete()
-
         # 새 이미지 업로드
         s3_url = upload_image_to_s3(file, "profile", "users", request.user.id)
 
         if not s3_url:
             return Response({"error": "Upload failed"}, status=status.HTTP_400_BAD_REQUEST)
 
-        image = UserImage.objects.create(user=request.user, image_url=s3_url)
+        # 기존 이미지 삭제 (1개 제한) - S3 객체는 같은 트랜잭션에서 삭제 큐에 추가
+        with transaction.atomic():
+            existing_image = UserImage.objects.filter(user=request.user).first()
+            if existing_image:
+                discard_image(existing_image)
+            image = UserImage.objects.create(user=request.user, image_url=s3_url)
         serializer = UserImageSerializer(image)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -89,8 +107,7 @@ class UserImageDetailView(APIView):
     def delete(self, request: Any, *args: Any, **kwargs: Any) -> Response:
         image = get_object_or_404(UserImage, user=request.user)
 
-        if delete_file_from_s3(image.image_url):
-            image.delete()
+        if discard_image(image):
             return Response({"message": "Image deleted successfully"}, status=status.HTTP_200_OK)
 
         return Response({"error": "Delete failed"}, status=status.HTTP_400_BAD_REQUEST)
@@ -112,7 +129,9 @@ class PlayerProfileImageView(APIView):
         if category not in ["profile", "background"]:
             return Response({"error": "Invalid category"}, status=status.HTTP_400_BAD_REQUEST)
 
-        image = PlayerImage.objects.filter(player_id=player_id, category=category).order_by("-uploaded_at").first()
+        image = (
+            PlayerImage.objects.filter(player_id=player_id, category=category).order_by("-uploaded_at", "-id").first()
+        )
         if not image:
             return Response({"error": "Image not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -156,24 +175,22 @@ class PlayerProfileImageDetailView(APIView):
         if not file:
             return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 기존 이미지 삭제 (1개 제한)
-        if category in ["profile", "background"]:
-            existing_image = PlayerImage.objects.filter(player=player, category=category).first()
-            if existing_image:
-                delete_file_from_s3(existing_image.image_url)
-                existing_image.delete()
-
         # 새 이미지 업로드
         s3_url = upload_image_to_s3(file, category, "players", player.nickname)
         if not s3_url:
             return Response({"error": "Upload failed"}, status=status.HTTP_400_BAD_REQUEST)
 
-        image = PlayerImage.objects.create(
-            player=player,
-            category=category,
-            image_url=s3_url,
-            uploaded_by=None,
-        )
+        # 기존 이미지 삭제 (1개 제한) - S3 객체는 같은 트랜잭션에서 삭제 큐에 추가
+        with transaction.atomic():
+            existing_image = PlayerImage.objects.filter(player=player, category=category).first()
+            if existing_image:
+                discard_image(existing_image)
+            image = PlayerImage.objects.create(
+                player=player,
+                category=category,
+                image_url=s3_url,
+                uploaded_by=None,
+            )
 
         serializer = PlayerImageSerializer(image)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -201,8 +218,7 @@ class PlayerProfileImageDetailView(APIView):
         if image.category in ["profile", "background"] and not request.user.is_staff:
             return Response({"error": "Only staff can delete images"}, status=status.HTTP_403_FORBIDDEN)
 
-        if delete_file_from_s3(image.image_url):
-            image.delete()
+        if discard_image(image):
             return Response(
                 {"message": "{category.capitalize()} image deleted successfully"}, status=status.HTTP_200_OK
             )
@@ -222,11 +238,11 @@ class TeamProfileImageView(APIView):
         responses={200: TeamImageSerializer, 404: {"description": "이미지 없음"}},
     )
     def get(self, request: Any, team_id: int) -> Response:
-        category = request.data.get("category")
+        category = request.query_params.get("category")
         if category not in ["profile", "background"]:
             return Response({"error": "Invalid category"}, status=status.HTTP_400_BAD_REQUEST)
 
-        image = TeamImage.objects.filter(team_id=team_id, category=category).order_by("-uploaded_at").first()
+        image = TeamImage.objects.filter(team_id=team_id, category=category).order_by("-uploaded_at", "-id").first()
         if not image:
             return Response({"error": "Image not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -270,23 +286,22 @@ class TeamProfileImageDetailView(APIView):
         if not file:
             return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 기존 이미지 삭제 (1개 제한)
-        existing_image = TeamImage.objects.filter(team=team, category=category).first()
-        if existing_image:
-            delete_file_from_s3(existing_image.image_url)
-            existing_image.delete()
-
         # 새 이미지 업로드
         s3_url = upload_image_to_s3(file, category, "teams", team.name)
         if not s3_url:
             return Response({"error": "Upload failed"}, status=status.HTTP_400_BAD_REQUEST)
 
-        image = TeamImage.objects.create(
-            team=team,
-            category=category,
-            image_url=s3_url,
-            uploaded_by=None,
-        )
+        # 기존 이미지 삭제 (1개 제한) - S3 객체는 같은 트랜잭션에서 삭제 큐에 추가
+        with transaction.atomic():
+            existing_image = TeamImage.objects.filter(team=team, category=category).first()
+            if existing_image:
+                discard_image(existing_image)
+            image = TeamImage.objects.create(
+                team=team,
+                category=category,
+                image_url=s3_url,
+                uploaded_by=None,
+            )
 
         serializer = TeamImageSerializer(image)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -314,8 +329,7 @@ class TeamProfileImageDetailView(APIView):
         if image.category in ["profile", "background"] and not request.user.is_staff:
             return Response({"error": "Only staff can delete images"}, status=status.HTTP_403_FORBIDDEN)
 
-        if delete_file_from_s3(image.image_url):
-            image.delete()
+        if discard_image(image):
             return Response({"message": "Image deleted successfully"}, status=status.HTTP_200_OK)
 
         return Response({"error": "Delete failed"}, status=status.HTTP_400_BAD_REQUEST)
@@ -335,12 +349,17 @@ class PlayerGalleryImageView(APIView):
     # 선수 갤러리 전체 목록 조회
     @extend_schema(
         summary="특정 선수의 갤러리 이미지 목록 조회",
+        description="최신순으로 커서 기반 페이지네이션합니다.",
+        parameters=GALLERY_PAGINATION_PARAMETERS,
         responses={200: PlayerImageSerializer(many=True)},
     )
     def get(self, request: Any, player_id: int) -> Response:
-        images = PlayerImage.objects.filter(player_id=player_id, category="gallery")
+        paginator = KeysetPagination(orderings=GALLERY_ORDERINGS, default_ordering="latest")
+        images = paginator.paginate_queryset(
+            PlayerImage.objects.filter(player_id=player_id, category="gallery"), request
+        )
         serializer = PlayerImageSerializer(images, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serializer.data)
 
     # 선수 갤러리 이미지 업로드
     @extend_schema(
@@ -435,8 +454,7 @@ class PlayerGalleryDetailView(APIView):
                 {"error": "You do not have permission to delete this image"}, status=status.HTTP_403_FORBIDDEN
             )
 
-        if delete_file_from_s3(image.image_url):
-            image.delete()
+        if discard_image(image):
             return Response({"message": "Image deleted successfully"}, status=status.HTTP_200_OK)
 
         return Response({"error": "Delete failed"}, status=status.HTTP_400_BAD_REQUEST)
@@ -456,12 +474,15 @@ class TeamGalleryImageView(APIView):
     # 팀 갤러리 전체 목록 조회
     @extend_schema(
         summary="특정 팀의 갤러리 이미지 목록 조회",
+        description="최신순으로 커서 기반 페이지네이션합니다.",
+        parameters=GALLERY_PAGINATION_PARAMETERS,
         responses={200: TeamImageSerializer(many=True)},
     )
     def get(self, request: Any, team_id: int) -> Response:
-        images = TeamImage.objects.filter(team_id=team_id, category="gallery")
+        paginator = KeysetPagination(orderings=GALLERY_ORDERINGS, default_ordering="latest")
+        images = paginator.paginate_queryset(TeamImage.objects.filter(team_id=team_id, category="gallery"), request)
         serializer = TeamImageSerializer(images, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serializer.data)
 
     # 팀 갤러리 이미지 업로드
     @extend_schema(
@@ -556,8 +577,213 @@ class TeamGalleryDetailView(APIView):
                 {"error": "You do not have permission to delete this image"}, status=status.HTTP_403_FORBIDDEN
             )
 
-        if delete_file_from_s3(image.image_url):
-            image.delete()
+        if discard_image(image):
             return Response({"message": "Image deleted successfully"}, status=status.HTTP_200_OK)
 
         return Response({"error": "Delete failed"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+""" S3 직접 업로드 (presigned POST 발급 -> 클라이언트가 S3 에 업로드 -> 업로드 확인 후 이미지 저장) """
+
+# 프로필 / 배경 이미지는 관리자만, 갤러리는 로그인한 유저가 업로드
+UPLOAD_CATEGORIES = ["profile", "background", "gallery"]
+
+PRESIGNED_UPLOAD_REQUEST = OpenApiRequest(
+    {
+        "application/json": {
+            "filename": {"type": "string", "example": "photo.png"},
+            "category": {"type": "string", "enum": UPLOAD_CATEGORIES},
+        }
+    }
+)
+CONFIRM_UPLOAD_REQUEST = OpenApiRequest(
+    {
+        "application/json": {
+            "key": {"type": "string", "description": "presigned 업로드 발급 시 받은 key"},
+            "category": {"type": "string", "enum": UPLOAD_CATEGORIES},
+        }
+    }
+)
+PRESIGNED_UPLOAD_EXAMPLE = OpenApiExample(
+    "presigned POST",
+    value={
+        "key": "players_images/Faker/gallery/0b7c....png",
+        "url": "https://bucket.s3.amazonaws.com/",
+        "fields": {"key": "...", "Content-Type": "image/png", "policy": "...", "x-amz-signature": "..."},
+        "expires_in": 600,
+    },
+)
+
+
+def check_upload_permission(user: Any, category: Optional[str]) -> Optional[Response]:
+    # 업로드할 수 없는 요청이면 오류 응답 반환
+    if category not in UPLOAD_CATEGORIES:
+        return Response({"error": "Invalid category"}, status=status.HTTP_400_BAD_REQUEST)
+    if category in ["profile", "background"] and not user.is_staff:
+        return Response({"error": "Only staff can upload images"}, status=status.HTTP_403_FORBIDDEN)
+    if not user.is_active:
+        return Response({"error": "Only User can upload images"}, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
+def presigned_upload_response(
+    filename: Optional[str], category: str, instance_type: str, object_identifier: int | str
+) -> Response:
+    if not filename:
+        return Response({"error": "No filename provided"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        upload = create_presigned_upload(filename, category, instance_type, object_identifier)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(upload, status=status.HTTP_200_OK)
+
+
+def confirm_upload_response(
+    request: Any,
+    image_model: Any,
+    owner: Dict[str, Any],
+    category: str,
+    instance_type: str,
+    object_identifier: int | str,
+    serializer_class: Any,
+) -> Response:
+    """
+    업로드된 S3 객체를 검증한 뒤 이미지 행을 저장
+
+    Args:
+        image_model (Any): UserImage / PlayerImage / TeamImage
+        owner (Dict[str, Any]): 이미지 소유 대상 ({"player": player} 등)
+    """
+    key = request.data.get("key")
+    if not key:
+        return Response({"error": "No key provided"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        image_url, size = confirm_uploaded_image(key, category, instance_type, object_identifier)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    fields: Dict[str, Any] = dict(owner, image_url=image_url)
+    if image_model is not UserImage:
+        fields.update(category=category, uploaded_by=request.user if category == "gallery" else None)
+    with transaction.atomic():
+        # key 를 인덱스에 등록한 요청만 이미지 행을 만듦 (동시 확인 / 삭제 예약된 key 재확인 방지)
+        # 인덱스 도입 이전에 확인된 업로드는 이미지 행으로 확인
+        if image_model.objects.filter(image_url=image_url).exists() or not register_image_object(key, size):
+            return Response({"error": "Upload already confirmed"}, status=status.HTTP_400_BAD_REQUEST)
+        # 기존 이미지 삭제 (유저 프로필 / 선수, 팀 프로필 / 배경은 1개 제한)
+        if category in ["profile", "background"]:
+            existing_filter = owner if image_model is UserImage else dict(owner, category=category)
+            existing_image = image_model.objects.filter(**existing_filter).first()
+            if existing_image:
+                discard_image(existing_image)
+        image = image_model.objects.create(**fields)
+    return Response(serializer_class(image).data, status=status.HTTP_201_CREATED)
+
+
+class UserImageUploadView(APIView):
+    @extend_schema(
+        summary="유저 프로필 이미지 업로드 URL 발급",
+        description="S3 에 직접 업로드할 presigned POST 를 발급합니다. 업로드 후 확인 API 를 호출해야 저장됩니다.",
+        request=OpenApiRequest({"application/json": {"filename": {"type": "string", "example": "photo.png"}}}),
+        responses={200: PRESIGNED_UPLOAD_EXAMPLE, 400: {"description": "허용되지 않은 파일"}},
+    )
+    def post(self, request: Any) -> Response:
+        return presigned_upload_response(request.data.get("filename"), "profile", "users", request.user.id)
+
+
+class UserImageUploadConfirmView(APIView):
+    @extend_schema(
+        summary="유저 프로필 이미지 업로드 확인",
+        description="S3 에 업로드된 파일을 확인하고 프로필 이미지로 저장합니다. 기존 이미지가 있으면 삭제됩니다.",
+        request=OpenApiRequest({"application/json": {"key": {"type": "string"}}}),
+        responses={201: UserImageSerializer, 400: {"description": "업로드된 파일 검증 실패"}},
+    )
+    def post(self, request: Any) -> Response:
+        owner = {"user": request.user}
+        return confirm_upload_response(
+            request, UserImage, owner, "profile", "users", request.user.id, UserImageSerializer
+        )
+
+
+class PlayerImageUploadView(APIView):
+    @extend_schema(
+        summary="선수 이미지 업로드 URL 발급",
+        description="프로필 / 배경은 관리자만, 갤러리는 로그인한 유저가 발급받을 수 있습니다.",
+        request=PRESIGNED_UPLOAD_REQUEST,
+        responses={
+            200: PRESIGNED_UPLOAD_EXAMPLE,
+            400: {"description": "허용되지 않은 파일"},
+            403: {"description": "권한 없음"},
+        },
+    )
+    def post(self, request: Any, player_id: int) -> Response:
+        player = get_object_or_404(Player, id=player_id)
+        category = request.data.get("category")
+        denied = check_upload_permission(request.user, category)
+        if denied:
+            return denied
+        return presigned_upload_response(request.data.get("filename"), category, "players", player.nickname)
+
+
+class PlayerImageUploadConfirmView(APIView):
+    @extend_schema(
+        summary="선수 이미지 업로드 확인",
+        description="S3 에 업로드된 파일을 확인하고 선수 이미지로 저장합니다. 프로필 / 배경은 기존 이미지를 대체합니다.",
+        request=CONFIRM_UPLOAD_REQUEST,
+        responses={
+            201: PlayerImageSerializer,
+            400: {"description": "업로드된 파일 검증 실패"},
+            403: {"description": "권한 없음"},
+        },
+    )
+    def post(self, request: Any, player_id: int) -> Response:
+        player = get_object_or_404(Player, id=player_id)
+        category = request.data.get("category")
+        denied = check_upload_permission(request.user, category)
+        if denied:
+            return denied
+        return confirm_upload_response(
+            request, PlayerImage, {"player": player}, category, "players", player.nickname, PlayerImageSerializer
+        )
+
+
+class TeamImageUploadView(APIView):
+    @extend_schema(
+        summary="팀 이미지 업로드 URL 발급",
+        description="프로필 / 배경은 관리자만, 갤러리는 로그인한 유저가 발급받을 수 있습니다.",
+        request=PRESIGNED_UPLOAD_REQUEST,
+        responses={
+            200: PRESIGNED_UPLOAD_EXAMPLE,
+            400: {"description": "허용되지 않은 파일"},
+            403: {"description": "권한 없음"},
+        },
+    )
+    def post(self, request: Any, team_id: int) -> Response:
+        team = get_object_or_404(Team, id=team_id)
+        category = request.data.get("category")
+        denied = check_upload_permission(request.user, category)
+        if denied:
+            return denied
+        return presigned_upload_response(request.data.get("filename"), category, "teams", team.name)
+
+
+class TeamImageUploadConfirmView(APIView):
+    @extend_schema(
+        summary="팀 이미지 업로드 확인",
+        description="S3 에 업로드된 파일을 확인하고 팀 이미지로 저장합니다. 프로필 / 배경은 기존 이미지를 대체합니다.",
+        request=CONFIRM_UPLOAD_REQUEST,
+        responses={
+            201: TeamImageSerializer,
+            400: {"description": "업로드된 파일 검증 실패"},
+            403: {"description": "권한 없음"},
+        },
+    )
+    def post(self, request: Any, team_id: int) -> Response:
+        team = get_object_or_404(Team, id=team_id)
+        category = request.data.get("category")
+        denied = check_upload_permission(request.user, category)
+        if denied:
+            return denied
+        return confirm_upload_response(
+            request, TeamImage, {"team": team}, category, "teams", team.name, TeamImageSerializer
+        )
@@ -4,3 +4,21 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
+
+    def ready(self) -> None:
+        # 응답 캐시 무효화 / 자동완성 인덱스 / 인기 게시글 점수 갱신 / 이미지 파생본 생성 / 구독자 / 좋아요 수 카운터 시그널 등록
+        from .signals import (
+            connect_autocomplete_signals,
+            connect_cache_signals,
+            connect_hot_score_signals,
+            connect_image_variant_signals,
+            connect_like_counter_signals,
+            connect_subscription_counter_signals,
+        )
+
+        connect_cache_signals()
+        connect_autocomplete_signals()
+        connect_hot_score_signals()
+        connect_image_variant_signals()
+        connect_like_counter_signals()
+        connect_subscription_counter_signals()
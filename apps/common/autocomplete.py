@@ -0,0 +1,178 @@
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+from apps.players.models import Player
+from apps.teams.models import Team
+
+# 한글 음절 분해용 호환 자모 (초성 19 / 중성 21 / 종성 27 + 없음)
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+
+# 키보드로 두 번 눌러 입력하는 겹모음 / 겹받침은 낱자로 분해
+# ex) "닭" 을 치는 도중의 "달ㄱ" 과 "닭" 이 같은 키 "ㄷㅏㄹㄱ" 이 되도록 함
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+# (타입, id)
+DocKey = Tuple[str, int]
+
+
+def normalize(text: str) -> str:
+    """
+    검색 키 정규화: 소문자 변환, 공백 제거, 한글 음절을 키 입력 단위 자모로 분해
+
+    초성과 종성에 같은 호환 자모를 쓰므로 입력 중인 "펭" (ㅍㅔㅇ) 이 "페이커" (ㅍㅔㅇㅣㅋㅓ) 의 접두사가 됩니다.
+    """
+    result: List[str] = []
+    for char in text.casefold():
+        if char.isspace():
+            continue
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            jamo = CHOSEONG[offset // 588] + JUNGSEONG[(offset % 588) // 28] + JONGSEONG[offset % 28]
+            result.extend(COMPOUND_JAMO.get(j, j) for j in jamo)
+        else:
+            result.append(COMPOUND_JAMO.get(char, char))
+    return "".join(result)
+
+
+def search_terms(*values: Optional[str]) -> List[str]:
+    # 전체 이름과 띄어쓰기로 나눈 단어 각각을 검색 키로 사용 (ex. "Hide on bush" -> "bush" 로도 검색)
+    terms = set()
+    for value in values:
+        if not value:
+            continue
+        terms.add(normalize(value))
+        terms.update(normalize(word) for word in value.split())
+    terms.discard("")
+    return sorted(terms)
+
+
+def player_document(player: Player) -> Dict[str, Any]:
+    return {"type": "player", "id": player.id, "name": player.nickname, "realname": player.realname}
+
+
+def team_document(team: Team) -> Dict[str, Any]:
+    return {"type": "team", "id": team.id, "name": team.name}
+
+
+class PrefixIndex:
+    """
+    정렬된 (검색 키, 타입, id) 리스트에 대한 이분 탐색 기반 접두사 인덱스
+
+    DB 를 조회하지 않고 메모리에서만 검색합니다.
+    처음 검색할 때 DB 에서 한 번 만들고, 이후에는 signals 가 선수 / 팀 변경을 반영합니다.
+    다른 프로세스에서 일어난 변경은 settings.AUTOCOMPLETE_REBUILD_INTERVAL 마다 다시 만들어 반영합니다.
+    """
+
+    def __init__(self) -> None:
+        self._entries: List[Tuple[str, str, int]] = []
+        self._documents: Dict[DocKey, Dict[str, Any]] = {}
+        self._terms: Dict[DocKey, List[str]] = {}
+        self._built_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = []
+            self._documents = {}
+            self._terms = {}
+            self._built_at = None
+
+    def build(self) -> None:
+        documents: List[Tuple[Dict[str, Any], List[str]]] = []
+        for player in Player.objects.only("id", "nickname", "realname", "gamename"):
+            documents.append((player_document(player), search_terms(player.nickname, player.realname, player.gamename)))
+        for team in Team.objects.only("id", "name"):
+            documents.append((team_document(team), search_terms(team.name)))
+
+        entries: List[Tuple[str, str, int]] = []
+        with self._lock:
+            self._documents = {}
+            self._terms = {}
+            for document, terms in documents:
+                key = (document["type"], document["id"])
+                self._documents[key] = document
+                self._terms[key] = terms
+                entries.extend((term, document["type"], document["id"]) for term in terms)
+            entries.sort()
+            self._entries = entries
+            self._built_at = time.monotonic()
+
+    def ensure_built(self) -> None:
+        interval = getattr(settings, "AUTOCOMPLETE_REBUILD_INTERVAL", 300)
+        if self._built_at is None or time.monotonic() - self._built_at > interval:
+            self.build()
+
+    def upsert(self, document: Dict[str, Any], terms: Iterable[str]) -> None:
+        with self._lock:
+            if self._built_at is None:
+                # 아직 만들어지지 않았다면 첫 검색 때 DB 에서 전부 읽어오므로 무시
+                return
+            key = (document["type"], document["id"])
+            self._remove_entries(key)
+            self._documents[key] = document
+            self._terms[key] = list(terms)
+            for term in self._terms[key]:
+                insort(self._entries, (term, key[0], key[1]))
+
+    def remove(self, doc_type: str, doc_id: int) -> None:
+        with self._lock:
+            key = (doc_type, doc_id)
+            self._remove_entries(key)
+            self._documents.pop(key, None)
+
+    def _remove_entries(self, key: DocKey) -> None:
+        for term in self._terms.pop(key, []):
+            index = bisect_left(self._entries, (term, key[0], key[1]))
+            if index < len(self._entries) and self._entries[index] == (term, key[0], key[1]):
+                del self._entries[index]
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        self.ensure_built()
+
+        results: List[Dict[str, Any]] = []
+        seen = set()
+        with self._lock:
+            index = bisect_left(self._entries, (prefix,))
+            while index < len(self._entries) and len(results) < limit:
+                term, doc_type, doc_id = self._entries[index]
+                if not term.startswith(prefix):
+                    break
+                if (doc_type, doc_id) not in seen:
+                    seen.add((doc_type, doc_id))
+                    results.append(self._documents[(doc_type, doc_id)])
+                index += 1
+        return results
+
+
+autocomplete_index = PrefixIndex()
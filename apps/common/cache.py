@@ -0,0 +1,216 @@
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+ViewMethod = TypeVar("ViewMethod", bound=Callable[..., Any])
+
+CACHE_KEY_PREFIX = "response-cache"
+
+
+class LocalLRUCache:
+    """
+    프로세스 내부 LRU 캐시
+
+    공유 캐시(Redis 등)까지 가지 않고 같은 워커 안에서 바로 응답을 돌려주기 위한 1차 캐시입니다.
+    키에 엔티티 버전이 들어가므로 무효화는 키가 바뀌는 것으로 처리되고, 여기서는 크기와 TTL 만 관리합니다.
+    """
+
+    def __init__(self, max_size: int = 512, timeout: int = 60) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheStats:
+    """캐시 적중/실패 횟수 (프로세스 단위)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.local_hits + self.shared_hits + self.misses
+        hits = self.local_hits + self.shared_hits
+        return {
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "local_size": len(local_cache),
+        }
+
+
+local_cache = LocalLRUCache(
+    max_size=getattr(settings, "RESPONSE_CACHE_LOCAL_MAX_SIZE", 512),
+    timeout=getattr(settings, "RESPONSE_CACHE_TIMEOUT", 60),
+)
+stats = CacheStats()
+
+
+def get_shared_cache() -> BaseCache:
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def version_key(entity: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:version:{entity}"
+
+
+def get_versions(entities: Sequence[str]) -> Dict[str, int]:
+    """
+    엔티티 별 현재 캐시 버전을 공유 캐시에서 한 번에 조회
+
+    버전 키가 없으면 (최초 조회, 공유 캐시 eviction) 현재 시각으로 초기화하여
+    이전에 쓰던 버전 번호와 겹치지 않도록 합니다.
+    """
+    shared = get_shared_cache()
+    keys = {entity: version_key(entity) for entity in entities}
+    found = shared.get_many(list(keys.values()))
+    versions: Dict[str, int] = {}
+    for entity, key in keys.items():
+        if key not in found:
+            shared.add(key, time.time_ns(), timeout=None)
+            found[key] = shared.get(key, time.time_ns())
+        versions[entity] = int(found[key])
+    return versions
+
+
+def bump_versions(entities: Iterable[str]) -> None:
+    """엔티티 버전을 올려 해당 엔티티를 참조하는 캐시 키를 모두 무효화"""
+    shared = get_shared_cache()
+    for entity in entities:
+        key = version_key(entity)
+        try:
+            shared.incr(key)
+        except ValueError:
+            shared.add(key, time.time_ns(), timeout=None)
+
+
+def invalidate(entities: Sequence[str]) -> None:
+    """
+    쓰기 시점과 커밋 이후 두 번 버전을 올림
+
+    트랜잭션이 커밋되기 전에 다른 요청이 이전 데이터를 새 버전 키로 캐시하는 경우를 막기 위해
+    커밋 후에 한 번 더 올립니다. (트랜잭션 밖이라면 on_commit 은 즉시 실행됨)
+    """
+    bump_versions(entities)
+    transaction.on_commit(functools.partial(bump_versions, entities))
+
+
+def build_cache_key(view_name: str, request: Request, kwargs: Dict[str, Any], versions: Dict[str, int]) -> str:
+    # 쿼리 파라미터 순서가 달라도 같은 키가 되도록 정렬
+    query = sorted((key, value) for key in request.query_params for value in request.query_params.getlist(key))
+    raw = repr((request.path, sorted(kwargs.items()), query))
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    version = ".".join(f"{entity}{versions[entity]}" for entity in sorted(versions))
+    return f"{CACHE_KEY_PREFIX}:{view_name}:{version}:{digest}"
+
+
+def cached_response(*entities: str, timeout: Optional[int] = None) -> Callable[[ViewMethod], ViewMethod]:
+    """
+    공개 GET 응답을 로컬 LRU -> 공유 캐시 순으로 캐싱하는 데코레이터
+
+    Args:
+        entities (str): 응답이 의존하는 엔티티 이름 (ex. "player", "team")
+            signals 에서 해당 엔티티의 버전을 올리면 관련 캐시가 모두 무효화됩니다.
+        timeout (Optional[int]): 공유 캐시 TTL (초), 기본값은 settings.RESPONSE_CACHE_TIMEOUT
+
+    200 응답의 data 만 저장하며, 스트리밍 응답 등 Response 가 아닌 응답은 캐싱하지 않습니다.
+    """
+
+    def decorator(method: ViewMethod) -> ViewMethod:
+        @functools.wraps(method)
+        def wrapper(view: Any, request: Request, *args: Any, **kwargs: Any) -> Any:
+            if not getattr(settings, "RESPONSE_CACHE_ENABLED", False):
+                return method(view, request, *args, **kwargs)
+
+            versions = get_versions(entities)
+            key = build_cache_key(type(view).__name__, request, kwargs, versions)
+
+            data = local_cache.get(key)
+            if data is not None:
+                stats.incr("local_hits")
+                return Response(data, status=status.HTTP_200_OK)
+
+            shared = get_shared_cache()
+            data = shared.get(key)
+            if data is not None:
+                stats.incr("shared_hits")
+                local_cache.set(key, data)
+                return Response(data, status=status.HTTP_200_OK)
+
+            stats.incr("misses")
+            response = method(view, request, *args, **kwargs)
+            if isinstance(response, Response) and response.status_code == status.HTTP_200_OK:
+                # ReturnList / ReturnDict 는 serializer 참조를 들고 있으므로 기본 타입으로 변환하여 저장
+                data = to_primitive(response.data)
+                shared.set(key, data, timeout if timeout is not None else settings.RESPONSE_CACHE_TIMEOUT)
+                local_cache.set(key, data)
+            return response
+
+        return cast(ViewMethod, wrapper)
+
+    return decorator
+
+
+def to_primitive(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {key: to_primitive(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [to_primitive(value) for value in data]
+    return data
@@ -0,0 +1,36 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.cloud_images.outbox import (
+    DEFAULT_MAX_ATTEMPTS,
+    MAX_KEYS_PER_REQUEST,
+    drain_s3_deletions,
+    stuck_deletions,
+)
+
+
+class Command(BaseCommand):
+    help = """S3 삭제 큐 (s3_deletion_outbox) 에 쌓인 객체를 delete_objects 로 일괄 삭제합니다.
+    		명령어: python manage.py drain_s3_deletions [--batch-size 1000] [--max-attempts 8]
+			매분 진행: * * * * * /path/to/venv/bin/python /path/to/project/manage.py drain_s3_deletions
+			"""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MAX_KEYS_PER_REQUEST,
+            help="delete_objects 한 번에 지울 key 수 (최대 1000)",
+        )
+        parser.add_argument(
+            "--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS, help="이 횟수만큼 실패한 key 는 더 시도하지 않음"
+        )
+        parser.add_argument("--max-batches", type=int, default=None, help="최대 delete_objects 호출 수")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        deleted, failed = drain_s3_deletions(options["batch_size"], options["max_attempts"], options["max_batches"])
+        self.stdout.write(self.style.SUCCESS(f"S3 객체 {deleted}개 삭제 완료 (실패 {failed}개)"))
+        stuck = stuck_deletions(options["max_attempts"])
+        if stuck:
+            self.stdout.write(self.style.WARNING(f"재시도 횟수를 초과한 삭제 요청 {stuck}개 (last_error 확인 필요)"))
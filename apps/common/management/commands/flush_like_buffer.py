@@ -0,0 +1,27 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.communities import like_buffer
+
+
+class Command(BaseCommand):
+    help = """좋아요 write-behind 버퍼(settings.LIKE_WRITE_BEHIND)에 쌓인 좋아요 / 취소를 DB 에 일괄 반영합니다.
+    		명령어: python manage.py flush_like_buffer
+			워커로 계속 실행: python manage.py flush_like_buffer --loop --interval 5
+			"""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 읽을 버퍼 기록 수")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 interval 마다 반영")
+        parser.add_argument("--interval", type=float, default=5.0, help="--loop 반영 주기 (초)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            flushed = like_buffer.flush(batch_size=options["batch_size"])
+            if flushed or not options["loop"]:
+                self.stdout.write(self.style.SUCCESS(f"좋아요 {flushed}건 반영 완료"))
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
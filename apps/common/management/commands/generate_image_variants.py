@@ -0,0 +1,41 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.cloud_images.models import PlayerImage, TeamImage, UserImage
+from apps.cloud_images.variants import generate_variants
+
+
+class Command(BaseCommand):
+    help = """파생 이미지 (variants) 가 없는 이미지의 리사이즈 WebP / AVIF 이미지를 생성합니다.
+    		명령어: python manage.py generate_image_variants [--batch-size 100] [--limit N]
+			업로드 직후 생성에 실패했거나 기능 도입 이전에 올라온 이미지를 채울 때 사용
+			"""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=100, help="한 번에 조회할 이미지 수")
+        parser.add_argument("--limit", type=int, default=0, help="모델 별 최대 처리 수 (0 이면 전체)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for label, model in (("유저", UserImage), ("선수", PlayerImage), ("팀", TeamImage)):
+            self.generate(label, model, options["batch_size"], options["limit"])
+
+    def generate(self, label: str, model: Any, batch_size: int, limit: int) -> None:
+        done = failed = last_pk = 0
+        while not limit or done + failed < limit:
+            size = min(batch_size, limit - done - failed) if limit else batch_size
+            ids = list(
+                model.objects.filter(variants={}, pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:size]
+            )
+            if not ids:
+                break
+            for pk in ids:
+                try:
+                    generate_variants(model, pk)
+                    done += 1
+                except Exception as e:
+                    # 원본이 없거나 이미지가 아닌 경우 등 - 건너뛰고 계속 진행
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f"{label} 이미지 {pk}: {e}"))
+            last_pk = ids[-1]
+        self.stdout.write(self.style.SUCCESS(f"{label} 이미지 {done}개 생성 완료 (실패 {failed}개)"))
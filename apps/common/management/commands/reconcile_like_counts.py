@@ -0,0 +1,45 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import F
+
+from apps.communities.utils import (
+    LIKEABLE_MODELS,
+    POST_COMMENT_MODELS,
+    active_likes_count,
+    hot_score_expression,
+)
+
+
+class Command(BaseCommand):
+    help = """게시글 / 댓글의 likes_count 카운터를 활성 좋아요 수와 비교하여 어긋난 값을 보정합니다. (게시글은 인기 점수도 다시 계산)
+    		명령어: python manage.py reconcile_like_counts [--dry-run]
+			매시간 진행: 30 * * * * /path/to/venv/bin/python /path/to/project/manage.py reconcile_like_counts
+			"""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--dry-run", action="store_true", help="보정하지 않고 어긋난 대상만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for model_type, model in LIKEABLE_MODELS.items():
+            self.reconcile(model_type, model, options["dry_run"])
+
+    def reconcile(self, label: str, model: Any, dry_run: bool) -> None:
+        actual = active_likes_count(model)
+        drifted = list(
+            model.global_objects.annotate(actual=actual)
+            .exclude(likes_count=F("actual"))
+            .values_list("id", "likes_count", "actual")
+        )
+        for pk, counter, count in drifted:
+            self.stdout.write(f"{label} {pk}: likes_count {counter} -> {count}")
+
+        if drifted and not dry_run:
+            ids = [pk for pk, _, _ in drifted]
+            # 조회 이후 들어온 좋아요도 반영되도록 UPDATE 시점에 다시 계산 (동시 좋아요의 F() 증감과 충돌하지 않음)
+            with transaction.atomic():
+                model.global_objects.filter(id__in=ids).update(likes_count=actual)
+                if model in POST_COMMENT_MODELS:
+                    model.global_objects.filter(id__in=ids).update(hot_score=hot_score_expression())
+        self.stdout.write(self.style.SUCCESS(f"{label} 좋아요 수 {len(drifted)}개 보정 완료"))
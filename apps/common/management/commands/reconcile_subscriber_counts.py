@@ -0,0 +1,40 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import F
+
+from apps.players.models import Player
+from apps.subscriptions.models import PlayerSubscription, TeamSubscription
+from apps.subscriptions.utils import active_subscriber_count
+from apps.teams.models import Team
+
+
+class Command(BaseCommand):
+    help = """선수 / 팀의 subscriber_count 카운터를 활성 구독 수와 비교하여 어긋난 값을 보정합니다.
+    		명령어: python manage.py reconcile_subscriber_counts [--dry-run]
+			매시간 진행: 0 * * * * /path/to/venv/bin/python /path/to/project/manage.py reconcile_subscriber_counts
+			"""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--dry-run", action="store_true", help="보정하지 않고 어긋난 대상만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.reconcile("선수", Player, PlayerSubscription, "player", options["dry_run"])
+        self.reconcile("팀", Team, TeamSubscription, "team", options["dry_run"])
+
+    def reconcile(self, label: str, model: Any, subscription_model: Any, owner_field: str, dry_run: bool) -> None:
+        actual = active_subscriber_count(subscription_model, owner_field)
+        drifted = list(
+            model.global_objects.annotate(actual=actual)
+            .exclude(subscriber_count=F("actual"))
+            .values_list("id", "subscriber_count", "actual")
+        )
+        for pk, counter, count in drifted:
+            self.stdout.write(f"{label} {pk}: subscriber_count {counter} -> {count}")
+
+        if drifted and not dry_run:
+            # 조회 이후 들어온 구독도 반영되도록 UPDATE 시점에 다시 계산 (동시 구독의 F() 증감과 충돌하지 않음)
+            with transaction.atomic():
+                model.global_objects.filter(id__in=[pk for pk, _, _ in drifted]).update(subscriber_count=actual)
+        self.stdout.write(self.style.SUCCESS(f"{label} 구독 수 {len(drifted)}개 보정 완료"))
@@ -0,0 +1,27 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    태그 검색용 인덱스
+
+    - taggit_tag.name 에 trigram GIN 인덱스: 2글자 이상 검색의 % (similarity) / ILIKE 조건을 인덱스로 처리
+    - UPPER(name) 에 btree 인덱스: 1글자 검색(istartswith -> UPPER(name) LIKE 'X%')을 인덱스 범위 스캔으로 처리
+    """
+
+    dependencies = [
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS taggit_tag_name_trgm_idx ON taggit_tag USING gin (name gin_trgm_ops);",
+            reverse_sql="DROP INDEX IF EXISTS taggit_tag_name_trgm_idx;",
+        ),
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS taggit_tag_name_upper_idx ON taggit_tag (UPPER(name) text_pattern_ops);",
+            reverse_sql="DROP INDEX IF EXISTS taggit_tag_name_upper_idx;",
+        ),
+    ]
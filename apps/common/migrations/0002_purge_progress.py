@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("common", "0001_tag_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PurgeProgress",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("target", models.CharField(max_length=100, unique=True)),
+                ("cutoff", models.DateTimeField()),
+                ("last_pk", models.BigIntegerField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "purge_progress",
+            },
+        ),
+    ]
@@ -0,0 +1,101 @@
+import hashlib
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.db import connection
+from django.db.models import DateTimeField, F, QuerySet
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+# (queryset, 변경 시각 필드)
+# 변경 시각이 없는 모델 (taggit 의 TaggedItem 등) 은 "id" 를 사용 - 추가 / 삭제가 (max(id), 행 수) 에 반영됨
+ValidatorSource = Tuple[QuerySet[Any], str]
+
+
+class NotModified(Exception):
+    """조건부 GET 의 검증값이 일치하여 본문 없이 304 로 응답해야 하는 경우"""
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified 기반 조건부 GET 지원 APIView 믹스인
+
+    get_validator_sources() 가 돌려주는 queryset 들의 (max(변경 시각), 행 수)를
+    쿼리 1번으로 집계하여 검증값을 만들고, 클라이언트가 보낸 If-None-Match / If-Modified-Since 와 같으면
+    시리얼라이저를 거치지 않고 304 Not Modified 로 응답합니다.
+    행 수를 함께 쓰기 때문에 updated_at 이 바뀌지 않는 삭제도 검증값에 반영됩니다.
+    """
+
+    validator: Optional[Tuple[str, Optional[datetime]]] = None
+
+    def get_validator_sources(self, *args: Any, **kwargs: Any) -> Sequence[ValidatorSource]:
+        raise NotImplementedError("get_validator_sources() 를 구현해야 합니다.")
+
+    def compute_validator(self, request: Request, sources: Sequence[ValidatorSource]) -> Tuple[str, Optional[datetime]]:
+        # 각 source 의 집계를 UNION ALL 로 묶어 DB 왕복 1번으로 계산 (변경 시각 / id source 는 서로 다른 컬럼에 집계)
+        parts: List[str] = []
+        params: List[Any] = []
+        for index, (queryset, field) in enumerate(sources):
+            sql, source_params = (
+                queryset.order_by().annotate(validator_ts=F(field)).values("validator_ts").query.sql_with_params()
+            )
+            if isinstance(queryset.model._meta.get_field(field), DateTimeField):
+                aggregates = "MAX(v.validator_ts), NULL::bigint"
+            else:
+                aggregates = "NULL::timestamptz, MAX(v.validator_ts)::bigint"
+            parts.append(f"SELECT {index} AS idx, {aggregates}, COUNT(*) FROM ({sql}) v")
+            params.extend(source_params)
+
+        with connection.cursor() as cursor:
+            cursor.execute(" UNION ALL ".join(parts) + " ORDER BY idx", params)
+            rows = cursor.fetchall()
+
+        timestamps = [row[1] for row in rows if row[1] is not None]
+        last_modified = max(timestamps) if timestamps else None
+        # 같은 데이터라도 쿼리 파라미터에 따라 응답이 달라지므로 경로까지 포함
+        values = [(row[1].isoformat() if row[1] else None, row[2], row[3]) for row in rows]
+        raw = repr((request.get_full_path(), values))
+        etag = f'"{hashlib.sha1(raw.encode()).hexdigest()}"'
+        return etag, last_modified
+
+    def is_not_modified(self, request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            # If-None-Match 가 있으면 If-Modified-Since 는 무시 (RFC 9110)
+            etags = parse_etags(if_none_match)
+            return "*" in etags or etag in etags or f"W/{etag}" in etags
+
+        if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        if if_modified_since is None or last_modified is None:
+            return False
+        return int(last_modified.timestamp()) <= if_modified_since
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)  # type: ignore[misc]
+        self.validator = None
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        etag, last_modified = self.compute_validator(request, self.get_validator_sources(*args, **kwargs))
+        self.validator = (etag, last_modified)
+        if self.is_not_modified(request, etag, last_modified):
+            raise NotModified()
+
+    def handle_exception(self, exc: Exception) -> Response:
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)  # type: ignore[misc,no-any-return]
+
+    def finalize_response(self, request: Request, response: Any, *args: Any, **kwargs: Any) -> Any:
+        response = super().finalize_response(request, response, *args, **kwargs)  # type: ignore[misc]
+        if self.validator is not None and response.status_code in (
+            status.HTTP_200_OK,
+            status.HTTP_304_NOT_MODIFIED,
+        ):
+            etag, last_modified = self.validator
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
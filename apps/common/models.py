@@ -10,3 +10,20 @@ class BaseModel(models.Model):
 
     class Meta:  # Meta는 Model의 동작 방식을 사용자 정의하는데 사용
         abstract = True  # 추상화 True, 추상화된 클래스는 migrate 시 DB에 Table로 생성되지 않습니다.
+
+
+class PurgeProgress(models.Model):
+    # 영구 삭제 명령어 (hard_delete_old_*) 의 대상 별 진행 상황
+    # 캐시는 프로세스 로컬일 수 있으므로 DB 에 저장해 중간에 멈춘 실행을 다음 실행이 이어서 진행
+    target = models.CharField(max_length=100, unique=True)
+    # 처음 실행한 시점의 보관 기간 기준 시각 (이어서 진행할 때도 같은 기준을 사용)
+    cutoff = models.DateTimeField()
+    # 마지막으로 삭제를 마친 batch 의 마지막 pk
+    last_pk = models.BigIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.target} ({self.last_pk})"
+
+    class Meta:
+        db_table = "purge_progress"
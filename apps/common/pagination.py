@@ -0,0 +1,134 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder 는 datetime 을 밀리초까지만 남기므로 커서 값이 DB 값과 달라지지 않도록 마이크로초까지 유지
+    def default(self, o: Any) -> Any:
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination:
+    """
+    정렬 키 값을 커서로 사용하는 keyset(cursor) 페이지네이션
+
+    OFFSET 을 쓰지 않고 "마지막으로 본 행의 정렬 키보다 뒤" 조건으로 다음 페이지를 조회하므로
+    몇 번째 페이지든 인덱스를 타고 page_size 만큼만 읽습니다.
+
+    orderings 의 각 정렬 조합은 마지막 필드가 유니크해야 하며 (ex. id), NULL 을 허용하지 않는 필드만 사용해야 합니다.
+    """
+
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering_query_param = "ordering"
+    # {쿼리 파라미터 값: (정렬 필드, ...)}
+    orderings: Dict[str, Tuple[str, ...]] = {"id": ("id",)}
+    default_ordering = "id"
+
+    def __init__(
+        self,
+        orderings: Optional[Dict[str, Tuple[str, ...]]] = None,
+        default_ordering: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> None:
+        if orderings is not None:
+            self.orderings = orderings
+        if default_ordering is not None:
+            self.default_ordering = default_ordering
+        if page_size is not None:
+            self.page_size = page_size
+        self.request: Optional[Request] = None
+        self.next_cursor: Optional[str] = None
+
+    def get_ordering(self, request: Request) -> Tuple[str, ...]:
+        ordering = request.query_params.get(self.ordering_query_param, self.default_ordering)
+        if ordering not in self.orderings:
+            raise ValidationError(
+                {self.ordering_query_param: f"지원하지 않는 정렬입니다. ({', '.join(self.orderings)})"}
+            )
+        return self.orderings[ordering]
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def encode_cursor(self, values: Sequence[Any]) -> str:
+        raw = json.dumps(list(values), cls=CursorJSONEncoder).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def decode_cursor(self, request: Request, ordering: Tuple[str, ...]) -> Optional[List[Any]]:
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(token.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(detail="잘못된 커서입니다.")
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(detail="잘못된 커서입니다.")
+        return values
+
+    @staticmethod
+    def build_keyset_filter(ordering: Tuple[str, ...], values: Sequence[Any]) -> Q:
+        """
+        (a, b) > (x, y) 형태의 조건을 정렬 방향에 맞춰 Q 로 변환
+        ex) ("-created_at", "-id") -> created_at < x OR (created_at = x AND id < y)
+        """
+        condition = Q()
+        equal_prefix = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal_prefix & Q(**{f"{name}__{lookup}": value})
+            equal_prefix &= Q(**{name: value})
+        return condition
+
+    def paginate_queryset(self, queryset: QuerySet[Any], request: Request, view: Any = None) -> List[Any]:
+        self.request = request
+        ordering = self.get_ordering(request)
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*ordering)
+        cursor = self.decode_cursor(request, ordering)
+        # 디코딩은 되지만 값의 타입이 정렬 필드와 맞지 않는 커서 (ex. ["abc"], [{}]) 는
+        # 필터 생성이나 쿼리 실행 시점에 변환 오류가 나므로 잘못된 커서로 처리
+        try:
+            if cursor is not None:
+                queryset = queryset.filter(self.build_keyset_filter(ordering, cursor))
+            # 다음 페이지 존재 여부를 알기 위해 1개 더 조회
+            rows = list(queryset[: page_size + 1])
+        except (ValueError, TypeError, DjangoValidationError):
+            raise NotFound(detail="잘못된 커서입니다.")
+        page = rows[:page_size]
+
+        self.next_cursor = None
+        if len(rows) > page_size:
+            last: Model = page[-1]
+            self.next_cursor = self.encode_cursor([getattr(last, field.lstrip("-")) for field in ordering])
+        return page
+
+    def get_next_link(self) -> Optional[str]:
+        if self.request is None or self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
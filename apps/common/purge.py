@@ -0,0 +1,170 @@
+"""
+soft delete 된 데이터 영구 삭제 (hard_delete_old_* 명령어)
+
+대상 행을 pk 순서로 batch_size 개씩 잘라 batch 마다 짧은 트랜잭션으로 삭제하고, batch 사이에 쉬어서
+운영 트래픽과 잠금 경합이 길어지지 않도록 합니다.
+
+ORM 의 delete() 는 CASCADE 대상을 행 단위로 모으고 시그널을 보내므로 (유저 -> 게시글 -> 댓글 -> 답글 ...)
+대량 삭제에서 느립니다. 여기서는 모델의 관계 메타 정보로 자식 테이블부터 `DELETE ... WHERE fk IN (...)` 를 실행합니다.
+"""
+
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import models, transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from apps.cloud_images.models import PlayerImage, TeamImage, UserImage
+from apps.cloud_images.utils import release_images
+
+from .models import PurgeProgress
+
+# 행과 함께 S3 객체도 지워야 하는 모델 (시그널 없이 삭제되므로 S3 삭제 큐에 직접 추가)
+IMAGE_MODELS = (UserImage, PlayerImage, TeamImage)
+
+
+class PurgeTarget:
+    """
+    영구 삭제 대상
+
+    Args:
+        label (str): 출력용 이름
+        model (Type[Model]): SoftDeleteModel 하위 모델
+        days (int): soft delete 후 보관 기간 (일)
+        unit (str): 출력용 단위
+    """
+
+    def __init__(self, label: str, model: Type[Model], days: int, unit: str = "개") -> None:
+        self.label = label
+        self.model = model
+        self.days = days
+        self.unit = unit
+
+    @property
+    def progress_key(self) -> str:
+        # PurgeProgress.target
+        return self.model._meta.label_lower
+
+    def queryset(self, cutoff: datetime) -> Any:
+        return self.model._base_manager.filter(deleted_at__isnull=False, deleted_at__lte=cutoff)
+
+
+def cascade_delete(model: Type[Model], ids: Sequence[Any], counts: Dict[str, int]) -> None:
+    """
+    ids 행을 참조하는 행을 자식 테이블부터 지운 뒤 ids 행을 삭제하고, 테이블 별 삭제 수를 counts 에 더함
+
+    on_delete 가 CASCADE 인 관계는 재귀적으로 삭제하고 (자기 참조 답글 포함), SET_NULL 인 관계는 NULL 로 바꿉니다.
+    이미지 행은 참조하던 S3 원본 / 파생 이미지를 같은 트랜잭션에서 S3 삭제 큐에 추가합니다.
+    DB FK 는 ON DELETE 동작이 없으므로 부모보다 자식을 먼저 지워야 합니다.
+    """
+    if not ids:
+        return
+    for relation in model._meta.get_fields(include_hidden=True):
+        # ORM Collector 와 같은 기준 (역참조 FK / OneToOne, M2M 중간 테이블 포함)
+        if not (relation.auto_created and not relation.concrete and (relation.one_to_many or relation.one_to_one)):
+            continue
+        related_model: Any = relation.related_model
+        field_name = relation.field.name  # type: ignore[union-attr]
+        on_delete = relation.on_delete  # type: ignore[union-attr]
+        children = related_model._base_manager.filter(**{f"{field_name}__in": ids})
+        if on_delete is models.CASCADE:
+            cascade_delete(related_model, list(children.values_list("pk", flat=True)), counts)
+        elif on_delete is models.SET_NULL:
+            children.update(**{field_name: None})
+        elif on_delete is not models.DO_NOTHING:
+            raise ValueError(
+                f"{related_model._meta.label}.{field_name} 의 on_delete 는 영구 삭제에서 지원하지 않습니다."
+            )
+    queryset = model._base_manager.filter(pk__in=ids)
+    if model in IMAGE_MODELS:
+        release_images(queryset.values_list("image_url", "variants"))
+    counts[model._meta.label] += queryset._raw_delete(queryset.db)
+
+
+def purge(
+    target: PurgeTarget,
+    batch_size: int = 1000,
+    sleep: float = 0.0,
+    dry_run: bool = False,
+    restart: bool = False,
+    log: Callable[[str], None] = print,
+) -> Dict[str, int]:
+    """
+    target 의 보관 기간이 지난 행을 pk 범위 batch 로 영구 삭제하고 테이블 별 삭제 수를 반환
+
+    batch 마다 마지막 pk 와 기준 시각을 삭제와 같은 트랜잭션에서 DB (PurgeProgress) 에 저장하므로,
+    중간에 멈춘 경우 다음 실행에서 (다른 서버에서 실행해도) 같은 기준 시각으로 이어서 진행합니다.
+    (restart=True 면 저장된 진행 상황을 버리고 처음부터, dry_run=True 면 삭제하지 않고 대상 수만 반환)
+    """
+    progress: Optional[PurgeProgress] = (
+        None if restart else PurgeProgress.objects.filter(target=target.progress_key).first()
+    )
+    if progress:
+        cutoff, last_pk = progress.cutoff, progress.last_pk
+        log(f"{target.label}: pk {last_pk} 이후부터 이어서 진행 (기준 시각 {cutoff:%Y-%m-%d %H:%M:%S})")
+    else:
+        cutoff, last_pk = timezone.now() - timedelta(days=target.days), 0
+
+    if dry_run:
+        return {target.model._meta.label: target.queryset(cutoff).filter(pk__gt=last_pk).count()}
+
+    counts: Dict[str, int] = defaultdict(int)
+    batch = 0
+    while True:
+        ids: List[Any] = list(
+            target.queryset(cutoff).filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        batch += 1
+        started = time.monotonic()
+        batch_counts: Dict[str, int] = defaultdict(int)
+        last_pk = ids[-1]
+        with transaction.atomic():
+            cascade_delete(target.model, ids, batch_counts)
+            PurgeProgress.objects.update_or_create(
+                target=target.progress_key, defaults={"cutoff": cutoff, "last_pk": last_pk}
+            )
+        for label, count in batch_counts.items():
+            counts[label] += count
+        detail = ", ".join(f"{label} {count}" for label, count in sorted(batch_counts.items()))
+        log(f"{target.label} batch {batch}: pk {ids[0]}~{last_pk} ({detail}) {time.monotonic() - started:.2f}s")
+        if len(ids) < batch_size:
+            break
+        if sleep:
+            time.sleep(sleep)
+    PurgeProgress.objects.filter(target=target.progress_key).delete()
+    return dict(counts)
+
+
+class PurgeCommand(BaseCommand):
+    """targets 를 순서대로 영구 삭제하는 명령어 (자식 대상을 먼저 두면 부모 삭제 시 CASCADE 로 지울 행이 줄어듦)"""
+
+    targets: Sequence[PurgeTarget] = ()
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="batch 당 삭제할 대상 행 수")
+        parser.add_argument("--sleep", type=float, default=0.1, help="batch 사이 대기 시간 (초)")
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 수만 출력")
+        parser.add_argument("--restart", action="store_true", help="저장된 진행 상황을 무시하고 처음부터 진행")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for target in self.targets:
+            counts = purge(
+                target,
+                batch_size=options["batch_size"],
+                sleep=options["sleep"],
+                dry_run=options["dry_run"],
+                restart=options["restart"],
+                log=self.stdout.write,
+            )
+            count = counts.pop(target.model._meta.label, 0)
+            if options["dry_run"]:
+                self.stdout.write(f"{target.label} {count}{target.unit} 삭제 예정")
+                continue
+            cascaded = "".join(f", {label} {total}개" for label, total in sorted(counts.items()))
+            self.stdout.write(self.style.SUCCESS(f"{target.label} {count}{target.unit} 삭제 완료{cascaded}"))
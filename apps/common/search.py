@@ -0,0 +1,127 @@
+import html
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+)
+from django.db.models import F, FloatField, Model, QuerySet
+from django.db.models.functions import Cast
+
+from apps.communities.models import PlayerPost, TeamPost
+from apps.players.models import Player, PlayerSchedule
+from apps.teams.models import Team, TeamSchedule
+
+# 검색 결과 정렬 (keyset 페이지네이션 커서) - 랭킹이 같으면 id 순
+SEARCH_ORDERINGS: Dict[str, Tuple[str, ...]] = {"rank": ("-rank", "id")}
+# 모델의 search_vector 생성 컬럼과 같은 텍스트 검색 설정
+SEARCH_CONFIG = "simple"
+# ts_headline 의 하이라이트 구분자 (사용자 본문에 나오지 않는 사설 영역 문자)
+# 본문을 HTML 이스케이프한 뒤 <b> / </b> 로 바꾸므로, 응답의 태그는 하이라이트뿐임
+HEADLINE_START = "\ue000"
+HEADLINE_STOP = "\ue001"
+
+
+def render_headline(headline: Optional[str]) -> Optional[str]:
+    # 사용자 본문(게시글, 일정)의 태그가 그대로 렌더링되지 않도록 이스케이프하고 하이라이트만 <b> 로 표시
+    if headline is None:
+        return None
+    escaped = html.escape(headline)
+    return escaped.replace(HEADLINE_START, "<b>").replace(HEADLINE_STOP, "</b>")
+
+
+class SearchTarget:
+    """
+    통합 검색 대상 엔티티
+
+    Args:
+        queryset (Callable[[], QuerySet]): 검색할 기본 queryset (soft delete 제외 등)
+        fields (Tuple[str, ...]): 결과에 포함할 필드
+        headline_field (Optional[str]): 검색어 주변 본문 발췌(하이라이트)를 만들 필드
+    """
+
+    def __init__(
+        self,
+        queryset: Callable[[], QuerySet[Any]],
+        fields: Tuple[str, ...],
+        headline_field: Optional[str] = None,
+    ) -> None:
+        self.queryset = queryset
+        self.fields = fields
+        self.headline_field = headline_field
+
+    def search(self, query: SearchQuery) -> QuerySet[Any]:
+        # search_vector @@ query -> GIN 인덱스, 가중치(A > B)가 반영된 ts_rank 로 정렬
+        queryset: QuerySet[Any] = (
+            self.queryset()
+            .filter(search_vector=query)
+            .only(*self.fields)
+            # ts_rank 는 real 을 반환하는데, real 값은 JSON 커서로 오가면서 정밀도가 달라져 keyset 비교가 어긋나므로
+            # double precision 으로 변환하여 커서 값과 DB 값이 정확히 일치하도록 함
+            .annotate(rank=Cast(SearchRank(F("search_vector"), query), FloatField()))
+        )
+        if self.headline_field:
+            queryset = queryset.annotate(
+                headline=SearchHeadline(
+                    self.headline_field,
+                    query,
+                    config=SEARCH_CONFIG,
+                    start_sel=HEADLINE_START,
+                    stop_sel=HEADLINE_STOP,
+                    max_words=30,
+                    min_words=10,
+                )
+            )
+        return queryset
+
+    def to_representation(self, obj: Model) -> Dict[str, Any]:
+        data = {field: getattr(obj, field) for field in self.fields}
+        data["rank"] = getattr(obj, "rank")
+        if self.headline_field:
+            data["headline"] = render_headline(getattr(obj, "headline"))
+        return data
+
+
+SEARCH_TARGETS: Dict[str, SearchTarget] = {
+    "players": SearchTarget(
+        lambda: Player.objects.all(),
+        ("id", "team_id", "nickname", "realname", "gamename", "position"),
+    ),
+    "teams": SearchTarget(lambda: Team.objects.all(), ("id", "name")),
+    "player_posts": SearchTarget(
+        lambda: PlayerPost.objects.all(),
+        ("id", "player_id", "title", "created_at"),
+        headline_field="content",
+    ),
+    "team_posts": SearchTarget(
+        lambda: TeamPost.objects.all(),
+        ("id", "team_id", "title", "created_at"),
+        headline_field="content",
+    ),
+    "player_schedules": SearchTarget(
+        lambda: PlayerSchedule.objects.all(),
+        ("id", "player_id", "category", "title", "place", "start_date", "end_date"),
+        headline_field="detail",
+    ),
+    "team_schedules": SearchTarget(
+        lambda: TeamSchedule.objects.all(),
+        ("id", "team_id", "category", "title", "place", "start_date", "end_date"),
+        headline_field="detail",
+    ),
+}
+
+
+def build_search_query(text: str) -> Optional[SearchQuery]:
+    """
+    입력 문자열을 단어 접두사 AND 검색 tsquery 로 변환 (ex. "페이커 우승" -> '페이커':* & '우승':*)
+
+    simple 설정은 형태소 분석을 하지 않으므로 "페이커가" 처럼 조사가 붙은 단어도 찾도록 접두사 검색을 사용합니다.
+    tsquery 문법 문자는 제거하여 사용자 입력으로 쿼리 구문 오류가 나지 않도록 합니다.
+    """
+    terms: List[str] = [re.sub(r"[^\w]", "", word) for word in text.split()]
+    terms = [term for term in terms if term]
+    if not terms:
+        return None
+    return SearchQuery(" & ".join(f"{term}:*" for term in terms), search_type="raw", config=SEARCH_CONFIG)
@@ -0,0 +1,17 @@
+from typing import Any, Iterable, Optional
+
+from rest_framework import serializers
+
+
+class DynamicFieldsSerializerMixin(serializers.Serializer[Any]):
+    """
+    fields 인자로 넘긴 필드만 직렬화하는 시리얼라이저 Mixin
+    ex) PlayerSerializer(players, many=True, fields=["id", "nickname"])
+    """
+
+    def __init__(self, *args: Any, fields: Optional[Iterable[str]] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            allowed = set(fields)
+            for name in set(self.fields) - allowed:
+                self.fields.pop(name)
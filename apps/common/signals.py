@@ -0,0 +1,209 @@
+from functools import partial
+from typing import Any, Dict, Tuple, Type
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django_softdelete.signals import post_restore, post_soft_delete
+from taggit.models import TaggedItem
+
+from apps.cloud_images.models import PlayerImage, TeamImage, UserImage
+from apps.cloud_images.utils import is_shared_image
+from apps.cloud_images.variants import schedule_variant_deletion, schedule_variants
+from apps.communities.models import (
+    Like,
+    PlayerComment,
+    PlayerPost,
+    TeamComment,
+    TeamPost,
+)
+from apps.communities.utils import (
+    adjust_comment_count,
+    adjust_likes_count,
+    likeable_model,
+    refresh_hot_score,
+)
+from apps.players.models import Player, PlayerSchedule
+from apps.subscriptions.models import PlayerSubscription, TeamSubscription
+from apps.subscriptions.utils import adjust_subscriber_count
+from apps.teams.models import Team, TeamSchedule
+
+from .autocomplete import (
+    autocomplete_index,
+    player_document,
+    search_terms,
+    team_document,
+)
+from .cache import invalidate
+
+# 모델이 변경될 때 버전을 올릴 캐시 엔티티
+# 구독은 구독자 수 기반 랭킹(TopPlayers, PositionTop, TeamRank)에 영향을 줌
+CACHE_ENTITIES: Dict[Type[Model], Tuple[str, ...]] = {
+    Player: ("player",),
+    PlayerImage: ("player",),
+    PlayerSubscription: ("player",),
+    PlayerSchedule: ("player_schedule",),
+    Team: ("team",),
+    TeamImage: ("team",),
+    TeamSubscription: ("team",),
+    TeamSchedule: ("team_schedule",),
+    TaggedItem: ("tag",),
+}
+
+
+def invalidate_response_cache(sender: Type[Model], **kwargs: Any) -> None:
+    invalidate(CACHE_ENTITIES[sender])
+
+
+def connect_cache_signals() -> None:
+    for model in CACHE_ENTITIES:
+        post_save.connect(invalidate_response_cache, sender=model, dispatch_uid=f"response_cache_save_{model.__name__}")
+        post_delete.connect(
+            invalidate_response_cache, sender=model, dispatch_uid=f"response_cache_delete_{model.__name__}"
+        )
+
+
+def update_player_autocomplete(sender: Type[Player], instance: Player, **kwargs: Any) -> None:
+    # 커밋된 변경만 인덱스에 반영 (soft delete 된 선수는 제거)
+    if instance.deleted_at is not None:
+        transaction.on_commit(partial(autocomplete_index.remove, "player", instance.id))
+        return
+    terms = search_terms(instance.nickname, instance.realname, instance.gamename)
+    transaction.on_commit(partial(autocomplete_index.upsert, player_document(instance), terms))
+
+
+def update_team_autocomplete(sender: Type[Team], instance: Team, **kwargs: Any) -> None:
+    if instance.deleted_at is not None:
+        transaction.on_commit(partial(autocomplete_index.remove, "team", instance.id))
+        return
+    transaction.on_commit(partial(autocomplete_index.upsert, team_document(instance), search_terms(instance.name)))
+
+
+def remove_from_autocomplete(sender: Type[Model], instance: Model, **kwargs: Any) -> None:
+    doc_type = "player" if sender is Player else "team"
+    transaction.on_commit(partial(autocomplete_index.remove, doc_type, instance.pk))
+
+
+def connect_autocomplete_signals() -> None:
+    post_save.connect(update_player_autocomplete, sender=Player, dispatch_uid="autocomplete_save_player")
+    post_save.connect(update_team_autocomplete, sender=Team, dispatch_uid="autocomplete_save_team")
+    for model in (Player, Team):
+        post_delete.connect(
+            remove_from_autocomplete, sender=model, dispatch_uid=f"autocomplete_delete_{model.__name__}"
+        )
+
+
+# {댓글 모델: 게시글 모델} - 활성 댓글 수는 게시글의 comment_count 카운터 / 인기 점수에 반영됨
+COMMENT_POST_MODELS: Dict[Type[Model], Type[Model]] = {TeamComment: TeamPost, PlayerComment: PlayerPost}
+
+
+def mark_active_before_delete(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    # 이미 삭제된 행을 다시 soft delete 해도 카운터가 두 번 내려가지 않도록 삭제 전 상태를 기록
+    instance._was_active = instance.deleted_at is None
+
+
+def increment_comment_count(sender: Type[Model], instance: Any, created: bool, **kwargs: Any) -> None:
+    if created and instance.deleted_at is None:
+        adjust_comment_count(COMMENT_POST_MODELS[sender], instance.post_id, 1)
+
+
+def decrement_comment_count(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    # soft delete (답글 cascade 포함) / 활성 댓글의 영구 삭제
+    if getattr(instance, "_was_active", False):
+        instance._was_active = False
+        adjust_comment_count(COMMENT_POST_MODELS[sender], instance.post_id, -1)
+
+
+def restore_comment_count(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    adjust_comment_count(COMMENT_POST_MODELS[sender], instance.post_id, 1)
+
+
+def init_post_hot_score(sender: Type[Model], instance: Model, created: bool, **kwargs: Any) -> None:
+    # 새 게시글의 작성 시각 점수 계산
+    if created:
+        refresh_hot_score(sender, instance.pk)
+
+
+def connect_hot_score_signals() -> None:
+    for model in COMMENT_POST_MODELS:
+        name = model.__name__
+        post_save.connect(increment_comment_count, sender=model, dispatch_uid=f"comment_count_create_{name}")
+        pre_delete.connect(mark_active_before_delete, sender=model, dispatch_uid=f"comment_count_mark_{name}")
+        post_soft_delete.connect(decrement_comment_count, sender=model, dispatch_uid=f"comment_count_soft_{name}")
+        post_delete.connect(decrement_comment_count, sender=model, dispatch_uid=f"comment_count_delete_{name}")
+        post_restore.connect(restore_comment_count, sender=model, dispatch_uid=f"comment_count_restore_{name}")
+    for model in COMMENT_POST_MODELS.values():
+        post_save.connect(init_post_hot_score, sender=model, dispatch_uid=f"hot_score_create_{model.__name__}")
+
+
+def adjust_like_target(instance: Any, delta: int) -> None:
+    model = likeable_model(instance.content_type_id)
+    if model is not None:
+        adjust_likes_count(model, instance.object_id, delta)
+
+
+def decrement_likes_count(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    # 좋아요 API 는 카운터를 직접 증감하고 시그널 없이 UPDATE 하므로, 여기서는 회원 탈퇴 cascade /
+    # 관리자 삭제처럼 모델의 delete() 를 거치는 경우만 반영 (이미 취소된 좋아요는 제외)
+    if getattr(instance, "_was_active", False):
+        instance._was_active = False
+        adjust_like_target(instance, -1)
+
+
+def restore_likes_count(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    adjust_like_target(instance, 1)
+
+
+def connect_like_counter_signals() -> None:
+    pre_delete.connect(mark_active_before_delete, sender=Like, dispatch_uid="likes_count_mark")
+    post_soft_delete.connect(decrement_likes_count, sender=Like, dispatch_uid="likes_count_soft_delete")
+    post_delete.connect(decrement_likes_count, sender=Like, dispatch_uid="likes_count_delete")
+    post_restore.connect(restore_likes_count, sender=Like, dispatch_uid="likes_count_restore")
+
+
+def generate_image_variants(sender: Type[Model], instance: Any, created: bool, **kwargs: Any) -> None:
+    # 새로 저장된 이미지의 크기 별 파생 이미지를 커밋 이후 워커에서 생성
+    if created:
+        schedule_variants(sender, instance.pk)
+
+
+def delete_image_variants(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    # 같은 내용으로 올라온 다른 이미지 행이 원본을 참조하는 동안에는 파생 이미지도 남겨 둠
+    if not is_shared_image(instance.image_url):
+        schedule_variant_deletion(instance.variants)
+
+
+def connect_image_variant_signals() -> None:
+    for model in (UserImage, PlayerImage, TeamImage):
+        post_save.connect(generate_image_variants, sender=model, dispatch_uid=f"image_variants_save_{model.__name__}")
+        post_delete.connect(delete_image_variants, sender=model, dispatch_uid=f"image_variants_delete_{model.__name__}")
+
+
+# {구독 모델: (구독 대상 모델, 구독 대상 FK 이름)}
+SUBSCRIPTION_OWNERS: Dict[Type[Model], Tuple[Type[Model], str]] = {
+    PlayerSubscription: (Player, "player"),
+    TeamSubscription: (Team, "team"),
+}
+
+
+def decrement_subscriber_count(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    # soft delete 는 cascade 와 같은 트랜잭션에서 실행되므로 탈퇴가 롤백되면 감소도 함께 취소됨
+    if getattr(instance, "_was_active", False):
+        owner_model, owner_field = SUBSCRIPTION_OWNERS[sender]
+        adjust_subscriber_count(owner_model, getattr(instance, f"{owner_field}_id"), -1)
+
+
+def increment_subscriber_count(sender: Type[Model], instance: Any, **kwargs: Any) -> None:
+    owner_model, owner_field = SUBSCRIPTION_OWNERS[sender]
+    adjust_subscriber_count(owner_model, getattr(instance, f"{owner_field}_id"), 1)
+
+
+def connect_subscription_counter_signals() -> None:
+    for model in SUBSCRIPTION_OWNERS:
+        pre_delete.connect(mark_active_before_delete, sender=model, dispatch_uid=f"subscriber_mark_{model.__name__}")
+        post_soft_delete.connect(
+            decrement_subscriber_count, sender=model, dispatch_uid=f"subscriber_decrement_{model.__name__}"
+        )
+        post_restore.connect(
+            increment_subscriber_count, sender=model, dispatch_uid=f"subscriber_increment_{model.__name__}"
+        )
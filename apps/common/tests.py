@@ -1,13 +1,38 @@
+import json
+from collections import defaultdict
 from datetime import timedelta
+from io import StringIO
+from typing import Any, Dict, Set
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache, caches
 from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import override_settings
+from django.urls import reverse
 from django.utils.timezone import now
+from rest_framework import status
 from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
 
-from apps.players.models import Player
+from apps.cloud_images.loaders import with_player_images, with_team_images
+from apps.cloud_images.models import PlayerImage, S3DeletionOutbox, TeamImage, UserImage
+from apps.common.autocomplete import autocomplete_index
+from apps.common.cache import local_cache, stats
+from apps.common.models import PurgeProgress
+from apps.common.pagination import KeysetPagination
+from apps.common.purge import PurgeTarget, purge
+from apps.communities.models import Like, PlayerPost, TeamComment, TeamPost
+from apps.communities.views import SUMMARY_DEFERRED
+from apps.players.models import Player, PlayerSchedule
 from apps.subscriptions.models import PlayerSubscription, TeamSubscription
+from apps.subscriptions.utils import active_subscriber_count
 from apps.teams.models import Team
 from apps.users.models import User
+from config.settings import base
 
 
 # Create your tests here.
@@ -47,7 +72,7 @@ class DeleteOldSubscriptionsTest(APITestCase):
 
     def test_delete_old_subscriptions(self) -> None:
         # 명령어를 호출합니다.
-        call_command("hard_delete_old_subscriptions")
+        call_command("hard_delete_old_subscriptions", stdout=StringIO())
 
         # 4일 전에 생성된 삭제된 구독은 삭제되어야 합니다.
         self.assertEqual(
@@ -58,3 +83,511 @@ class DeleteOldSubscriptionsTest(APITestCase):
         # 2일 전에 생성된 삭제된 구독은 남아 있어야 합니다.
         self.assertEqual(PlayerSubscription.deleted_objects.filter(deleted_at__gt=now() - timedelta(days=3)).count(), 1)
         self.assertEqual(TeamSubscription.deleted_objects.filter(deleted_at__gt=now() - timedelta(days=3)).count(), 1)
+
+
+class HardDeleteOldUsersCommunitiesTest(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.old_user = User.objects.create(email="old@example.com", password="x", nickname="old")
+        self.recent_user = User.objects.create(email="recent@example.com", password="x", nickname="recent")
+        self.other = User.objects.create(email="other@example.com", password="x", nickname="other")
+        team = Team.objects.create(name="Purge Team")
+        player = Player.objects.create(
+            realname="Purge Realname",
+            nickname="Purge Nickname",
+            gamename="Purge Gamename",
+            position="mid",
+            date_of_birth="1990-01-01",
+            debut_date="2010-01-01",
+            agency="Test Agency",
+        )
+        # 오래전에 탈퇴한 유저의 게시글에 다른 유저가 단 댓글 / 답글, 좋아요, 구독도 함께 삭제되어야 함
+        self.post = TeamPost.objects.create(team=team, user=self.old_user, title="title", content="content")
+        comment = TeamComment.objects.create(post=self.post, user=self.other, content="comment")
+        TeamComment.objects.create(post=self.post, user=self.other, content="reply", parent=comment)
+        Like.objects.create(
+            user=self.old_user, content_type=ContentType.objects.get_for_model(TeamPost), object_id=self.post.id
+        )
+        PlayerSubscription.objects.create(user=self.old_user, player=player)
+        # 프로필 이미지의 S3 원본 / 파생 이미지는 삭제 큐로
+        UserImage.objects.create(
+            user=self.old_user,
+            image_url=f"{base.AWS_S3_CUSTOM_DOMAIN}/users_images/old/a.png",
+            variants={"webp": {"64": f"{base.AWS_S3_CUSTOM_DOMAIN}/users_images/old/a_64.webp"}},
+        )
+        self.other_post = TeamPost.objects.create(team=team, user=self.other, title="title", content="content")
+        self.other_post.delete()
+        TeamPost.global_objects.filter(pk=self.other_post.pk).update(deleted_at=now() - timedelta(days=8))
+
+        User.objects.filter(pk=self.old_user.pk).update(deleted_at=now() - timedelta(days=8))
+        User.objects.filter(pk=self.recent_user.pk).update(deleted_at=now() - timedelta(days=1))
+
+    def test_purge_cascades_in_batches(self) -> None:
+        out = StringIO()
+        call_command("hard_delete_old_users_communities", "--batch-size", "1", "--sleep", "0", stdout=out)
+
+        self.assertFalse(User.global_objects.filter(pk=self.old_user.pk).exists())
+        self.assertTrue(User.global_objects.filter(pk=self.recent_user.pk).exists())
+        self.assertFalse(TeamPost.global_objects.filter(pk__in=[self.post.pk, self.other_post.pk]).exists())
+        self.assertEqual(TeamComment.global_objects.count(), 0)
+        self.assertEqual(PlayerSubscription.global_objects.count(), 0)
+        self.assertEqual(Like.global_objects.count(), 0)
+        self.assertFalse(UserImage.objects.exists())
+        self.assertEqual(
+            sorted(S3DeletionOutbox.objects.values_list("key", flat=True)),
+            ["users_images/old/a.png", "users_images/old/a_64.webp"],
+        )
+        self.assertIn("팀 게시판 batch 1", out.getvalue())
+        self.assertIn("유저 1명 삭제 완료", out.getvalue())
+
+    def test_dry_run_keeps_rows(self) -> None:
+        out = StringIO()
+        call_command("hard_delete_old_users_communities", "--dry-run", stdout=out)
+        self.assertIn("유저 1명 삭제 예정", out.getvalue())
+        self.assertTrue(User.global_objects.filter(pk=self.old_user.pk).exists())
+
+    def test_resume_from_saved_progress(self) -> None:
+        # 이전 실행이 pk 까지 진행하고 멈춘 경우 그 이후 행만 삭제
+        target = PurgeTarget("유저", User, days=7)
+        PurgeProgress.objects.create(
+            target=target.progress_key, cutoff=now() - timedelta(days=7), last_pk=self.old_user.pk
+        )
+        purge(target, log=lambda message: None)
+        self.assertTrue(User.global_objects.filter(pk=self.old_user.pk).exists())
+        self.assertFalse(PurgeProgress.objects.exists())
+
+    def test_interrupted_purge_resumes_from_database(self) -> None:
+        # batch 가 실패해도 앞선 batch 의 진행 상황은 DB 에 남아 다음 실행이 이어서 진행
+        target = PurgeTarget("팀 게시판", TeamPost, days=7)
+        TeamPost.objects.filter(pk=self.post.pk).update(deleted_at=now() - timedelta(days=8))
+        first_pk = min(self.post.pk, self.other_post.pk)
+        with mock.patch("apps.common.purge.cascade_delete", side_effect=[None, RuntimeError("stop")]):
+            with self.assertRaises(RuntimeError):
+                purge(target, batch_size=1, log=lambda message: None)
+        self.assertEqual(PurgeProgress.objects.get(target=target.progress_key).last_pk, first_pk)
+        self.assertEqual(purge(target, dry_run=True, log=lambda message: None), {"communities.TeamPost": 1})
+
+        # --restart 는 저장된 진행 상황을 버리고 처음부터
+        self.assertEqual(
+            purge(target, dry_run=True, restart=True, log=lambda message: None), {"communities.TeamPost": 2}
+        )
+        purge(target, restart=True, log=lambda message: None)
+        self.assertFalse(TeamPost.global_objects.filter(pk__in=[self.post.pk, self.other_post.pk]).exists())
+        self.assertFalse(PurgeProgress.objects.exists())
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTest(APITestCase):
+    def setUp(self) -> None:
+        caches["default"].clear()
+        local_cache.clear()
+        stats.reset()
+        self.player = Player.objects.create(
+            realname="Cache Realname",
+            nickname="Cache Nickname",
+            gamename="Cache Gamename",
+            position="mid",
+            date_of_birth="1990-01-01",
+            debut_date="2010-01-01",
+        )
+        self.url = reverse("top-players")
+
+    def test_second_request_is_served_from_cache(self) -> None:
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.local_hits, 1)
+
+    def test_shared_cache_is_used_when_local_cache_is_empty(self) -> None:
+        self.client.get(self.url)
+        local_cache.clear()
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+        self.assertEqual(stats.shared_hits, 1)
+
+    def test_model_save_invalidates_cached_response(self) -> None:
+        self.client.get(self.url)
+        self.player.nickname = "Renamed"
+        self.player.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data[0]["nickname"], "Renamed")
+        self.assertEqual(stats.misses, 2)
+
+    def test_cache_stats_requires_admin(self) -> None:
+        url = reverse("cache_stats")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        admin = User.objects.create_user(email="admin@example.com", password="pass", nickname="admin", is_staff=True)
+        token = str(RefreshToken.for_user(admin).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.client.get(self.url)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["misses"], 1)
+
+
+class TagSearchTest(APITestCase):
+    def setUp(self) -> None:
+        self.team = Team.objects.create(name="T1")
+        self.team.tags.add("티원")
+        self.faker = Player.objects.create(
+            team=self.team,
+            realname="이상혁",
+            nickname="Faker",
+            gamename="Hide on bush",
+            position="mid",
+            date_of_birth="1996-05-07",
+            debut_date="2013-02-13",
+        )
+        self.faker.tags.add("페이커", "Faker")
+        self.fake = Player.objects.create(
+            realname="Fake Realname",
+            nickname="Fakeman",
+            gamename="Fakeman",
+            position="top",
+            date_of_birth="1990-01-01",
+            debut_date="2010-01-01",
+        )
+        self.fake.tags.add("Fakerr")
+        self.url = reverse("tag_search")
+
+    def test_search_is_ranked_by_similarity(self) -> None:
+        response = self.client.get(self.url, {"search": "faker"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 정확히 일치하는 태그를 가진 선수가 먼저, 여러 태그가 매칭되어도 한 번만 나옴
+        self.assertEqual([player["id"] for player in response.data["players"]], [self.faker.id, self.fake.id])
+
+    def test_search_uses_one_query_per_entity(self) -> None:
+        # 선수 1번, 팀 1번, 팀 소속 선수 prefetch 1번, 팀 태그 prefetch 1번
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {"search": "티원"})
+        self.assertEqual([team["id"] for team in response.data["teams"]], [self.team.id])
+        self.assertEqual(response.data["teams"][0]["players"][0]["id"], self.faker.id)
+
+    def test_single_character_search_matches_prefix(self) -> None:
+        response = self.client.get(self.url, {"search": "페"})
+        self.assertEqual([player["id"] for player in response.data["players"]], [self.faker.id])
+
+        response = self.client.get(self.url, {"search": "커"})
+        self.assertEqual(response.data["players"], [])
+
+
+class AutocompleteTest(APITestCase):
+    def setUp(self) -> None:
+        autocomplete_index.clear()
+        self.team = Team.objects.create(name="T1")
+        self.player = Player.objects.create(
+            team=self.team,
+            realname="이상혁",
+            nickname="Faker",
+            gamename="Hide on bush",
+            position="mid",
+            date_of_birth="1996-05-07",
+            debut_date="2013-02-13",
+        )
+        self.url = reverse("autocomplete")
+
+    def search(self, query: str) -> list[tuple[str, int]]:
+        response = self.client.get(self.url, {"q": query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(item["type"], item["id"]) for item in response.data["results"]]
+
+    def test_prefix_match_without_database(self) -> None:
+        self.search("x")  # 첫 검색에서 인덱스 생성
+        with self.assertNumQueries(0):
+            self.assertEqual(self.search("fak"), [("player", self.player.id)])
+            self.assertEqual(self.search("bush"), [("player", self.player.id)])
+            self.assertEqual(self.search("t1"), [("team", self.team.id)])
+
+    def test_korean_jamo_prefix(self) -> None:
+        # "이상혁" 을 입력하는 도중의 상태들
+        for query in ("ㅇ", "이ㅅ", "이사", "이상ㅎ", "이상혀"):
+            self.assertEqual(self.search(query), [("player", self.player.id)], query)
+        self.assertEqual(self.search("이상훈"), [])
+
+    def test_signals_keep_index_up_to_date(self) -> None:
+        self.search("x")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.player.nickname = "Unkillable"
+            self.player.save()
+        self.assertEqual(self.search("unk"), [("player", self.player.id)])
+        self.assertEqual(self.search("fak"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.delete()
+        self.assertEqual(self.search("t1"), [])
+
+
+class SearchTest(APITestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="writer@example.com", password="pass", nickname="writer")
+        self.team = Team.objects.create(name="T1")
+        self.player = Player.objects.create(
+            team=self.team,
+            realname="이상혁",
+            nickname="Faker",
+            gamename="Hide on bush",
+            position="mid",
+            date_of_birth="1996-05-07",
+            debut_date="2013-02-13",
+        )
+        self.posts = [
+            PlayerPost.objects.create(
+                player=self.player, user=self.user, title=f"응원글 {i}", content=f"오늘도 faker 선수 화이팅 {i}"
+            )
+            for i in range(3)
+        ]
+        # 제목(A 가중치)에 검색어가 있는 글이 본문(B 가중치)에만 있는 글보다 앞에 옴
+        self.title_post = PlayerPost.objects.create(
+            player=self.player, user=self.user, title="Faker 우승", content="축하합니다"
+        )
+        PlayerSchedule.objects.create(
+            player=self.player,
+            category="팬미팅",
+            start_date="2025-03-01 10:00",
+            end_date="2025-03-01 12:00",
+            place="서울",
+            title="페이커 팬미팅",
+            detail="Faker 와 함께하는 팬미팅",
+        )
+        self.url = reverse("search")
+
+    def test_search_all_types(self) -> None:
+        # 타입마다 쿼리 1번
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url, {"q": "fak"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in response.data["players"]["results"]], [self.player.id])
+        self.assertEqual(response.data["teams"]["results"], [])
+
+        posts = response.data["player_posts"]["results"]
+        self.assertEqual(posts[0]["id"], self.title_post.id)
+        self.assertIn("<b>faker</b>", posts[1]["headline"])
+        self.assertEqual(len(response.data["player_schedules"]["results"]), 1)
+
+    def test_search_single_type_is_paginated(self) -> None:
+        response = self.client.get(self.url, {"q": "faker", "type": "player_posts", "page_size": "3"})
+        first_page = [item["id"] for item in response.data["results"]]
+        self.assertEqual(len(first_page), 3)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+        second_page = [item["id"] for item in response.data["results"]]
+        self.assertEqual(len(second_page), 1)
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(set(first_page + second_page), {post.id for post in [*self.posts, self.title_post]})
+
+    def test_invalid_search_requests(self) -> None:
+        self.assertEqual(self.client.get(self.url, {"q": " & !"}).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {"q": "faker", "type": "comments"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # type 없이 cursor 를 주면 거부
+        next_link = self.client.get(self.url, {"q": "faker", "type": "player_posts", "page_size": "1"}).data["next"]
+        cursor = parse_qs(urlparse(next_link).query)["cursor"][0]
+        response = self.client.get(self.url, {"q": "faker", "cursor": cursor})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_headline_escapes_user_markup(self) -> None:
+        post = PlayerPost.objects.create(
+            player=self.player,
+            user=self.user,
+            title="글",
+            content="<script>alert(1)</script> faker & <img src=x onerror=alert(1)",
+        )
+        response = self.client.get(self.url, {"q": "faker", "type": "player_posts"})
+        headline = next(item["headline"] for item in response.data["results"] if item["id"] == post.id)
+        self.assertNotIn("<script>", headline)
+        self.assertNotIn("<img", headline)
+        self.assertIn("&amp;", headline)
+        self.assertIn("<b>faker</b>", headline)
+
+
+def scanned_relations(queryset: QuerySet[Any]) -> Dict[str, Set[str]]:
+    """
+    queryset 의 실행 계획(EXPLAIN FORMAT JSON)에서 테이블 별 스캔 방식을 모음 (서브쿼리 / prefetch 조인 포함)
+
+    Returns:
+        Dict[str, Set[str]]: {테이블 이름: {"Seq Scan", "Index Scan", ...}}
+    """
+    scans: Dict[str, Set[str]] = defaultdict(set)
+    nodes = [json.loads(queryset.explain(format="json"))[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Relation Name" in node:
+            scans[node["Relation Name"]].add(node["Node Type"])
+        nodes.extend(node.get("Plans", []))
+    return scans
+
+
+class QueryPlanTest(APITestCase):
+    """
+    실제 운영과 비슷한 규모의 데이터를 넣고 통계를 갱신한 뒤, 주요 조회 쿼리가 인덱스를 사용하는지 EXPLAIN 으로 확인
+
+    soft delete 조건(deleted_at IS NULL)이 붙는 조회가 순차 스캔(Seq Scan)으로 바뀌면 실패합니다.
+    """
+
+    TEAMS = 20
+    PLAYERS = 2000
+    USERS = 2000
+    POSTS = 4000
+    COMMENTS_PER_POST = 5
+    IMAGES_PER_OWNER = 5
+
+    team: Team
+    player: Player
+    user: User
+    post: TeamPost
+    content_type: ContentType
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        teams = Team.objects.bulk_create([Team(name=f"Team {i}") for i in range(cls.TEAMS)])
+        positions = ["top", "jungle", "mid", "bot", "support"]
+        players = Player.objects.bulk_create(
+            [
+                Player(
+                    team=teams[i % cls.TEAMS],
+                    realname=f"Realname {i}",
+                    nickname=f"Player {i}",
+                    gamename=f"Gamename {i}",
+                    position=positions[i % len(positions)],
+                    date_of_birth="2000-01-01",
+                    debut_date="2020-01-01",
+                    agency="Agency",
+                    subscriber_count=i % 97,
+                )
+                for i in range(cls.PLAYERS)
+            ],
+            batch_size=1000,
+        )
+        users = User.objects.bulk_create(
+            [User(email=f"user{i}@example.com", password="x", nickname=f"user{i}") for i in range(cls.USERS)],
+            batch_size=1000,
+        )
+        # 활성 구독 1개 + 취소된 구독 1개씩
+        PlayerSubscription.objects.bulk_create(
+            [
+                PlayerSubscription(user=user, player=players[(i + offset) % cls.PLAYERS], deleted_at=deleted_at)
+                for i, user in enumerate(users)
+                for offset, deleted_at in ((0, None), (1, now() - timedelta(days=2)))
+            ],
+            batch_size=1000,
+        )
+        TeamSubscription.objects.bulk_create(
+            [TeamSubscription(user=user, team=teams[i % cls.TEAMS]) for i, user in enumerate(users)],
+            batch_size=1000,
+        )
+        posts = TeamPost.objects.bulk_create(
+            [
+                TeamPost(team=teams[i % cls.TEAMS], user=users[i % cls.USERS], title=f"Post {i}", content="content")
+                for i in range(cls.POSTS)
+            ],
+            batch_size=1000,
+        )
+        TeamComment.objects.bulk_create(
+            [
+                TeamComment(post=post, user=users[j], content="comment")
+                for post in posts
+                for j in range(cls.COMMENTS_PER_POST)
+            ],
+            batch_size=2000,
+        )
+        content_type = ContentType.objects.get_for_model(TeamPost)
+        Like.objects.bulk_create(
+            [
+                Like(user=users[i % cls.USERS], content_type=content_type, object_id=post.id)
+                for i, post in enumerate(posts)
+            ],
+            batch_size=1000,
+        )
+        # 선수 / 팀마다 프로필 1장 + 갤러리 여러 장 (bulk_create 라 파생 이미지 시그널은 실행되지 않음)
+        categories = ["profile"] + ["gallery"] * (cls.IMAGES_PER_OWNER - 1)
+        PlayerImage.objects.bulk_create(
+            [
+                PlayerImage(player=player, category=category, image_url=f"https://img/{player.id}/{i}.png")
+                for player in players
+                for i, category in enumerate(categories)
+            ],
+            batch_size=2000,
+        )
+        TeamImage.objects.bulk_create(
+            [
+                TeamImage(team=team, category=category, image_url=f"https://img/{team.id}/{i}.png")
+                for team in teams
+                for i, category in enumerate(categories * 20)
+            ],
+            batch_size=2000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        cls.team = teams[0]
+        cls.player = players[0]
+        cls.user = users[0]
+        cls.post = posts[0]
+        cls.content_type = content_type
+
+    def assertUsesIndex(self, queryset: QuerySet[Any], *tables: str) -> None:
+        scans = scanned_relations(queryset)
+        for table in tables:
+            self.assertIn(table, scans, f"{table} 를 조회하지 않음: {dict(scans)}")
+            self.assertNotIn("Seq Scan", scans[table], f"{table} 순차 스캔: {queryset.explain()}")
+
+    def test_post_feeds_use_index(self) -> None:
+        posts = TeamPost.objects.filter(team_id=self.team.id).defer(*SUMMARY_DEFERRED)
+        self.assertUsesIndex(posts.order_by("-created_at", "-id")[:21], "team_post")
+        self.assertUsesIndex(posts.order_by("-hot_score", "-id")[:21], "team_post")
+
+    def test_comment_queries_use_index(self) -> None:
+        comments = TeamComment.objects.filter(post_id=self.post.id, parent_id=None).order_by("created_at", "id")
+        self.assertUsesIndex(comments[:21], "team_comment")
+        self.assertUsesIndex(
+            TeamComment.objects.filter(post_id__in=[self.post.id]).order_by("created_at", "id"), "team_comment"
+        )
+
+    def test_subscription_queries_use_index(self) -> None:
+        self.assertUsesIndex(PlayerSubscription.objects.filter(user=self.user), "player_subscription")
+        self.assertUsesIndex(TeamSubscription.objects.filter(user=self.user), "team_subscription")
+        self.assertUsesIndex(
+            Player.objects.filter(pk=self.player.id).annotate(
+                total=active_subscriber_count(PlayerSubscription, "player")
+            ),
+            "player_subscription",
+        )
+
+    def test_player_queries_use_index(self) -> None:
+        self.assertUsesIndex(Player.objects.filter(team_id__in=[self.team.id]).order_by("id"), "player")
+        self.assertUsesIndex(Player.objects.order_by("-subscriber_count", "id")[:5], "player")
+        self.assertUsesIndex(Player.objects.filter(position="mid").order_by("-subscriber_count", "id")[:5], "player")
+
+    def test_image_queries_use_index(self) -> None:
+        # 갤러리 keyset 페이지 (첫 페이지 / 커서 이후), 가장 최근 프로필 이미지, 목록의 이미지 URL 서브쿼리
+        gallery = PlayerImage.objects.filter(player_id=self.player.id, category="gallery").order_by(
+            "-uploaded_at", "-id"
+        )
+        self.assertUsesIndex(gallery[:21], "player_images")
+        last = gallery[1]
+        keyset = KeysetPagination.build_keyset_filter(("-uploaded_at", "-id"), [last.uploaded_at, last.id])
+        self.assertUsesIndex(gallery.filter(keyset)[:21], "player_images")
+        self.assertUsesIndex(
+            TeamImage.objects.filter(team_id=self.team.id, category="gallery").order_by("-uploaded_at", "-id")[:21],
+            "team_images",
+        )
+        self.assertUsesIndex(
+            PlayerImage.objects.filter(player_id=self.player.id, category="profile").order_by("-uploaded_at", "-id")[
+                :1
+            ],
+            "player_images",
+        )
+        self.assertUsesIndex(with_player_images(Player.objects.order_by("id")[:20]), "player", "player_images")
+        # team 은 20행이라 순차 스캔이 정상이므로 이미지 테이블만 확인
+        self.assertUsesIndex(with_team_images(Team.objects.filter(pk=self.team.id)), "team_images")
+
+    def test_like_queries_use_index(self) -> None:
+        likes = Like.objects.filter(content_type=self.content_type, object_id=self.post.id, user=self.user)
+        self.assertUsesIndex(likes, "like")
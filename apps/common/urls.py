@@ -1,7 +1,10 @@
 from django.urls import path
 
-from .views import TagSearchView
+from .views import AutocompleteView, CacheStatsView, SearchView, TagSearchView
 
 urlpatterns = [
     path("tag-search/", TagSearchView.as_view(), name="tag_search"),
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
+    path("search/", SearchView.as_view(), name="search"),
+    path("cache-stats/", CacheStatsView.as_view(), name="cache_stats"),
 ]
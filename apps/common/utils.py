@@ -0,0 +1,19 @@
+import json
+from typing import Any, Callable, Iterable, Iterator
+
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def stream_json_list(rows: Iterable[Any], serialize: Callable[[Any], Any]) -> Iterator[str]:
+    """
+    행을 하나씩 직렬화하여 JSON 배열을 조각 단위로 내보내는 제너레이터
+
+    StreamingHttpResponse 와 함께 사용하며, 전체 결과를 메모리에 올리지 않으므로
+    queryset.iterator(chunk_size=...) 와 함께 쓰면 행 수와 상관없이 메모리 사용량이 일정합니다.
+    """
+    yield "["
+    for index, row in enumerate(rows):
+        if index:
+            yield ","
+        yield json.dumps(serialize(row), cls=JSONEncoder, ensure_ascii=False)
+    yield "]"
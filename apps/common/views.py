@@ -1,19 +1,45 @@
-from typing import Any
+from typing import Any, Dict
 
 from django.contrib.postgres.search import TrigramSimilarity
-from django.db.models import Subquery
+from django.db.models import Max, Q
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
-from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
-from taggit.models import Tag
 
+from apps.cloud_images.loaders import with_player_images
 from apps.players.models import Player
 from apps.players.serializers import PlayerDetailSerializer
+from apps.teams.loaders import with_team_aggregate
 from apps.teams.models import Team
 from apps.teams.serializers import TeamDetailSerializer
 
+from .autocomplete import autocomplete_index
+from .cache import cached_response, stats
+from .pagination import KeysetPagination
+from .search import SEARCH_ORDERINGS, SEARCH_TARGETS, build_search_query
+
+
+def tag_search_filter(field: str, query: str) -> Q:
+    """
+    태그 이름 검색 조건
+
+    - 1글자: 접두사 일치 (UPPER(name) LIKE 'X%') -> UPPER(name) btree 인덱스 사용
+      trigram 은 1글자로 만들 수 있는 조각이 없어 인덱스를 쓸 수 없음
+    - 2글자 이상: trigram 유사도(%) 또는 부분 일치(ILIKE) -> name trigram GIN 인덱스 사용
+    """
+    if len(query) == 1:
+        return Q(**{f"{field}__istartswith": query})
+    return Q(**{f"{field}__trigram_similar": query}) | Q(**{f"{field}__icontains": query})
+
+
+def tag_search_rank(field: str, query: str) -> Max:
+    # 매칭된 태그 중 가장 높은 유사도
+    return Max(TrigramSimilarity(field, query))
+
 
 class TagSearchView(APIView):
     """태그 기반으로 Player와 Team을 검색"""
@@ -27,6 +53,7 @@ class TagSearchView(APIView):
         parameters=[OpenApiParameter("search", type=str, description="검색할 태그")],
         responses={200: "검색 결과 반환"},
     )
+    @cached_response("tag", "player", "team")
     def get(self, request: Any) -> Response:
         # URL의 쿼리 파라미터(?search=검색어)에서 검색어를 가져온다
         # ex) GET /api/v1/search/?search=페이커
@@ -36,27 +63,19 @@ class TagSearchView(APIView):
         if not query:
             return Response({"error": "검색어를 입력하세요."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # distinct: 중복된 값을 제거
-        # icontains -> ILike 사용, 하지만 orm에서 B-Tree를 사용하기 때문에 O(N)
-        # trigram으로는 1글자만 필터가 불가능하므로 분리
-        if len(query) == 1:
-            tags_subquery = Tag.objects.filter(name__icontains=query).values("id")
-
-            players = Player.objects.filter(tags__in=Subquery(tags_subquery)).distinct()
-            teams = Team.objects.filter(tags__in=Subquery(tags_subquery)).distinct()
-
-        else:  # 2글자 이상일 경우 TrigramSimilarity만 사용하여 검색 -> trigram index를 사용하여 O(logN)가능
-            tags_subquery = (
-                Tag.objects.annotate(
-                    similarity=TrigramSimilarity("name", query),
-                )
-                .filter(similarity__gt=0.2)
-                .order_by("similarity")
-                .values("id")
-            )
-
-            players = Player.objects.filter(tags__in=Subquery(tags_subquery)).distinct()
-            teams = Team.objects.filter(tags__in=Subquery(tags_subquery)).distinct()
+        # 태그 조인과 매칭 조건을 선수 / 팀 쿼리 안에 넣어 엔티티 별 쿼리 1번으로 조회
+        # 여러 태그가 매칭되면 가장 유사한 태그의 점수를 기준으로 정렬 (GROUP BY 로 중복 제거)
+        players = with_player_images(
+            Player.objects.filter(tag_search_filter("tags__name", query))
+            .annotate(rank=tag_search_rank("tags__name", query))
+            .order_by("-rank", "id")
+        )
+        # 팀 상세 시리얼라이저가 쓰는 소속 선수 / 이미지 / 태그를 함께 불러옴
+        teams = with_team_aggregate(
+            Team.objects.filter(tag_search_filter("tags__name", query))
+            .annotate(rank=tag_search_rank("tags__name", query))
+            .order_by("-rank", "id")
+        )
 
         player_serializer = PlayerDetailSerializer(players, many=True)
         team_serializer = TeamDetailSerializer(teams, many=True)
@@ -68,3 +87,101 @@ class TagSearchView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+# 통합 검색에서 전체 타입을 한 번에 조회할 때 / 특정 타입만 조회할 때의 페이지 크기
+SEARCH_OVERVIEW_PAGE_SIZE = 5
+SEARCH_PAGE_SIZE = 20
+
+
+class SearchView(APIView):
+    """선수 / 팀 / 게시글 / 일정 통합 전문 검색"""
+
+    authentication_classes = ()
+    permission_classes = (AllowAny,)
+
+    @extend_schema(
+        summary="통합 검색",
+        description=(
+            "선수, 팀, 선수/팀 게시글, 선수/팀 일정을 검색합니다. "
+            "type 을 지정하지 않으면 타입 별 상위 결과와 다음 페이지 링크를, "
+            "type 을 지정하면 해당 타입만 cursor 로 페이지를 넘기며 조회합니다."
+        ),
+        parameters=[
+            OpenApiParameter("q", type=str, description="검색어"),
+            OpenApiParameter("type", type=str, description=f"결과 타입 ({', '.join(SEARCH_TARGETS)})"),
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서 (type 지정 시)"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기"),
+        ],
+        responses={200: "검색 결과 반환"},
+    )
+    def get(self, request: Any) -> Response:
+        query = build_search_query(request.GET.get("q", ""))
+        if query is None:
+            return Response({"error": "검색어를 입력하세요."}, status=status.HTTP_400_BAD_REQUEST)
+
+        search_type = request.GET.get("type")
+        if search_type:
+            if search_type not in SEARCH_TARGETS:
+                raise ValidationError({"type": f"지원하지 않는 타입입니다. ({', '.join(SEARCH_TARGETS)})"})
+            return Response(self.search_page(request, search_type, query, SEARCH_PAGE_SIZE), status=status.HTTP_200_OK)
+
+        # 커서는 타입 하나의 키셋 위치이므로, 모든 타입에 같은 커서를 적용하지 않도록 거부
+        if "cursor" in request.GET:
+            raise ValidationError({"cursor": "cursor 는 type 과 함께 사용해야 합니다."})
+        # 타입 별 첫 페이지 (타입마다 쿼리 1번)
+        results = {name: self.search_page(request, name, query, SEARCH_OVERVIEW_PAGE_SIZE) for name in SEARCH_TARGETS}
+        return Response(results, status=status.HTTP_200_OK)
+
+    def search_page(self, request: Any, name: str, query: Any, page_size: int) -> Dict[str, Any]:
+        target = SEARCH_TARGETS[name]
+        paginator = KeysetPagination(orderings=SEARCH_ORDERINGS, default_ordering="rank", page_size=page_size)
+        page = paginator.paginate_queryset(target.search(query), request)
+        next_link = paginator.get_next_link()
+        if next_link:
+            next_link = replace_query_param(next_link, "type", name)
+        return {"next": next_link, "results": [target.to_representation(obj) for obj in page]}
+
+
+# 자동완성 결과 최대 개수
+AUTOCOMPLETE_MAX_LIMIT = 20
+
+
+class AutocompleteView(APIView):
+    """선수 닉네임 / 실명 / 게임 아이디, 팀 이름 접두사 자동완성 (메모리 인덱스, DB 조회 없음)"""
+
+    authentication_classes = ()
+    permission_classes = (AllowAny,)
+
+    @extend_schema(
+        summary="선수 / 팀 이름 자동완성",
+        description="입력 중인 검색어로 시작하는 선수와 팀을 반환합니다. 한글은 자모 단위로 비교합니다. (ex. 페ㅇ -> 페이커)",
+        parameters=[
+            OpenApiParameter("q", type=str, description="입력 중인 검색어"),
+            OpenApiParameter("limit", type=int, description=f"최대 결과 수 (기본 10, 최대 {AUTOCOMPLETE_MAX_LIMIT})"),
+        ],
+        responses={200: "자동완성 결과 반환"},
+    )
+    def get(self, request: Any) -> Response:
+        query = request.GET.get("q", "").strip()
+        try:
+            limit = min(int(request.GET.get("limit", 10)), AUTOCOMPLETE_MAX_LIMIT)
+        except ValueError:
+            limit = 10
+        if not query or limit < 1:
+            return Response({"results": []}, status=status.HTTP_200_OK)
+        return Response({"results": autocomplete_index.search(query, limit)}, status=status.HTTP_200_OK)
+
+
+class CacheStatsView(APIView):
+    """응답 캐시 적중/실패 통계 (관리자 전용)"""
+
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+        summary="응답 캐시 통계 조회",
+        description="현재 프로세스의 로컬 / 공유 캐시 적중 횟수, 실패 횟수, 적중률을 반환합니다.",
+        responses={200: "캐시 통계"},
+    )
+    def get(self, request: Any) -> Response:
+        return Response(stats.as_dict(), status=status.HTTP_200_OK)
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CommunitiesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.communities"
+
+    def ready(self) -> None:
+        # 좋아요 write-behind 버퍼가 공유 캐시를 사용하는지 검사
+        from django.core import checks
+
+        from .like_buffer import check_buffer_cache
+
+        checks.register(check_buffer_cache)
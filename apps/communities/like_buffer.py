@@ -0,0 +1,359 @@
+"""
+좋아요 write-behind 버퍼 (settings.LIKE_WRITE_BEHIND)
+
+경기 중계 시간처럼 좋아요가 몰릴 때 요청마다 INSERT / UPDATE 하지 않고 공유 캐시(Redis 등)에 모아 두었다가
+flush_like_buffer 명령어로 한 번에 반영합니다.
+
+캐시 키
+    state:{model_type}:{object_id}:{user_id} -> 사용자의 최종 좋아요 여부 (flush 전까지 만료되지 않음)
+    delta:{model_type}:{object_id}           -> 아직 DB 에 반영되지 않은 기록의 증감 합 (조회 시 likes_count 에 더함)
+    seq / entry:{n}                          -> 상태 변경 기록 (model_type, object_id, user_id, liked), flushed 이후의 기록만 반영
+    lock:{model_type}:{object_id}:{user_id}  -> 사용자 / 대상 별 상태 전이 락 (동시에 들어온 더블 탭이 둘 다 기록되지 않도록)
+
+delta 는 기록마다 +1 / -1 을 더하고 flush 가 반영한 기록의 값만큼 되돌리므로 항상 미반영 기록의 합과 같습니다.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.core.checks import CheckMessage, Error
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Like
+from .utils import LIKEABLE_MODELS, adjust_likes_count, likeable_content_types
+
+BUFFER_KEY_PREFIX = "like-buffer"
+SEQ_KEY = f"{BUFFER_KEY_PREFIX}:seq"
+FLUSHED_KEY = f"{BUFFER_KEY_PREFIX}:flushed"
+LOCK_KEY = f"{BUFFER_KEY_PREFIX}:lock"
+STALL_KEY = f"{BUFFER_KEY_PREFIX}:stall"
+
+# 상태 전이 락 유지 / 대기 시간 (초)
+TRANSITION_LOCK_TIMEOUT = 5
+TRANSITION_LOCK_WAIT = 2.0
+# 번호만 받고 기록을 쓰지 못한 seq (기록 중 프로세스 종료) 를 건너뛰기까지 기다리는 시간 (초)
+ENTRY_WRITE_GRACE = 60
+
+# (model_type, object_id, user_id)
+LikeKey = Tuple[str, int, int]
+
+# 버퍼로 쓸 수 없는 캐시 백엔드 - 프로세스 별 메모리라 flush_like_buffer 가 API 프로세스의 기록을 볼 수 없거나,
+# 파일 캐시처럼 incr / add 가 프로세스 간에 원자적이지 않음
+UNSHARED_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.filebased.FileBasedCache",
+)
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, "LIKE_WRITE_BEHIND", False))
+
+
+def buffer_cache_alias() -> str:
+    return str(getattr(settings, "LIKE_BUFFER_CACHE_ALIAS", "default"))
+
+
+def get_buffer_cache() -> BaseCache:
+    return caches[buffer_cache_alias()]
+
+
+def check_buffer_cache(app_configs: Any, **kwargs: Any) -> List[CheckMessage]:
+    # write-behind 를 켰는데 버퍼가 공유 캐시가 아니면 기록이 flush 되지 않고 유실되므로 시작 / 명령어 실행을 막음
+    if not is_enabled():
+        return []
+    alias = buffer_cache_alias()
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend is None or backend in UNSHARED_CACHE_BACKENDS:
+        return [
+            Error(
+                f"LIKE_WRITE_BEHIND 는 공유 캐시가 필요하지만 LIKE_BUFFER_CACHE_ALIAS ({alias}) 의 백엔드가 {backend} 입니다.",
+                hint="REDIS_URL 을 설정하거나 LIKE_WRITE_BEHIND 를 끄세요.",
+                id="communities.E001",
+            )
+        ]
+    return []
+
+
+def buffer_timeout() -> int:
+    return int(getattr(settings, "LIKE_BUFFER_TIMEOUT", 60 * 60 * 24))
+
+
+def state_key(model_type: str, object_id: int, user_id: int) -> str:
+    return f"{BUFFER_KEY_PREFIX}:state:{model_type}:{object_id}:{user_id}"
+
+
+def delta_key(model_type: str, object_id: int) -> str:
+    return f"{BUFFER_KEY_PREFIX}:delta:{model_type}:{object_id}"
+
+
+def entry_key(seq: int) -> str:
+    return f"{BUFFER_KEY_PREFIX}:entry:{seq}"
+
+
+def transition_lock_key(model_type: str, object_id: int, user_id: int) -> str:
+    return f"{BUFFER_KEY_PREFIX}:lock:{model_type}:{object_id}:{user_id}"
+
+
+def incr(cache: BaseCache, key: str, delta: int = 1) -> int:
+    # 키가 없으면 0 으로 만든 뒤 증감 (Redis / LocMem 의 incr 는 원자적)
+    cache.add(key, 0, timeout=None)
+    return int(cache.incr(key, delta))
+
+
+def is_liked(model_type: str, object_id: int, user_id: int) -> bool:
+    """버퍼에 남은 값이 있으면 그 값을, 없으면 DB 의 활성 좋아요 여부를 반환"""
+    buffered = get_buffer_cache().get(state_key(model_type, object_id, user_id))
+    if buffered is not None:
+        return bool(buffered)
+    content_type = likeable_content_types()[model_type]
+    return Like.objects.filter(content_type=content_type, object_id=object_id, user_id=user_id).exists()
+
+
+def acquire_transition_lock(cache: BaseCache, key: str) -> bool:
+    # cache.add 는 키가 없을 때만 성공하므로 (Redis SET NX) 한 요청만 락을 잡음
+    deadline = time.monotonic() + TRANSITION_LOCK_WAIT
+    while not cache.add(key, 1, timeout=TRANSITION_LOCK_TIMEOUT):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def record(model_type: str, object_id: int, user_id: int, liked: bool) -> bool:
+    """
+    좋아요 / 취소를 버퍼에 기록 (DB 쓰기 없음)
+
+    같은 사용자 / 대상의 상태 확인과 기록을 전이 락 안에서 실행하므로,
+    동시에 들어온 요청 중 실제로 상태를 바꾼 요청만 delta 를 증감합니다.
+
+    Returns:
+        bool: 상태가 바뀌었는지 여부 (이미 같은 상태거나 락을 잡지 못하면 False)
+    """
+    cache = get_buffer_cache()
+    lock = transition_lock_key(model_type, object_id, user_id)
+    if not acquire_transition_lock(cache, lock):
+        return False
+    try:
+        if is_liked(model_type, object_id, user_id) == liked:
+            return False
+        # 번호 -> 기록 -> 상태 -> 증감 순서 (번호만 받고 종료되면 flush 가 ENTRY_WRITE_GRACE 이후 건너뜀)
+        # 기록 / 상태는 flush 가 반영할 때까지 만료되지 않아야 함 (만료되면 변경이 유실되고 delta 가 되돌려지지 않음)
+        seq = incr(cache, SEQ_KEY)
+        cache.set(entry_key(seq), (model_type, object_id, user_id, liked), timeout=None)
+        cache.set(state_key(model_type, object_id, user_id), liked, timeout=None)
+        incr(cache, delta_key(model_type, object_id), 1 if liked else -1)
+        return True
+    finally:
+        cache.delete(lock)
+
+
+def pending_deltas(model_type: str, object_ids: Sequence[int]) -> Dict[int, int]:
+    # 아직 반영되지 않은 좋아요 수 증감 {object_id: delta}
+    keys = {delta_key(model_type, object_id): object_id for object_id in object_ids}
+    found = get_buffer_cache().get_many(list(keys))
+    return {keys[key]: int(value) for key, value in found.items()}
+
+
+def pending_states(user_id: int, items: Sequence[Tuple[str, int]]) -> Dict[Tuple[str, int], bool]:
+    # 아직 반영되지 않은 사용자의 좋아요 여부 {(model_type, object_id): liked}
+    keys = {state_key(model_type, object_id, user_id): (model_type, object_id) for model_type, object_id in items}
+    found = get_buffer_cache().get_many(list(keys))
+    return {keys[key]: bool(value) for key, value in found.items()}
+
+
+def insert_likes(content_type_id: int, pairs: List[Tuple[int, int]], now: Any) -> List[int]:
+    """
+    (object_id, user_id) 별 활성 좋아요를 INSERT ... ON CONFLICT DO NOTHING 으로 만들고 실제로 추가된 행의 object_id 를 반환
+
+    조회 이후 API 등으로 먼저 생긴 좋아요는 활성 좋아요 유니크 제약에 걸려 빠지므로 카운터에 더하지 않습니다.
+    """
+    if not pairs:
+        return []
+    table = connection.ops.quote_name(Like._meta.db_table)
+    sql = f"""
+        INSERT INTO {table} (user_id, content_type_id, object_id, created_at, updated_at)
+        SELECT t.user_id, %s, t.object_id, %s, %s FROM unnest(%s::bigint[], %s::bigint[]) AS t(object_id, user_id)
+        ON CONFLICT DO NOTHING
+        RETURNING object_id
+    """
+    params = [content_type_id, now, now, [object_id for object_id, _ in pairs], [user_id for _, user_id in pairs]]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def delete_likes(like_ids: List[int], now: Any) -> List[int]:
+    # 아직 활성인 좋아요만 soft delete 하고 실제로 삭제된 행의 object_id 를 반환 (이미 취소된 좋아요는 카운터에서 빼지 않음)
+    if not like_ids:
+        return []
+    table = connection.ops.quote_name(Like._meta.db_table)
+    sql = f"""
+        UPDATE {table} SET deleted_at = %s, updated_at = %s
+        WHERE id = ANY(%s) AND deleted_at IS NULL
+        RETURNING object_id
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [now, now, like_ids])
+        return [row[0] for row in cursor.fetchall()]
+
+
+def apply_states(states: Dict[LikeKey, bool]) -> Dict[Tuple[str, int], int]:
+    """
+    최종 좋아요 상태를 DB 에 반영하고 대상 별 실제 증감을 반환
+
+    대상 모델(content type) 별로 기존 좋아요 조회 1번 + INSERT / UPDATE 1번씩 + 대상 별 카운터 UPDATE 를 실행합니다.
+    카운터는 INSERT / UPDATE 가 RETURNING 으로 돌려준 행 (실제로 바뀐 행) 만큼만 증감합니다.
+    """
+    content_types = likeable_content_types()
+    by_type: Dict[str, Dict[Tuple[int, int], bool]] = defaultdict(dict)
+    for (model_type, object_id, user_id), liked in states.items():
+        by_type[model_type][(object_id, user_id)] = liked
+
+    applied: Dict[Tuple[str, int], int] = {}
+    now = timezone.now()
+    for model_type, targets in by_type.items():
+        content_type = content_types[model_type]
+        object_ids = {object_id for object_id, _ in targets}
+        # 삭제된 게시글 / 댓글에 대한 기록은 버림
+        existing_targets: Set[int] = set(
+            LIKEABLE_MODELS[model_type]._default_manager.filter(id__in=object_ids).values_list("id", flat=True)
+        )
+        active = {
+            (object_id, user_id): like_id
+            for object_id, user_id, like_id in Like.objects.filter(
+                content_type=content_type,
+                object_id__in=object_ids,
+                user_id__in={user_id for _, user_id in targets},
+            ).values_list("object_id", "user_id", "id")
+        }
+
+        to_create: List[Tuple[int, int]] = []
+        to_delete: List[int] = []
+        for (object_id, user_id), liked in targets.items():
+            if object_id not in existing_targets:
+                continue
+            like_id = active.get((object_id, user_id))
+            if liked and like_id is None:
+                to_create.append((object_id, user_id))
+            elif not liked and like_id is not None:
+                to_delete.append(like_id)
+
+        changes: Dict[int, int] = defaultdict(int)
+        with transaction.atomic():
+            for object_id in insert_likes(content_type.id, to_create, now):
+                changes[object_id] += 1
+            for object_id in delete_likes(to_delete, now):
+                changes[object_id] -= 1
+            for object_id, delta in changes.items():
+                if delta:
+                    adjust_likes_count(LIKEABLE_MODELS[model_type], object_id, delta)
+        for object_id in object_ids:
+            applied[(model_type, object_id)] = changes.get(object_id, 0)
+    return applied
+
+
+def entry_write_expired(cache: BaseCache, seq: int) -> bool:
+    # seq 의 기록이 처음 비어 있는 것을 본 뒤 ENTRY_WRITE_GRACE 가 지났는지 (그 전까지는 쓰는 중으로 보고 기다림)
+    stalled = cache.get(STALL_KEY)
+    now = time.time()
+    if not stalled or stalled[0] != seq:
+        cache.set(STALL_KEY, (seq, now), timeout=None)
+        return False
+    return bool(now - stalled[1] >= ENTRY_WRITE_GRACE)
+
+
+def flush(batch_size: int = 1000) -> int:
+    """
+    버퍼에 쌓인 기록을 seq 순서대로 DB 에 반영하고 반영한 (사용자, 대상) 수를 반환
+
+    처음으로 비어 있는 seq (번호만 받고 아직 기록을 쓰지 않은 요청) 앞에서 멈추고 다음 flush 에서 이어서 반영합니다.
+    여러 워커에서 동시에 실행되지 않도록 캐시 락을 잡으며, 락을 잡지 못하면 아무것도 하지 않습니다.
+    """
+    cache = get_buffer_cache()
+    if not cache.add(LOCK_KEY, 1, timeout=300):
+        return 0
+    try:
+        flushed = 0
+        last = int(cache.get(FLUSHED_KEY, 0))
+        current = int(cache.get(SEQ_KEY, 0))
+        while last < current:
+            end = min(last + batch_size, current)
+            entries = cache.get_many([entry_key(seq) for seq in range(last + 1, end + 1)])
+            upto = last
+            while upto < end and entry_key(upto + 1) in entries:
+                upto += 1
+            if upto == last:
+                if not entry_write_expired(cache, last + 1):
+                    break
+                # 기록을 쓰지 못하고 종료된 요청 - 상태 / 증감도 쓰이지 않았으므로 건너뜀
+                last += 1
+                cache.set(FLUSHED_KEY, last, timeout=None)
+                continue
+
+            # seq 순서대로 읽어 (사용자, 대상) 별 이 구간의 마지막 상태와 대상 별 기록 증감 합을 구함
+            states: Dict[LikeKey, bool] = {}
+            deltas: Dict[Tuple[str, int], int] = defaultdict(int)
+            for seq in range(last + 1, upto + 1):
+                model_type, object_id, user_id, liked = entries[entry_key(seq)]
+                states[(model_type, object_id, user_id)] = liked
+                deltas[(model_type, object_id)] += 1 if liked else -1
+
+            apply_states(states)
+            # DB 에 반영한 기록의 증감을 되돌림 (삭제된 대상처럼 DB 에 반영되지 않은 기록도 버퍼에서는 빠짐)
+            for (model_type, object_id), delta in deltas.items():
+                if delta:
+                    incr(cache, delta_key(model_type, object_id), -delta)
+            # 반영된 상태는 TTL 까지 조회 캐시로 남겨 둠 (이후 다시 기록되면 만료 없이 덮어씀)
+            for key in states:
+                cache.touch(state_key(*key), buffer_timeout())
+            cache.delete_many([entry_key(seq) for seq in range(last + 1, upto + 1)])
+            cache.set(FLUSHED_KEY, upto, timeout=None)
+            flushed += len(states)
+            last = upto
+            if upto < end:
+                # 비어 있는 seq 앞에서 멈춤
+                break
+        return flushed
+    finally:
+        cache.delete(LOCK_KEY)
+
+
+def buffered_likes_count(model_type: str, object_id: int, likes_count: Optional[int]) -> Optional[int]:
+    # DB 카운터에 버퍼의 증감을 더한 좋아요 수 (대상이 없으면 None)
+    if likes_count is None or not is_enabled():
+        return likes_count
+    return max(likes_count + pending_deltas(model_type, [object_id]).get(object_id, 0), 0)
+
+
+def merge_likes_counts(model_type: str, rows: Any) -> Any:
+    # 직렬화된 게시글 목록 / 상세의 likes_count 에 버퍼의 증감을 반영 (캐시 조회 1번)
+    if not is_enabled() or not rows:
+        return rows
+    deltas = pending_deltas(model_type, [row["id"] for row in rows])
+    for row in rows:
+        if row["id"] in deltas:
+            row["likes_count"] = max(row["likes_count"] + deltas[row["id"]], 0)
+    return rows
+
+
+def merge_pending(user: Any, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # 좋아요 여부 일괄 조회 결과에 버퍼의 좋아요 여부 / 증감을 반영
+    if not is_enabled() or not results:
+        return results
+    items = [(result["model_type"], result["object_id"]) for result in results]
+    deltas: Dict[Tuple[str, int], int] = {}
+    for model_type in {model_type for model_type, _ in items}:
+        ids = [object_id for item_type, object_id in items if item_type == model_type]
+        for object_id, delta in pending_deltas(model_type, ids).items():
+            deltas[(model_type, object_id)] = delta
+    states = pending_states(user.id, items) if user is not None and user.is_authenticated else {}
+    for result, item in zip(results, items):
+        result["likes_count"] = max(result["likes_count"] + deltas.get(item, 0), 0)
+        if item in states:
+            result["liked"] = states[item]
+    return results
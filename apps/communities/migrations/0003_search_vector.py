@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0002_initial"),
+        ("players", "0005_search_vector"),
+        ("teams", "0002_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerpost",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector("title", config="simple", weight="A"),
+                    "||",
+                    django.contrib.postgres.search.SearchVector("content", config="simple", weight="B"),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="teampost",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector("title", config="simple", weight="A"),
+                    "||",
+                    django.contrib.postgres.search.SearchVector("content", config="simple", weight="B"),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="playerpost",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="player_post_search_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="teampost",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="team_post_search_idx"),
+        ),
+    ]
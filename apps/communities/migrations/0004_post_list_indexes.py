@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0003_search_vector"),
+        ("players", "0005_search_vector"),
+        ("teams", "0002_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="playerpost",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["player", "-created_at", "-id"],
+                name="player_post_list_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teampost",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["team", "-created_at", "-id"],
+                name="team_post_list_idx",
+            ),
+        ),
+    ]
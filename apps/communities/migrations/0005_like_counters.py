@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:15
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Now
+
+LIKEABLE_MODELS = ("teampost", "teamcomment", "playerpost", "playercomment")
+
+
+def dedupe_active_likes(apps, schema_editor):
+    # 유니크 제약 추가 전, 동시 요청으로 중복 생성된 활성 좋아요는 가장 먼저 생성된 1개만 남기고 삭제 처리
+    Like = apps.get_model("communities", "Like")
+    duplicates = (
+        Like.objects.filter(deleted_at__isnull=True)
+        .values("user_id", "content_type_id", "object_id")
+        .annotate(keep_id=Min("id"), total=Count("id"))
+        .filter(total__gt=1)
+    )
+    for row in duplicates:
+        Like.objects.filter(
+            user_id=row["user_id"],
+            content_type_id=row["content_type_id"],
+            object_id=row["object_id"],
+            deleted_at__isnull=True,
+        ).exclude(id=row["keep_id"]).update(deleted_at=Now())
+
+
+def backfill_likes_count(apps, schema_editor):
+    # 기존 활성 좋아요 수로 카운터를 채움
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Like = apps.get_model("communities", "Like")
+    for model_name in LIKEABLE_MODELS:
+        content_type = ContentType.objects.filter(app_label="communities", model=model_name).first()
+        if content_type is None:
+            continue
+        active_counts = (
+            Like.objects.filter(content_type=content_type, object_id=OuterRef("pk"), deleted_at__isnull=True)
+            .order_by()
+            .values("object_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        model = apps.get_model("communities", model_name)
+        model.objects.update(likes_count=Coalesce(Subquery(active_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0004_post_list_indexes"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playercomment",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerpost",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamcomment",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teampost",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(dedupe_active_likes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="like",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("user", "content_type", "object_id"),
+                name="like_unique_active",
+            ),
+        ),
+        migrations.RunPython(backfill_likes_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:23
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, FloatField, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Cast, Coalesce, Extract, Greatest, Log
+
+
+def backfill_hot_score(apps, schema_editor):
+    # 기존 게시글 점수 계산 (apps.communities.utils.hot_score_expression 과 같은 식)
+    for post_name, comment_name in (("TeamPost", "TeamComment"), ("PlayerPost", "PlayerComment")):
+        post_model = apps.get_model("communities", post_name)
+        comment_model = apps.get_model("communities", comment_name)
+        comments = (
+            comment_model.objects.filter(post_id=OuterRef("pk"), deleted_at__isnull=True)
+            .order_by()
+            .values("post_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        engagement = F("likes_count") + 2 * Coalesce(Subquery(comments, output_field=IntegerField()), 0)
+        post_model.objects.update(
+            hot_score=Cast(Log(10, Greatest(engagement, 1)), FloatField())
+            + Cast(Extract("created_at", "epoch"), FloatField()) / 45000.0
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_like_counters"),
+        ("players", "0005_search_vector"),
+        ("teams", "0002_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerpost",
+            name="hot_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teampost",
+            name="hot_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="playerpost",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["player", "-hot_score", "-id"],
+                name="player_post_hot_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teampost",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["team", "-hot_score", "-id"],
+                name="team_post_hot_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_hot_score, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0006_post_hot_score"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="playercomment",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["post", "parent", "created_at", "id"],
+                name="player_comment_thread_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamcomment",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["post", "parent", "created_at", "id"],
+                name="team_comment_thread_idx",
+            ),
+        ),
+    ]
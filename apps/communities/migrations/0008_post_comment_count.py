@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:23
+
+from django.db import migrations, models
+from django.db.models import Count, F, FloatField, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Cast, Coalesce, Extract, Greatest, Log
+
+
+def backfill_comment_count(apps, schema_editor):
+    # 기존 활성 댓글 수로 카운터를 채우고 같은 값으로 점수를 다시 계산 (apps.communities.utils.hot_score_expression 과 같은 식)
+    for post_name, comment_name in (("TeamPost", "TeamComment"), ("PlayerPost", "PlayerComment")):
+        post_model = apps.get_model("communities", post_name)
+        comment_model = apps.get_model("communities", comment_name)
+        comments = (
+            comment_model.objects.filter(post_id=OuterRef("pk"), deleted_at__isnull=True)
+            .order_by()
+            .values("post_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        post_model.objects.update(comment_count=Coalesce(Subquery(comments, output_field=IntegerField()), 0))
+        engagement = F("likes_count") + 2 * F("comment_count")
+        post_model.objects.update(
+            hot_score=Cast(Log(10, Greatest(engagement, 1)), FloatField())
+            + Cast(Extract("created_at", "epoch"), FloatField()) / 45000.0
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0007_comment_thread_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerpost",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teampost",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_comment_count, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django_softdelete.models import SoftDeleteModel
 
@@ -13,9 +15,38 @@ class TeamPost(BaseModel, SoftDeleteModel):  # type: ignore
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
     content = models.TextField()
+    # 좋아요 수 (Like 생성 / 취소 시 F() 로 증감하는 비정규화 카운터)
+    likes_count = models.PositiveIntegerField(default=0)
+    # 활성 댓글 수 (댓글 작성 / 삭제 / 복구 시 F() 로 증감하는 비정규화 카운터 - common.signals)
+    comment_count = models.PositiveIntegerField(default=0)
+    # 인기 게시글 점수 (좋아요 / 댓글 수와 작성 시각으로 계산, 좋아요 / 댓글 변경 시 갱신 - utils.hot_score_expression)
+    hot_score = models.FloatField(default=0)
+
+    # 통합 검색용 tsvector (제목 A, 본문 B)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config="simple")
+        + SearchVector("content", weight="B", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "team_post"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="team_post_search_idx"),
+            # 게시글 목록 최신순 keyset 페이지네이션
+            models.Index(
+                fields=["team", "-created_at", "-id"],
+                name="team_post_list_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 인기 게시글 피드 (hot_score 내림차순 상위 N 개를 인덱스 범위 스캔으로 조회)
+            models.Index(
+                fields=["team", "-hot_score", "-id"],
+                name="team_post_hot_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title}"
@@ -25,10 +56,20 @@ class TeamComment(BaseModel, SoftDeleteModel):  # type: ignore
     post = models.ForeignKey(TeamPost, on_delete=models.CASCADE, related_name="comments")
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     content = models.TextField()
+    # 좋아요 수 (Like 생성 / 취소 시 F() 로 증감하는 비정규화 카운터)
+    likes_count = models.PositiveIntegerField(default=0)
     parent = models.ForeignKey("self", null=True, blank=True, on_delete=models.CASCADE, related_name="replies")
 
     class Meta:
         db_table = "team_comment"
+        indexes = [
+            # 게시글 / 부모 댓글 별 댓글 목록 (created_at, id 순 keyset 페이지네이션, 댓글 트리, 댓글 수 서브쿼리)
+            models.Index(
+                fields=["post", "parent", "created_at", "id"],
+                name="team_comment_thread_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Comment by {self.user} on {self.post}"
@@ -39,9 +80,38 @@ class PlayerPost(BaseModel, SoftDeleteModel):  # type: ignore
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
     content = models.TextField()
+    # 좋아요 수 (Like 생성 / 취소 시 F() 로 증감하는 비정규화 카운터)
+    likes_count = models.PositiveIntegerField(default=0)
+    # 활성 댓글 수 (댓글 작성 / 삭제 / 복구 시 F() 로 증감하는 비정규화 카운터 - common.signals)
+    comment_count = models.PositiveIntegerField(default=0)
+    # 인기 게시글 점수 (좋아요 / 댓글 수와 작성 시각으로 계산, 좋아요 / 댓글 변경 시 갱신 - utils.hot_score_expression)
+    hot_score = models.FloatField(default=0)
+
+    # 통합 검색용 tsvector (제목 A, 본문 B)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config="simple")
+        + SearchVector("content", weight="B", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "player_post"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="player_post_search_idx"),
+            # 게시글 목록 최신순 keyset 페이지네이션
+            models.Index(
+                fields=["player", "-created_at", "-id"],
+                name="player_post_list_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 인기 게시글 피드 (hot_score 내림차순 상위 N 개를 인덱스 범위 스캔으로 조회)
+            models.Index(
+                fields=["player", "-hot_score", "-id"],
+                name="player_post_hot_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title}"
@@ -51,10 +121,20 @@ class PlayerComment(BaseModel, SoftDeleteModel):  # type: ignore
     post = models.ForeignKey(PlayerPost, on_delete=models.CASCADE, related_name="comments")
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     content = models.TextField()
+    # 좋아요 수 (Like 생성 / 취소 시 F() 로 증감하는 비정규화 카운터)
+    likes_count = models.PositiveIntegerField(default=0)
     parent = models.ForeignKey("self", null=True, blank=True, on_delete=models.CASCADE, related_name="replies")
 
     class Meta:
         db_table = "player_comment"
+        indexes = [
+            # 게시글 / 부모 댓글 별 댓글 목록 (created_at, id 순 keyset 페이지네이션, 댓글 트리, 댓글 수 서브쿼리)
+            models.Index(
+                fields=["post", "parent", "created_at", "id"],
+                name="player_comment_thread_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Comment by {self.user} on {self.post}"
@@ -69,3 +149,11 @@ class Like(BaseModel, SoftDeleteModel):  # type: ignore
 
     class Meta:
         db_table = "like"
+        constraints = [
+            # 삭제되지 않은 좋아요는 사용자 / 대상 별로 1개 (중복 좋아요 동시 요청 방지, 대상 조회 인덱스 겸용)
+            models.UniqueConstraint(
+                fields=["user", "content_type", "object_id"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="like_unique_active",
+            ),
+        ]
@@ -3,6 +3,10 @@ from typing import Any, Dict, List
 from rest_framework import serializers
 
 from .models import Like, PlayerComment, PlayerPost, TeamComment, TeamPost
+from .utils import LIKEABLE_MODELS, load_comment_trees, load_reply_tree
+
+# 좋아요 여부 일괄 조회 최대 항목 수
+LIKE_STATUS_MAX_ITEMS = 200
 
 
 # 팀 게시글에 달린 댓글을 직렬화
@@ -11,21 +15,34 @@ class TeamCommentSerializer(serializers.ModelSerializer[TeamComment]):
 
     class Meta:
         model = TeamComment
-        fields = ["id", "user", "content", "parent", "created_at", "replies"]
+        fields = ["id", "user", "content", "parent", "created_at", "likes_count", "replies"]
+        read_only_fields = ("likes_count",)
 
     def get_replies(self, obj: TeamComment) -> List[Dict[str, Any]]:
-        qs = obj.replies.all()
-        return TeamCommentSerializer(qs, many=True).data  # type: ignore
+        # 댓글마다 재귀 쿼리를 하지 않고 게시글 댓글을 한 번에 읽어 깊이 / 개수 제한된 트리로 반환
+        return load_reply_tree(obj)
 
 
 # 팀 게시글과 연결된 댓글을 포함한 전체 데이터 직렬화
 class TeamPostSerializer(serializers.ModelSerializer[TeamPost]):
-    comments = TeamCommentSerializer(many=True, read_only=True)  # 댓글 목록 포함
+    comments = serializers.SerializerMethodField()  # 최상위 댓글과 답글 트리 포함
 
     class Meta:
         model = TeamPost
-        fields = ["id", "team", "user", "title", "content", "created_at", "updated_at", "comments"]
-        read_only_fields = ("team", "user", "created_at", "updated_at")
+        fields = ["id", "team", "user", "title", "content", "created_at", "updated_at", "likes_count", "comments"]
+        read_only_fields = ("team", "user", "created_at", "updated_at", "likes_count")
+
+    def get_comments(self, obj: TeamPost) -> List[Dict[str, Any]]:
+        return load_comment_trees(TeamComment, [obj.id])[obj.id]
+
+
+# 팀 게시글 목록용 요약 (본문 / 댓글 트리 제외, 댓글 수와 좋아요 수 포함)
+class TeamPostSummarySerializer(serializers.ModelSerializer[TeamPost]):
+    comment_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = TeamPost
+        fields = ["id", "team", "user", "title", "created_at", "updated_at", "comment_count", "likes_count"]
 
 
 # 선수 게시글에 달린 댓글을 직렬화
@@ -34,21 +51,34 @@ class PlayerCommentSerializer(serializers.ModelSerializer[PlayerComment]):
 
     class Meta:
         model = PlayerComment
-        fields = ["id", "user", "content", "parent", "created_at", "replies"]
+        fields = ["id", "user", "content", "parent", "created_at", "likes_count", "replies"]
+        read_only_fields = ("likes_count",)
 
     def get_replies(self, obj: PlayerComment) -> List[Dict[str, Any]]:
-        qs = obj.replies.all()
-        return PlayerCommentSerializer(qs, many=True).data  # type: ignore
+        # 댓글마다 재귀 쿼리를 하지 않고 게시글 댓글을 한 번에 읽어 깊이 / 개수 제한된 트리로 반환
+        return load_reply_tree(obj)
 
 
 # 선수 게시글과 연결된 댓글을 포함한 전체 데이터 직렬화
 class PlayerPostSerializer(serializers.ModelSerializer[PlayerPost]):
-    comments = PlayerCommentSerializer(many=True, read_only=True)
+    comments = serializers.SerializerMethodField()
 
     class Meta:
         model = PlayerPost
-        fields = ["id", "player", "user", "title", "content", "created_at", "updated_at", "comments"]
-        read_only_fields = ("player", "user", "created_at", "updated_at")
+        fields = ["id", "player", "user", "title", "content", "created_at", "updated_at", "likes_count", "comments"]
+        read_only_fields = ("player", "user", "created_at", "updated_at", "likes_count")
+
+    def get_comments(self, obj: PlayerPost) -> List[Dict[str, Any]]:
+        return load_comment_trees(PlayerComment, [obj.id])[obj.id]
+
+
+# 선수 게시글 목록용 요약 (본문 / 댓글 트리 제외, 댓글 수와 좋아요 수 포함)
+class PlayerPostSummarySerializer(serializers.ModelSerializer[PlayerPost]):
+    comment_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = PlayerPost
+        fields = ["id", "player", "user", "title", "created_at", "updated_at", "comment_count", "likes_count"]
 
 
 # 댓글과 게시판 좋아요
@@ -56,3 +86,13 @@ class LikeSerializer(serializers.ModelSerializer[Like]):
     class Meta:
         model = Like
         fields = ["id", "user", "content_type", "object_id"]
+
+
+# 좋아요 여부 일괄 조회 요청 항목
+class LikeStatusItemSerializer(serializers.Serializer[Any]):
+    model_type = serializers.ChoiceField(choices=list(LIKEABLE_MODELS))
+    object_id = serializers.IntegerField(min_value=1)
+
+
+class LikeStatusRequestSerializer(serializers.Serializer[Any]):
+    items = serializers.ListField(child=LikeStatusItemSerializer(), allow_empty=False, max_length=LIKE_STATUS_MAX_ITEMS)
@@ -1,3 +1,384 @@
-from django.test import TestCase
+from __future__ import annotations
 
-# Create your tests here.
+import base64
+import json
+import math
+from datetime import timedelta
+from io import StringIO
+from typing import Any, ClassVar
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.teams.models import Team
+from apps.users.models import User
+
+from . import like_buffer
+from .models import Like, TeamComment, TeamPost
+from .utils import likeable_content_types, refresh_hot_score
+
+
+@override_settings(COMMENT_TREE_MAX_DEPTH=2, COMMENT_TREE_PAGE_SIZE=2)
+class CommentTreeTest(APITestCase):
+    user: ClassVar[User]
+    team: ClassVar[Team]
+    post: ClassVar[TeamPost]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(email="user@example.com", password="pass", nickname="user")
+        cls.team = Team.objects.create(name="T1")
+        cls.post = TeamPost.objects.create(team=cls.team, user=cls.user, title="title", content="content")
+
+    def comment(self, post: TeamPost, parent: TeamComment | None = None, content: str = "comment") -> TeamComment:
+        return TeamComment.objects.create(post=post, user=self.user, content=content, parent=parent)
+
+    def test_post_detail_comment_tree_is_depth_and_page_limited(self) -> None:
+        root = self.comment(self.post, content="root")
+        for i in range(3):
+            reply = self.comment(self.post, parent=root, content=f"reply{i}")
+        self.comment(self.post, parent=reply, content="too deep")
+
+        url = reverse("team-post-detail", args=[self.team.id, self.post.id])
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        comments: list[dict[str, Any]] = response.data["comments"]
+        self.assertEqual(len(comments), 1)
+        self.assertEqual(comments[0]["reply_count"], 3)
+        # 단계 별로 page_size(2) 개만 포함
+        self.assertEqual([r["content"] for r in comments[0]["replies"]], ["reply0", "reply1"])
+        # max_depth(2) 보다 깊은 답글은 포함하지 않음
+        self.assertTrue(all(r["replies"] == [] for r in comments[0]["replies"]))
+
+        # 댓글이 늘어나도 쿼리 수는 같음
+        for _ in range(5):
+            self.comment(self.post, parent=root)
+        with CaptureQueriesContext(connection) as more:
+            self.client.get(url)
+        self.assertEqual(len(ctx.captured_queries), len(more.captured_queries))
+
+    def test_post_list_returns_paginated_summaries_with_counts(self) -> None:
+        self.comment(self.post, parent=self.comment(self.post))
+        self.client.force_authenticate(self.user)
+        self.client.post(reverse("like-toggle", args=["teampost", self.post.id]))
+        self.client.force_authenticate(None)
+        for i in range(2):
+            TeamPost.objects.create(team=self.team, user=self.user, title=f"post{i}", content="content")
+
+        url = reverse("team-post-list-create", args=[self.team.id])
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"page_size": "2"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p["title"] for p in response.data["results"]], ["post1", "post0"])
+        self.assertNotIn("comments", response.data["results"][0])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 1)
+        summary = response.data["results"][0]
+        self.assertEqual((summary["id"], summary["comment_count"], summary["likes_count"]), (self.post.id, 2, 1))
+        self.assertIsNone(response.data["next"])
+
+    def test_post_list_rejects_mistyped_cursor(self) -> None:
+        url = reverse("team-post-list-create", args=[self.team.id])
+        # 디코딩은 되지만 값의 타입이 (-created_at, -id) 와 맞지 않는 커서
+        cursors: list[list[Any]] = [["abc", 1], [{}, 1], [timezone.now().isoformat(), "abc"], [[], None]]
+        for values in cursors:
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            response = self.client.get(url, {"cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, values)
+
+    def test_list_comments_by_level_with_cursor(self) -> None:
+        root = self.comment(self.post, content="root")
+        for i in range(3):
+            self.comment(self.post, parent=root, content=f"reply{i}")
+
+        url = reverse("team-comment-create", args=[self.team.id, self.post.id])
+        response = self.client.get(url, {"parent": root.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([c["content"] for c in response.data["results"]], ["reply0", "reply1"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([c["content"] for c in response.data["results"]], ["reply2"])
+        self.assertIsNone(response.data["next"])
+
+        # depth=1 이면 답글 트리를 포함하지 않음
+        response = self.client.get(url, {"depth": 1})
+        self.assertEqual(response.data["results"][0]["reply_count"], 3)
+        self.assertEqual(response.data["results"][0]["replies"], [])
+
+
+class HotPostFeedTest(APITestCase):
+    user: ClassVar[User]
+    team: ClassVar[Team]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(email="user@example.com", password="pass", nickname="user")
+        cls.team = Team.objects.create(name="T1")
+
+    def test_hot_feed_orders_by_likes_comments_and_age(self) -> None:
+        old = TeamPost.objects.create(team=self.team, user=self.user, title="old", content="content")
+        quiet = TeamPost.objects.create(team=self.team, user=self.user, title="quiet", content="content")
+        busy = TeamPost.objects.create(team=self.team, user=self.user, title="busy", content="content")
+        # 하루 전 글은 반응이 같아도 새 글보다 점수가 낮음
+        TeamPost.objects.filter(id=old.id).update(created_at=old.created_at - timedelta(days=1))
+        refresh_hot_score(TeamPost, old.id)
+
+        url = reverse("team-post-hot", args=[self.team.id])
+        self.assertEqual([p["title"] for p in self.client.get(url).data["results"]], ["busy", "quiet", "old"])
+
+        # 좋아요 / 댓글이 바뀌면 해당 게시글 점수만 갱신
+        self.client.force_authenticate(self.user)
+        self.client.post(reverse("like-toggle", args=["teampost", quiet.id]))
+        TeamComment.objects.create(post=quiet, user=self.user, content="comment")
+        self.client.force_authenticate(None)
+        response = self.client.get(url, {"page_size": "2"})
+        self.assertEqual([p["title"] for p in response.data["results"]], ["quiet", "busy"])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([p["title"] for p in response.data["results"]], ["old"])
+
+        busy.refresh_from_db()
+        quiet.refresh_from_db()
+        self.assertAlmostEqual(quiet.hot_score - busy.hot_score, math.log10(3), places=3)
+
+    def test_comment_count_counter(self) -> None:
+        post = TeamPost.objects.create(team=self.team, user=self.user, title="post", content="content")
+        comment = TeamComment.objects.create(post=post, user=self.user, content="comment")
+        TeamComment.objects.create(post=post, user=self.user, content="reply", parent=comment)
+        TeamComment.objects.create(post=post, user=self.user, content="other")
+        post.refresh_from_db()
+        self.assertEqual(post.comment_count, 3)
+
+        # 답글까지 cascade 로 soft delete 되고, 이미 삭제된 댓글을 다시 삭제해도 한 번만 감소
+        comment.delete()
+        TeamComment.global_objects.get(id=comment.id).delete()
+        post.refresh_from_db()
+        self.assertEqual(post.comment_count, 1)
+        hot_score = post.hot_score
+        refresh_hot_score(TeamPost, post.id)
+        post.refresh_from_db()
+        self.assertAlmostEqual(post.hot_score, hot_score)
+
+        # 좋아요는 댓글 테이블을 읽지 않고 카운터 컬럼으로 점수를 계산
+        self.client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(reverse("like-toggle", args=["teampost", post.id]))
+        self.assertFalse([q["sql"] for q in queries.captured_queries if "team_comment" in q["sql"]])
+        post.refresh_from_db()
+        self.assertEqual((post.likes_count, post.comment_count), (1, 1))
+
+
+class LikeTest(APITestCase):
+    user: ClassVar[User]
+    post: ClassVar[TeamPost]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(email="user@example.com", password="pass", nickname="user")
+        team = Team.objects.create(name="T1")
+        cls.post = TeamPost.objects.create(team=team, user=cls.user, title="title", content="content")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+        self.url = reverse("like-toggle", args=["teampost", self.post.id])
+
+    def test_like_is_idempotent_and_updates_counter(self) -> None:
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["likes_count"], 1)
+
+        # 같은 요청을 반복해도 좋아요 / 카운터가 늘어나지 않음
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["likes_count"], 1)
+        self.assertEqual(Like.objects.filter(object_id=self.post.id).count(), 1)
+
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["likes_count"], 0)
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # 취소 후 다시 좋아요 가능 (삭제된 좋아요는 유니크 제약 대상이 아님)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+
+    def test_withdraw_decrements_likes_count_and_reconcile_fixes_drift(self) -> None:
+        liker = User.objects.create_user(email="liker@example.com", password="pass", nickname="liker")
+        self.client.force_authenticate(liker)
+        self.client.post(self.url)
+        self.client.force_authenticate(self.user)
+        self.client.post(self.url)
+        self.post.refresh_from_db()
+        hot_score = self.post.hot_score
+
+        # 탈퇴 시 cascade 로 soft delete 된 좋아요만큼 카운터 / 인기 점수도 내려감
+        self.client.force_authenticate(liker)
+        self.assertEqual(self.client.post(reverse("withdraw")).status_code, status.HTTP_200_OK)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertLess(self.post.hot_score, hot_score)
+
+        # 이미 어긋난 카운터는 보정 명령어로 맞춤
+        TeamPost.objects.filter(id=self.post.id).update(likes_count=5)
+        call_command("reconcile_like_counts", stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertAlmostEqual(self.post.hot_score, hot_score - math.log10(2))
+
+    def test_like_missing_target(self) -> None:
+        response = self.client.post(reverse("like-toggle", args=["teampost", self.post.id + 100]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Like.objects.exists())
+
+    def test_like_status_batch(self) -> None:
+        comment = TeamComment.objects.create(post=self.post, user=self.user, content="comment")
+        other = TeamPost.objects.create(team=self.post.team, user=self.user, title="other", content="content")
+        self.client.post(self.url)
+
+        items = [
+            {"model_type": "teampost", "object_id": self.post.id},
+            {"model_type": "teampost", "object_id": other.id},
+            {"model_type": "teamcomment", "object_id": comment.id},
+        ]
+        url = reverse("like-status")
+        likeable_content_types()  # ContentType 캐시는 프로세스 당 처음 한 번만 조회
+        # 대상 모델 별로 쿼리 1번
+        with self.assertNumQueries(2):
+            response = self.client.post(url, {"items": items}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(r["object_id"], r["liked"], r["likes_count"]) for r in response.data["results"]],
+            [(self.post.id, True, 1), (other.id, False, 0), (comment.id, False, 0)],
+        )
+
+        self.client.force_authenticate(None)
+        response = self.client.post(url, {"items": items[:1]}, format="json")
+        self.assertEqual(response.data["results"][0]["liked"], False)
+
+        response = self.client.post(url, {"items": [{"model_type": "user", "object_id": 1}]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(LIKE_WRITE_BEHIND=True)
+    def test_write_behind_buffers_likes_until_flush(self) -> None:
+        cache.clear()
+        status_url = reverse("like-status")
+        items = {"items": [{"model_type": "teampost", "object_id": self.post.id}]}
+
+        # 좋아요 -> 취소 -> 좋아요 를 버퍼에 기록 (DB 쓰기 없음)
+        with self.assertNumQueries(2):  # 대상 카운터 조회 + 좋아요 여부 조회
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["likes_count"], 1)
+        self.assertEqual(self.client.delete(self.url).data["likes_count"], 0)
+        self.client.post(self.url)
+        self.assertFalse(Like.objects.exists())
+
+        # 조회 시 버퍼의 증감 / 좋아요 여부를 반영
+        result = self.client.post(status_url, items, format="json").data["results"][0]
+        self.assertEqual((result["liked"], result["likes_count"]), (True, 1))
+        team_id = self.post.team_id
+        for name in ("team-post-list-create", "team-post-hot"):
+            response = self.client.get(reverse(name, args=[team_id]))
+            self.assertEqual(response.data["results"][0]["likes_count"], 1)
+        response = self.client.get(reverse("team-post-detail", args=[team_id, self.post.id]))
+        self.assertEqual(response.data["likes_count"], 1)
+
+        # flush 후에는 (사용자, 대상) 별 최종 상태만 DB 에 반영
+        call_command("flush_like_buffer", stdout=StringIO())
+        self.assertEqual(Like.objects.filter(object_id=self.post.id).count(), 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        result = self.client.post(status_url, items, format="json").data["results"][0]
+        self.assertEqual((result["liked"], result["likes_count"]), (True, 1))
+
+        self.client.delete(self.url)
+        call_command("flush_like_buffer", stdout=StringIO())
+        self.assertFalse(Like.objects.exists())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 0)
+
+    def test_write_behind_requires_shared_cache(self) -> None:
+        self.assertEqual(like_buffer.check_buffer_cache(None), [])
+        with override_settings(LIKE_WRITE_BEHIND=True):
+            self.assertEqual([error.id for error in like_buffer.check_buffer_cache(None)], ["communities.E001"])
+        redis = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://cache"}}
+        with override_settings(LIKE_WRITE_BEHIND=True, CACHES=redis):
+            self.assertEqual(like_buffer.check_buffer_cache(None), [])
+
+    def test_write_behind_counts_only_inserted_likes(self) -> None:
+        # flush 가 조회한 뒤 API 로 먼저 생긴 좋아요는 INSERT 되지 않으므로 카운터에 더하지 않음
+        content_type = likeable_content_types()["teampost"]
+        Like.objects.create(user=self.user, content_type=content_type, object_id=self.post.id)
+        other = User.objects.create_user(email="other@example.com", password="pass", nickname="other")
+        now = timezone.now()
+        pairs = [(self.post.id, self.user.id), (self.post.id, other.id)]
+        self.assertEqual(like_buffer.insert_likes(content_type.id, pairs, now), [self.post.id])
+        like_ids = list(Like.objects.values_list("id", flat=True))
+        self.assertEqual(len(like_buffer.delete_likes(like_ids, now)), 2)
+        self.assertEqual(like_buffer.delete_likes(like_ids, now), [])
+
+    @override_settings(LIKE_WRITE_BEHIND=True)
+    def test_write_behind_transition_is_atomic(self) -> None:
+        cache.clear()
+        # 다른 요청이 같은 (사용자, 대상) 의 상태를 바꾸는 중이면 증감하지 않음
+        lock = like_buffer.transition_lock_key("teampost", self.post.id, self.user.id)
+        cache.add(lock, 1)
+        with mock.patch.object(like_buffer, "TRANSITION_LOCK_WAIT", 0):
+            self.assertFalse(like_buffer.record("teampost", self.post.id, self.user.id, True))
+        cache.delete(lock)
+        self.assertEqual(like_buffer.pending_deltas("teampost", [self.post.id]), {})
+
+        # 더블 탭은 첫 요청만 상태를 바꿈
+        self.assertTrue(like_buffer.record("teampost", self.post.id, self.user.id, True))
+        self.assertFalse(like_buffer.record("teampost", self.post.id, self.user.id, True))
+        self.assertEqual(like_buffer.pending_deltas("teampost", [self.post.id]), {self.post.id: 1})
+
+        like_buffer.flush()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertEqual(like_buffer.pending_deltas("teampost", [self.post.id]), {self.post.id: 0})
+
+    @override_settings(LIKE_WRITE_BEHIND=True)
+    def test_write_behind_flush_stops_at_missing_entry(self) -> None:
+        cache.clear()
+        other = User.objects.create_user(email="other@example.com", password="pass", nickname="other")
+        like_buffer.record("teampost", self.post.id, self.user.id, True)
+        # 번호만 받고 아직 기록을 쓰지 않은 요청 (seq 2) 뒤에 다른 기록 (seq 3)
+        like_buffer.incr(cache, like_buffer.SEQ_KEY)
+        like_buffer.record("teampost", self.post.id, other.id, True)
+
+        self.assertEqual(like_buffer.flush(batch_size=10), 1)
+        self.assertEqual(list(Like.objects.values_list("user_id", flat=True)), [self.user.id])
+        self.assertEqual(like_buffer.pending_deltas("teampost", [self.post.id]), {self.post.id: 1})
+
+        # 기록이 쓰이면 이어서 반영
+        cache.set(like_buffer.entry_key(2), ("teampost", self.post.id, self.user.id, False), timeout=None)
+        cache.set(like_buffer.state_key("teampost", self.post.id, self.user.id), False, timeout=None)
+        like_buffer.incr(cache, like_buffer.delta_key("teampost", self.post.id), -1)
+        like_buffer.flush(batch_size=10)
+        self.assertEqual(list(Like.objects.values_list("user_id", flat=True)), [other.id])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertEqual(like_buffer.pending_deltas("teampost", [self.post.id]), {self.post.id: 0})
+
+        # 끝내 쓰이지 않은 seq 는 ENTRY_WRITE_GRACE 이후 건너뜀
+        like_buffer.incr(cache, like_buffer.SEQ_KEY)
+        like_buffer.record("teampost", self.post.id, self.user.id, True)
+        with mock.patch.object(like_buffer, "ENTRY_WRITE_GRACE", 0):
+            self.assertEqual(like_buffer.flush(), 0)
+            self.assertEqual(like_buffer.flush(), 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 2)
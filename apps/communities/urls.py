@@ -2,12 +2,15 @@ from django.urls import path
 
 from .views import (
     LikeAPIView,
+    LikeStatusAPIView,
     PlayerCommentCreateAPIView,
     PlayerCommentDetailAPIView,
+    PlayerHotPostListAPIView,
     PlayerPostDetailAPIView,
     PlayerPostListCreateAPIView,
     TeamCommentCreateAPIView,
     TeamCommentDetailAPIView,
+    TeamHotPostListAPIView,
     TeamPostDetailAPIView,
     TeamPostListCreateAPIView,
 )
@@ -15,13 +18,17 @@ from .views import (
 urlpatterns = [
     # 팀 커뮤니티 게시글 목록 조회 및 생성
     path("team/<int:team_id>/posts/", TeamPostListCreateAPIView.as_view(), name="team-post-list-create"),
+    # 팀 커뮤니티 인기 게시글 조회
+    path("team/<int:team_id>/posts/hot/", TeamHotPostListAPIView.as_view(), name="team-post-hot"),
     # 팀 커뮤니티 게시글 상세 조회, 수정, 삭제
     path("team/<int:team_id>/posts/<int:post_id>/", TeamPostDetailAPIView.as_view(), name="team-post-detail"),
     # 선수 커뮤니티 게시글 목록 조회 및 생성
     path("player/<int:player_id>/posts/", PlayerPostListCreateAPIView.as_view(), name="player-post-list-create"),
+    # 선수 커뮤니티 인기 게시글 조회
+    path("player/<int:player_id>/posts/hot/", PlayerHotPostListAPIView.as_view(), name="player-post-hot"),
     # 선수 커뮤니티 게시글 상세 조회, 수정, 삭제
     path("player/<int:player_id>/posts/<int:post_id>/", PlayerPostDetailAPIView.as_view(), name="player-post-detail"),
-    # 팀 커뮤니티 댓글 작성
+    # 팀 커뮤니티 댓글 목록 조회 및 작성
     path(
         "team/<int:team_id>/posts/<int:post_id>/comments/",
         TeamCommentCreateAPIView.as_view(),
@@ -29,7 +36,7 @@ urlpatterns = [
     ),
     # 팀 커뮤니티 댓글 상세 조회, 수정, 삭제
     path("team/comments/<int:comment_id>/", TeamCommentDetailAPIView.as_view(), name="team-comment-detail"),
-    # 선수 커뮤니티 댓글 작성
+    # 선수 커뮤니티 댓글 목록 조회 및 작성
     path(
         "player/<int:player_id>/posts/<int:post_id>/comments/",
         PlayerCommentCreateAPIView.as_view(),
@@ -37,6 +44,8 @@ urlpatterns = [
     ),
     # 선수 커뮤니티 댓글 상세 조회, 수정, 삭제
     path("player/comments/<int:comment_id>/", PlayerCommentDetailAPIView.as_view(), name="player-comment-detail"),
+    # 커뮤니티 게시판 및 댓글 좋아요 여부 일괄 조회
+    path("like/status/", LikeStatusAPIView.as_view(), name="like-status"),
     # 커뮤니티 게시판 및 댓글 좋아요, 좋아요 취소
     path("like/<str:model_type>/<int:object_id>/", LikeAPIView.as_view(), name="like-toggle"),
 ]
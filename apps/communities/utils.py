@@ -0,0 +1,258 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    FloatField,
+    IntegerField,
+    Model,
+    OuterRef,
+    Subquery,
+    Value,
+)
+from django.db.models.expressions import Combinable
+from django.db.models.functions import Cast, Coalesce, Extract, Greatest, Log
+
+from .models import Like, PlayerComment, PlayerPost, TeamComment, TeamPost
+
+CommentModel = Union[TeamComment, PlayerComment]
+# {부모 댓글 id (최상위는 None): [자식 댓글, ...]}
+CommentChildren = Dict[Optional[int], List[Any]]
+
+# 좋아요를 남길 수 있는 모델 {URL 의 model_type: 모델}
+LIKEABLE_MODELS: Dict[str, Type[Model]] = {
+    "teampost": TeamPost,
+    "playerpost": PlayerPost,
+    "teamcomment": TeamComment,
+    "playercomment": PlayerComment,
+}
+
+
+def comment_tree_max_depth() -> int:
+    return int(getattr(settings, "COMMENT_TREE_MAX_DEPTH", 3))
+
+
+def comment_tree_page_size() -> int:
+    return int(getattr(settings, "COMMENT_TREE_PAGE_SIZE", 20))
+
+
+# 인기 게시글 점수 = log10(좋아요 수 + 댓글 수 x 가중치) + 작성 시각(epoch 초) / 감쇠 시간
+# 작성 시각 항이 점수에 들어가므로 오래된 글은 반응이 감쇠 시간 마다 10배씩 더 많아야 새 글과 같은 점수가 되며,
+# 시간이 지나도 점수를 다시 계산할 필요 없이 좋아요 / 댓글이 바뀔 때만 해당 게시글을 갱신하면 됩니다.
+HOT_SCORE_COMMENT_WEIGHT = 2
+HOT_SCORE_DECAY_SECONDS = 45000
+
+# {게시글 모델: 댓글 모델}
+POST_COMMENT_MODELS: Dict[Type[Model], Type[Model]] = {TeamPost: TeamComment, PlayerPost: PlayerComment}
+
+
+def hot_score_expression(likes_delta: int = 0, comments_delta: int = 0) -> Combinable:
+    """
+    게시글 UPDATE 에 사용하는 hot_score 계산식 (likes_count / comment_count 카운터 컬럼으로 계산)
+
+    Args:
+        likes_delta (int): 같은 UPDATE 에서 likes_count 를 증감하는 경우 그 값 (SET 식은 변경 전 값을 참조하므로)
+        comments_delta (int): 같은 UPDATE 에서 comment_count 를 증감하는 경우 그 값
+    """
+    engagement = F("likes_count") + likes_delta + HOT_SCORE_COMMENT_WEIGHT * (F("comment_count") + comments_delta)
+    return Cast(Log(10, Greatest(engagement, 1)), FloatField()) + Cast(
+        Extract("created_at", "epoch"), FloatField()
+    ) / float(HOT_SCORE_DECAY_SECONDS)
+
+
+def refresh_hot_score(post_model: Type[Model], pk: int) -> None:
+    # 게시글의 hot_score 를 현재 카운터로 다시 계산 (새 게시글 / 작성 시각 변경 시)
+    post_model._base_manager.filter(pk=pk).update(hot_score=hot_score_expression())
+
+
+def adjust_comment_count(post_model: Type[Model], pk: int, delta: int) -> None:
+    # 게시글의 comment_count 를 delta 만큼 증감하고 같은 UPDATE 에서 인기 점수도 갱신
+    post_model._base_manager.filter(pk=pk).update(
+        comment_count=Greatest(F("comment_count") + delta, 0), hot_score=hot_score_expression(comments_delta=delta)
+    )
+
+
+def likeable_content_types() -> Dict[str, ContentType]:
+    # {model_type: ContentType} (ContentType 매니저 캐시를 사용하므로 처음 한 번만 조회)
+    content_types = ContentType.objects.get_for_models(*LIKEABLE_MODELS.values())
+    return {model_type: content_types[model] for model_type, model in LIKEABLE_MODELS.items()}
+
+
+def likeable_model(content_type_id: int) -> Optional[Type[Model]]:
+    # Like.content_type_id 에 해당하는 좋아요 대상 모델 (대상이 아닌 모델이면 None)
+    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    return model if model in LIKEABLE_MODELS.values() else None
+
+
+def active_likes_count(model: Type[Model]) -> Coalesce:
+    # 좋아요 대상 별 활성 좋아요 수를 세는 상관 서브쿼리 (카운터 보정용)
+    likes = (
+        Like.objects.filter(content_type=ContentType.objects.get_for_model(model), object_id=OuterRef("pk"))
+        .order_by()
+        .values("object_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(likes, output_field=IntegerField()), 0)
+
+
+def load_like_statuses(user: Any, items: Sequence[Tuple[str, int]]) -> List[Dict[str, Any]]:
+    """
+    (model_type, object_id) 목록에 대해 좋아요 수와 사용자의 좋아요 여부를 조회
+
+    대상 모델(content type) 별로 쿼리 1번 - likes_count 카운터 컬럼과 좋아요 여부 EXISTS 서브쿼리를 함께 읽습니다.
+    없는 대상은 결과에서 제외합니다.
+    """
+    content_types = likeable_content_types()
+    ids_by_type: Dict[str, List[int]] = defaultdict(list)
+    for model_type, object_id in items:
+        ids_by_type[model_type].append(object_id)
+
+    found: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    for model_type, object_ids in ids_by_type.items():
+        queryset = LIKEABLE_MODELS[model_type]._default_manager.filter(id__in=object_ids)
+        if user is not None and user.is_authenticated:
+            liked = Like.objects.filter(content_type=content_types[model_type], object_id=OuterRef("pk"), user=user)
+            queryset = queryset.annotate(liked=Exists(liked))
+        else:
+            queryset = queryset.annotate(liked=Value(False))
+        for object_id, likes_count, is_liked in queryset.values_list("id", "likes_count", "liked"):
+            found[(model_type, object_id)] = {
+                "model_type": model_type,
+                "object_id": object_id,
+                "liked": is_liked,
+                "likes_count": likes_count,
+            }
+    # 요청 순서대로 반환 (중복 요청은 1번만)
+    return list({key: found[key] for key in items if key in found}.values())
+
+
+def adjust_likes_count(model: Type[Model], pk: int, delta: int) -> int:
+    """
+    좋아요 대상(게시글 / 댓글)의 likes_count 를 delta 만큼 증감하고, 갱신된 행 수를 반환 (대상이 없으면 0)
+
+    F() 식으로 DB 에서 바로 더하므로 동시에 좋아요 요청이 들어와도 값이 유실되지 않습니다.
+    """
+    values: Dict[str, Any] = {"likes_count": Greatest(F("likes_count") + delta, 0)}
+    if model in POST_COMMENT_MODELS:
+        # 게시글이면 같은 UPDATE 에서 인기 점수도 갱신
+        values["hot_score"] = hot_score_expression(likes_delta=delta)
+    return int(model._default_manager.filter(pk=pk).update(**values))
+
+
+def group_comments(comments: Iterable[Any]) -> Dict[int, CommentChildren]:
+    """게시글 별로 댓글을 부모 id 기준으로 묶음 (created_at, id 순서 유지)"""
+    grouped: Dict[int, CommentChildren] = defaultdict(lambda: defaultdict(list))
+    for comment in comments:
+        grouped[comment.post_id][comment.parent_id].append(comment)
+    return grouped
+
+
+def fetch_comments(comment_model: Type[CommentModel], post_ids: Sequence[int]) -> Dict[int, CommentChildren]:
+    # 게시글들의 댓글 전체를 쿼리 1번으로 조회 (soft delete 된 댓글 제외)
+    comments = (
+        comment_model.objects.filter(post_id__in=post_ids)
+        .only("id", "post_id", "parent_id", "user_id", "content", "created_at", "likes_count")
+        .order_by("created_at", "id")
+    )
+    return group_comments(comments)
+
+
+def serialize_comment(comment: Any) -> Dict[str, Any]:
+    return {
+        "id": comment.id,
+        "user": comment.user_id,
+        "content": comment.content,
+        "parent": comment.parent_id,
+        "created_at": comment.created_at,
+        "likes_count": comment.likes_count,
+    }
+
+
+def build_replies(
+    children: CommentChildren,
+    parent_id: Optional[int],
+    depth: int,
+    max_depth: int,
+    page_size: int,
+) -> List[Dict[str, Any]]:
+    """
+    parent_id 아래의 댓글 트리를 만듦
+
+    단계마다 앞에서부터 page_size 개만 포함하고, 전체 개수는 reply_count 로 알려줍니다.
+    max_depth 보다 깊은 답글은 포함하지 않으며 (replies 가 빈 리스트), 나머지는 댓글 목록 API 의 parent / cursor 로 이어서 조회합니다.
+    """
+    nodes = []
+    for comment in children.get(parent_id, [])[:page_size]:
+        node = serialize_comment(comment)
+        node["reply_count"] = len(children.get(comment.id, []))
+        node["replies"] = (
+            build_replies(children, comment.id, depth + 1, max_depth, page_size) if depth < max_depth else []
+        )
+        nodes.append(node)
+    return nodes
+
+
+def load_comment_trees(
+    comment_model: Type[CommentModel],
+    post_ids: Sequence[int],
+    max_depth: Optional[int] = None,
+    page_size: Optional[int] = None,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    게시글(또는 게시글 한 페이지) 별 댓글 트리를 쿼리 1번으로 만듦
+
+    Args:
+        comment_model (Type[CommentModel]): TeamComment / PlayerComment
+        post_ids (Sequence[int]): 게시글 id 목록
+        max_depth (Optional[int]): 포함할 최대 깊이 (최상위 댓글 = 1), 기본값 settings.COMMENT_TREE_MAX_DEPTH
+        page_size (Optional[int]): 단계 별 최대 댓글 수, 기본값 settings.COMMENT_TREE_PAGE_SIZE
+
+    Returns:
+        Dict[int, List[Dict[str, Any]]]: {게시글 id: 최상위 댓글 트리}
+    """
+    max_depth = max_depth or comment_tree_max_depth()
+    page_size = page_size or comment_tree_page_size()
+    grouped = fetch_comments(comment_model, post_ids)
+    return {post_id: build_replies(grouped.get(post_id, {}), None, 1, max_depth, page_size) for post_id in post_ids}
+
+
+def load_reply_tree(
+    comment: CommentModel,
+    depth: int = 1,
+    max_depth: Optional[int] = None,
+    page_size: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """댓글 하나의 답글 트리 (댓글이 속한 게시글의 댓글을 쿼리 1번으로 조회)"""
+    max_depth = max_depth or comment_tree_max_depth()
+    page_size = page_size or comment_tree_page_size()
+    children = fetch_comments(type(comment), [comment.post_id]).get(comment.post_id, {})
+    return build_replies(children, comment.id, depth + 1, max_depth, page_size)
+
+
+def build_comment_page(
+    comment_model: Type[CommentModel],
+    post_id: int,
+    comments: Sequence[Any],
+    max_depth: Optional[int] = None,
+    page_size: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    댓글 목록 API 의 한 페이지(같은 단계의 댓글들)에 각 댓글의 답글 트리를 붙임
+
+    페이지의 댓글은 1단계로 보고 max_depth 까지 답글을 포함합니다.
+    """
+    max_depth = max_depth or comment_tree_max_depth()
+    page_size = page_size or comment_tree_page_size()
+    children = fetch_comments(comment_model, [post_id]).get(post_id, {})
+    nodes = []
+    for comment in comments:
+        node = serialize_comment(comment)
+        node["reply_count"] = len(children.get(comment.id, []))
+        node["replies"] = build_replies(children, comment.id, 2, max_depth, page_size) if max_depth > 1 else []
+        nodes.append(node)
+    return nodes
@@ -1,26 +1,76 @@
-from typing import Any, Dict, List, Type, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
 from django.db.models import Model
-from drf_spectacular.utils import OpenApiExample, extend_schema
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.pagination import KeysetPagination
 from apps.players.models import Player
 from apps.teams.models import Team
 
+from . import like_buffer
 from .models import Like, PlayerComment, PlayerPost, TeamComment, TeamPost
 from .serializers import (
     LikeSerializer,
+    LikeStatusRequestSerializer,
     PlayerCommentSerializer,
     PlayerPostSerializer,
+    PlayerPostSummarySerializer,
     TeamCommentSerializer,
     TeamPostSerializer,
+    TeamPostSummarySerializer,
 )
+from .utils import (
+    LIKEABLE_MODELS,
+    adjust_likes_count,
+    build_comment_page,
+    comment_tree_max_depth,
+    comment_tree_page_size,
+    load_like_statuses,
+)
+
+# 같은 단계 댓글 목록의 정렬 (keyset 페이지네이션 커서)
+COMMENT_ORDERINGS: Dict[str, Tuple[str, ...]] = {"created_at": ("created_at", "id")}
+# 게시글 목록 정렬 - 최신순
+POST_ORDERINGS: Dict[str, Tuple[str, ...]] = {"latest": ("-created_at", "-id")}
+# 인기 게시글 피드 정렬 - 점수 내림차순
+HOT_POST_ORDERINGS: Dict[str, Tuple[str, ...]] = {"hot": ("-hot_score", "-id")}
+# 게시글 목록(요약)에서 읽지 않는 컬럼
+SUMMARY_DEFERRED = ("content", "search_vector")
+
+
+def list_comments(request: Request, comment_model: Type[Any], post_id: int) -> Response:
+    """
+    게시글의 한 단계 댓글 목록을 cursor 로 페이지를 나눠 조회하고, 각 댓글의 답글 트리를 붙임
+
+    query params:
+        parent: 부모 댓글 id (없으면 최상위 댓글)
+        depth: 포함할 답글 깊이 (1 ~ settings.COMMENT_TREE_MAX_DEPTH)
+        cursor / page_size: keyset 페이지네이션
+    """
+    try:
+        parent_id = int(request.query_params["parent"]) if request.query_params.get("parent") else None
+        depth = int(request.query_params.get("depth", comment_tree_max_depth()))
+    except ValueError:
+        raise ValidationError({"detail": "parent / depth 는 정수여야 합니다."})
+    depth = max(1, min(depth, comment_tree_max_depth()))
+
+    paginator = KeysetPagination(
+        orderings=COMMENT_ORDERINGS, default_ordering="created_at", page_size=comment_tree_page_size()
+    )
+    comments = comment_model.objects.filter(post_id=post_id, parent_id=parent_id)
+    page = paginator.paginate_queryset(comments, request)
+    return paginator.get_paginated_response(build_comment_page(comment_model, post_id, page, max_depth=depth))
 
 
 class TeamPostListCreateAPIView(APIView):
@@ -40,14 +90,23 @@ class TeamPostListCreateAPIView(APIView):
 
     @extend_schema(
         summary="팀 커뮤니티 게시글 조회",
-        description="특정 팀의 커뮤니티 게시글 목록을 조회합니다.",
-        responses={200: TeamPostSerializer(many=True)},
+        description=(
+            "특정 팀의 커뮤니티 게시글 목록을 최신순으로 조회합니다. "
+            "본문과 댓글 없이 댓글 수 / 좋아요 수를 포함하며, 댓글은 게시글 상세 조회에서 제공합니다."
+        ),
+        parameters=[
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기"),
+        ],
+        responses={200: TeamPostSummarySerializer(many=True)},
     )
     # 팀 커뮤니티 조회
     def get(self, request: Request, team_id: int) -> Response:
-        posts = TeamPost.objects.filter(team_id=team_id)
-        serializer = TeamPostSerializer(posts, many=True)
-        return Response(serializer.data)
+        paginator = KeysetPagination(orderings=POST_ORDERINGS, default_ordering="latest")
+        posts = TeamPost.objects.filter(team_id=team_id).defer(*SUMMARY_DEFERRED)
+        page = paginator.paginate_queryset(posts, request)
+        serializer = TeamPostSummarySerializer(page, many=True)
+        return paginator.get_paginated_response(like_buffer.merge_likes_counts("teampost", serializer.data))
 
     @extend_schema(
         summary="팀 커뮤니티 게시글 생성",
@@ -71,6 +130,28 @@ class TeamPostListCreateAPIView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class TeamHotPostListAPIView(APIView):
+    permission_classes = (AllowAny,)
+    authentication_classes = ()
+
+    @extend_schema(
+        summary="팀 커뮤니티 인기 게시글 조회",
+        description="좋아요 수 / 댓글 수와 작성 시각으로 계산한 인기 점수 순으로 팀 커뮤니티 게시글을 조회합니다.",
+        parameters=[
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기"),
+        ],
+        responses={200: TeamPostSummarySerializer(many=True)},
+    )
+    # 팀 커뮤니티 인기 게시글 조회
+    def get(self, request: Request, team_id: int) -> Response:
+        paginator = KeysetPagination(orderings=HOT_POST_ORDERINGS, default_ordering="hot")
+        posts = TeamPost.objects.filter(team_id=team_id).defer(*SUMMARY_DEFERRED)
+        page = paginator.paginate_queryset(posts, request)
+        serializer = TeamPostSummarySerializer(page, many=True)
+        return paginator.get_paginated_response(like_buffer.merge_likes_counts("teampost", serializer.data))
+
+
 class TeamPostDetailAPIView(APIView):
 
     def get_authenticators(self) -> List[Any]:
@@ -97,7 +178,7 @@ class TeamPostDetailAPIView(APIView):
         if not post:
             return Response({"detail": "게시글을 찾을 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
         serializer = TeamPostSerializer(post)
-        return Response(serializer.data)
+        return Response(like_buffer.merge_likes_counts("teampost", [serializer.data])[0])
 
     @extend_schema(
         summary="팀 커뮤니티 게시글 수정",
@@ -160,14 +241,23 @@ class PlayerPostListCreateAPIView(APIView):
 
     @extend_schema(
         summary="선수 커뮤니티 게시글 조회",
-        description="특정 선수의 커뮤니티 게시글 목록을 조회합니다.",
-        responses={200: PlayerPostSerializer(many=True)},
+        description=(
+            "특정 선수의 커뮤니티 게시글 목록을 최신순으로 조회합니다. "
+            "본문과 댓글 없이 댓글 수 / 좋아요 수를 포함하며, 댓글은 게시글 상세 조회에서 제공합니다."
+        ),
+        parameters=[
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기"),
+        ],
+        responses={200: PlayerPostSummarySerializer(many=True)},
     )
     # 선수 커뮤니티 조회
     def get(self, request: Request, player_id: int) -> Response:
-        posts = PlayerPost.objects.filter(player_id=player_id)
-        serializer = PlayerPostSerializer(posts, many=True)
-        return Response(serializer.data)
+        paginator = KeysetPagination(orderings=POST_ORDERINGS, default_ordering="latest")
+        posts = PlayerPost.objects.filter(player_id=player_id).defer(*SUMMARY_DEFERRED)
+        page = paginator.paginate_queryset(posts, request)
+        serializer = PlayerPostSummarySerializer(page, many=True)
+        return paginator.get_paginated_response(like_buffer.merge_likes_counts("playerpost", serializer.data))
 
     @extend_schema(
         summary="선수 커뮤니티 게시글 생성",
@@ -190,6 +280,28 @@ class PlayerPostListCreateAPIView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class PlayerHotPostListAPIView(APIView):
+    permission_classes = (AllowAny,)
+    authentication_classes = ()
+
+    @extend_schema(
+        summary="선수 커뮤니티 인기 게시글 조회",
+        description="좋아요 수 / 댓글 수와 작성 시각으로 계산한 인기 점수 순으로 선수 커뮤니티 게시글을 조회합니다.",
+        parameters=[
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기"),
+        ],
+        responses={200: PlayerPostSummarySerializer(many=True)},
+    )
+    # 선수 커뮤니티 인기 게시글 조회
+    def get(self, request: Request, player_id: int) -> Response:
+        paginator = KeysetPagination(orderings=HOT_POST_ORDERINGS, default_ordering="hot")
+        posts = PlayerPost.objects.filter(player_id=player_id).defer(*SUMMARY_DEFERRED)
+        page = paginator.paginate_queryset(posts, request)
+        serializer = PlayerPostSummarySerializer(page, many=True)
+        return paginator.get_paginated_response(like_buffer.merge_likes_counts("playerpost", serializer.data))
+
+
 class PlayerPostDetailAPIView(APIView):
 
     def get_authenticators(self) -> List[Any]:
@@ -216,7 +328,7 @@ class PlayerPostDetailAPIView(APIView):
         if not post:
             return Response({"detail": "게시글을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
         serializer = PlayerPostSerializer(post)
-        return Response(serializer.data)
+        return Response(like_buffer.merge_likes_counts("playerpost", [serializer.data])[0])
 
     @extend_schema(
         summary="선수 커뮤니티 게시글 수정",
@@ -262,6 +374,35 @@ class PlayerPostDetailAPIView(APIView):
 
 class TeamCommentCreateAPIView(APIView):
 
+    def get_authenticators(self) -> List[Any]:
+        if not hasattr(self, "request") or self.request is None:
+            return super().get_authenticators()
+
+        if self.request.method == "GET":
+            return []
+        return [JWTAuthentication()]
+
+    def get_permissions(self) -> List[Any]:
+        if self.request.method == "GET":
+            return [AllowAny()]
+        return [IsAuthenticated()]
+
+    @extend_schema(
+        summary="팀 커뮤니티 댓글 목록 조회",
+        description="게시글의 댓글을 단계 별로 cursor 페이지네이션하여 조회합니다. (parent 로 답글 목록 조회)",
+        parameters=[
+            OpenApiParameter("parent", type=int, description="부모 댓글 id (없으면 최상위 댓글)"),
+            OpenApiParameter("depth", type=int, description="포함할 답글 깊이"),
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기"),
+        ],
+    )
+    # 팀 커뮤니티 댓글 목록 조회
+    def get(self, request: Request, team_id: int, post_id: int) -> Response:
+        if not TeamPost.objects.filter(id=post_id, team_id=team_id).exists():
+            return Response({"detail": "게시글을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return list_comments(request, TeamComment, post_id)
+
     @extend_schema(
         summary="팀 커뮤니티 댓글 작성",
         description="특정 팀 커뮤니티 게시글에 댓글을 작성합니다. (로그인한 사용자만 작성 가능)",
@@ -355,11 +496,35 @@ class TeamCommentDetailAPIView(APIView):
 
 class PlayerCommentCreateAPIView(APIView):
 
+    def get_authenticators(self) -> List[Any]:
+        if not hasattr(self, "request") or self.request is None:
+            return super().get_authenticators()
+
+        if self.request.method == "GET":
+            return []
+        return [JWTAuthentication()]
+
     def get_permissions(self) -> List[Any]:
         if self.request.method == "GET":
             return [AllowAny()]
         return [IsAuthenticated()]
 
+    @extend_schema(
+        summary="선수 커뮤니티 댓글 목록 조회",
+        description="게시글의 댓글을 단계 별로 cursor 페이지네이션하여 조회합니다. (parent 로 답글 목록 조회)",
+        parameters=[
+            OpenApiParameter("parent", type=int, description="부모 댓글 id (없으면 최상위 댓글)"),
+            OpenApiParameter("depth", type=int, description="포함할 답글 깊이"),
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기"),
+        ],
+    )
+    # 선수 커뮤니티 댓글 목록 조회
+    def get(self, request: Request, player_id: int, post_id: int) -> Response:
+        if not PlayerPost.objects.filter(id=post_id, player_id=player_id).exists():
+            return Response({"detail": "게시글을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return list_comments(request, PlayerComment, post_id)
+
     @extend_schema(
         summary="선수 커뮤니티 댓글 작성",
         description="특정 선수 커뮤니티 게시글에 댓글을 작성합니다. (로그인한 사용자만 작성 가능)",
@@ -471,48 +636,41 @@ class LikeAPIView(APIView):
     )
     # 커뮤니티 게시판이나 댓글 좋아요
     def post(self, request: Request, model_type: str, object_id: int) -> Response:
-        allowed_models: Dict[str, Type[Model]] = {
-            "teampost": TeamPost,
-            "playerpost": PlayerPost,
-            "teamcomment": TeamComment,
-            "playercomment": PlayerComment,
-        }
-        model_type = model_type.lower()
-        if model_type not in allowed_models:
+        model = LIKEABLE_MODELS.get(model_type.lower())
+        if model is None:
             return Response(
                 {"detail": "유효하지 않은 모델 타입입니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        model: Type[Model] = allowed_models[model_type]
-        # 모델의 objects 매니저에 접근 (mypy 우회를 위해 cast 사용)
-        obj = cast(Any, model).objects.filter(id=object_id).first()
-        if not obj:
+        if like_buffer.is_enabled():
+            return self.buffer_like(request, model_type.lower(), object_id, liked=True)
+        content_type = ContentType.objects.get_for_model(model)
+        # 중복 여부를 먼저 조회하지 않고 바로 INSERT 하여, 활성 좋아요 유니크 제약으로 중복을 막음 (동시 요청에도 1개만 생성)
+        try:
+            with transaction.atomic():
+                like = Like.objects.create(
+                    user=cast(Any, request.user),
+                    content_type=content_type,
+                    object_id=object_id,
+                )
+                if not adjust_likes_count(model, object_id, 1):
+                    raise ObjectDoesNotExist
+        except IntegrityError:
+            # 이미 좋아요한 대상이면 아무것도 바꾸지 않음 (같은 요청을 반복해도 결과가 같음)
+            likes_count = self.get_likes_count(model, object_id)
+            if likes_count is None:
+                return Response({"detail": "대상 객체를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+            return Response(
+                {"detail": "이미 좋아요가 있습니다.", "likes_count": likes_count}, status=status.HTTP_200_OK
+            )
+        except ObjectDoesNotExist:
             return Response(
                 {"detail": "대상 객체를 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        content_type = ContentType.objects.get_for_model(model)
-        # 이미 좋아요가 존재하는지 확인
-        if Like.objects.filter(
-            user=cast(Any, request.user),
-            content_type=content_type,
-            object_id=object_id,
-        ).exists():
-            return Response(
-                {"detail": "이미 좋아요가 있습니다."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        # 좋아요 생성
-        like = Like.objects.create(
-            user=cast(Any, request.user),
-            content_type=content_type,
-            object_id=object_id,
-        )
         serializer = LikeSerializer(like)
-        # 좋아요 후 전체 좋아요 갯수 조회
-        likes_count = Like.objects.filter(content_type=content_type, object_id=object_id).count()
         return Response(
-            {"detail": "좋아요 추가", "like": serializer.data, "likes_count": likes_count},
+            {"detail": "좋아요 추가", "like": serializer.data, "likes_count": self.get_likes_count(model, object_id)},
             status=status.HTTP_201_CREATED,
         )
 
@@ -522,46 +680,99 @@ class LikeAPIView(APIView):
         responses={
             200: OpenApiExample("성공 응답 예시", value={"detail": "좋아요 취소"}),
             400: OpenApiExample("실패 응답 예시", value={"detail": "유효하지 않은 모델 타입입니다."}),
-            404: OpenApiExample("실패 응답 예시", value={"detail": "대상 객체를 찾을 수 없습니다."}),
+            404: OpenApiExample("실패 응답 예시", value={"detail": "좋아요가 존재하지 않습니다."}),
         },
     )
     # 커뮤니티 게시판이나 댓글 좋아요 취소
     def delete(self, request: Request, model_type: str, object_id: int) -> Response:
-        allowed_models: Dict[str, Type[Model]] = {
-            "teampost": TeamPost,
-            "playerpost": PlayerPost,
-            "teamcomment": TeamComment,
-            "playercomment": PlayerComment,
-        }
-        model_type = model_type.lower()
-        if model_type not in allowed_models:
+        model = LIKEABLE_MODELS.get(model_type.lower())
+        if model is None:
             return Response(
                 {"detail": "유효하지 않은 모델 타입입니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        model: Type[Model] = allowed_models[model_type]
-        obj = cast(Any, model).objects.filter(id=object_id).first()
-        if not obj:
-            return Response(
-                {"detail": "대상 객체를 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        if like_buffer.is_enabled():
+            return self.buffer_like(request, model_type.lower(), object_id, liked=False)
         content_type = ContentType.objects.get_for_model(model)
-        try:
-            like = Like.objects.get(
+        with transaction.atomic():
+            # 활성 좋아요를 UPDATE 한 번으로 삭제 처리하고, 실제로 삭제된 경우에만 카운터를 줄임
+            removed = Like.objects.filter(
                 user=cast(Any, request.user),
                 content_type=content_type,
                 object_id=object_id,
-            )
-        except Like.DoesNotExist:
+            ).update(deleted_at=timezone.now())
+            if removed:
+                adjust_likes_count(model, object_id, -removed)
+        if not removed:
             return Response(
                 {"detail": "좋아요가 존재하지 않습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        like.delete()
-        # 좋아요 취소 후 전체 좋아요 갯수 조회
-        likes_count = Like.objects.filter(content_type=content_type, object_id=object_id).count()
         return Response(
-            {"detail": "좋아요 취소", "likes_count": likes_count},
+            {"detail": "좋아요 취소", "likes_count": self.get_likes_count(model, object_id) or 0},
             status=status.HTTP_200_OK,
         )
+
+    def buffer_like(self, request: Request, model_type: str, object_id: int, liked: bool) -> Response:
+        # write-behind 모드: DB 에는 쓰지 않고 버퍼에 기록, 응답의 좋아요 수는 버퍼의 증감을 더한 값
+        likes_count = self.get_likes_count(LIKEABLE_MODELS[model_type], object_id)
+        if likes_count is None:
+            return Response({"detail": "대상 객체를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        changed = like_buffer.record(model_type, object_id, cast(Any, request.user).id, liked)
+        likes_count = like_buffer.buffered_likes_count(model_type, object_id, likes_count)
+        if not changed:
+            if liked:
+                return Response(
+                    {"detail": "이미 좋아요가 있습니다.", "likes_count": likes_count}, status=status.HTTP_200_OK
+                )
+            return Response({"detail": "좋아요가 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(
+            {"detail": "좋아요 추가" if liked else "좋아요 취소", "likes_count": likes_count},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @staticmethod
+    def get_likes_count(model: Type[Model], object_id: int) -> Optional[int]:
+        # 좋아요 행을 세지 않고 대상의 카운터 컬럼을 읽음 (대상이 없으면 None)
+        return cast(
+            Optional[int], model._default_manager.filter(id=object_id).values_list("likes_count", flat=True).first()
+        )
+
+
+class LikeStatusAPIView(APIView):
+
+    def get_authenticators(self) -> List[Any]:
+        return [JWTAuthentication()]
+
+    def get_permissions(self) -> List[Any]:
+        return [AllowAny()]
+
+    @extend_schema(
+        summary="커뮤니티 게시판 및 댓글 좋아요 여부 일괄 조회",
+        description=(
+            "게시글 / 댓글 목록의 좋아요 수와 로그인한 사용자의 좋아요 여부를 한 번에 조회합니다. "
+            "(비로그인 사용자는 liked 가 항상 false, 존재하지 않는 대상은 결과에서 제외)"
+        ),
+        request=LikeStatusRequestSerializer,
+        examples=[
+            OpenApiExample(
+                "요청 예시",
+                value={
+                    "items": [{"model_type": "teampost", "object_id": 1}, {"model_type": "teamcomment", "object_id": 3}]
+                },
+                request_only=True,
+            ),
+            OpenApiExample(
+                "성공 응답 예시",
+                value={"results": [{"model_type": "teampost", "object_id": 1, "liked": True, "likes_count": 12}]},
+                response_only=True,
+            ),
+        ],
+    )
+    # 커뮤니티 게시판이나 댓글 좋아요 여부 일괄 조회
+    def post(self, request: Request) -> Response:
+        serializer = LikeStatusRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = [(item["model_type"], item["object_id"]) for item in serializer.validated_data["items"]]
+        results = like_buffer.merge_pending(request.user, load_like_statuses(request.user, items))
+        return Response({"results": results})
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:52
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_subscriber_count(apps, schema_editor):
+    # 기존 활성 구독(삭제되지 않은 구독) 수로 카운터를 채움
+    Player = apps.get_model("players", "Player")
+    PlayerSubscription = apps.get_model("subscriptions", "PlayerSubscription")
+    active_counts = (
+        PlayerSubscription.objects.filter(player=OuterRef("pk"), deleted_at__isnull=True)
+        .order_by()
+        .values("player")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Player.objects.update(subscriber_count=Coalesce(Subquery(active_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("players", "0003_alter_player_position"),
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+        ("teams", "0001_initial"),
+        ("subscriptions", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="subscriber_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["-subscriber_count", "id"],
+                name="player_subscriber_rank_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["position", "-subscriber_count", "id"],
+                name="player_position_rank_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_subscriber_count, migrations.RunPython.noop),
+    ]
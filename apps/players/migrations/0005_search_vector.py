@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("players", "0004_player_subscriber_count"),
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+        ("teams", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector("nickname", "gamename", config="simple", weight="A"),
+                    "||",
+                    django.contrib.postgres.search.SearchVector("realname", config="simple", weight="B"),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="playerschedule",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector("title", config="simple", weight="A"),
+                    "||",
+                    django.contrib.postgres.search.SearchVector("place", "detail", config="simple", weight="B"),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="player_search_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="playerschedule",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="player_schedule_search_idx"),
+        ),
+    ]
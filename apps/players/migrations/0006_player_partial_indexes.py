@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("players", "0005_search_vector"),
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+        ("teams", "0003_team_subscriber_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)), fields=["team", "id"], name="player_team_roster_idx"
+            ),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from enum import Enum
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django_softdelete.models import SoftDeleteModel
 from taggit.managers import TaggableManager
@@ -37,9 +39,40 @@ class Player(BaseModel, SoftDeleteModel):
     is_active = models.BooleanField(default=True)  # 선수 활성화 여부
     tags = TaggableManager(blank=True)
     nationality = models.CharField(max_length=20, default="Korea")  # 국적
+    # 활성 구독자 수 (구독 / 구독 취소 시 함께 갱신되는 비정규화 카운터)
+    subscriber_count = models.PositiveIntegerField(default=0)
+
+    # 통합 검색용 tsvector (닉네임 / 게임 아이디 A, 본명 B)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("nickname", "gamename", weight="A", config="simple")
+        + SearchVector("realname", weight="B", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "player"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="player_search_idx"),
+            # 구독자 수 상위 N명 조회 (TopPlayers)
+            models.Index(
+                fields=["-subscriber_count", "id"],
+                name="player_subscriber_rank_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 포지션 별 구독자 수 상위 N명 조회 (PositionTop)
+            models.Index(
+                fields=["position", "-subscriber_count", "id"],
+                name="player_position_rank_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 팀 소속 선수 목록 (팀 상세 로스터, id 순)
+            models.Index(
+                fields=["team", "id"],
+                name="player_team_roster_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.nickname}({self.realname})"
@@ -57,8 +90,19 @@ class PlayerSchedule(BaseModel):
     title = models.CharField(max_length=50, null=False, blank=False, default=None)  # 이벤트 제목
     detail = models.CharField(max_length=255, blank=True)  # 이벤트 상세 내용
 
+    # 통합 검색용 tsvector (제목 A, 장소 / 내용 B)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config="simple")
+        + SearchVector("place", "detail", weight="B", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         db_table = "player_schedule"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="player_schedule_search_idx"),
+        ]
 
     def __str__(self):
         return f"{self.player.nickname} - {self.title}"
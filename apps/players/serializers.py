@@ -2,6 +2,8 @@ from typing import Any, Dict
 
 from rest_framework import serializers
 
+from apps.cloud_images.loaders import get_image_srcset, get_image_url
+from apps.common.serializers import DynamicFieldsSerializerMixin
 from apps.subscriptions.models import PlayerSubscription
 
 from .models import Player, PlayerSchedule
@@ -17,56 +19,61 @@ class PlayerSocialSerializer(serializers.Serializer[None]):
     chzzk = serializers.URLField(required=False)
 
 
-# 전체 선수 정보를 직렬화하는 시리얼라이저
-class PlayerSerializer(serializers.ModelSerializer[Player]):
+# 전체 선수 정보를 직렬화하는 시리얼라이저 (fields 인자로 필요한 필드만 직렬화 가능)
+class PlayerSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer[Player]):
     social = PlayerSocialSerializer()  # 소셜 미디어 정보를 포함
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Player
-        fields = ["id", "nickname", "realname", "position", "social", "profile_image_url"]
+        fields = ["id", "nickname", "realname", "position", "social", "profile_image_url", "profile_image_srcset"]
 
     def get_profile_image_url(self, obj: Player) -> str | None:
-        image = obj.player_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Player) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
 
 # 상위 10명의 선수 정보를 직렬화하는 시리얼라이저
 class PlayerTopSerializer(serializers.ModelSerializer[Player]):
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Player
-        fields = ["id", "nickname", "realname", "profile_image_url"]
+        fields = ["id", "nickname", "realname", "profile_image_url", "profile_image_srcset"]
 
     def get_profile_image_url(self, obj: Player) -> str | None:
-        image = obj.player_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Player) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
 
 # 특정 포지션의 상위 5명의 선수 정보를 직렬화하는 시리얼라이저
 class PlayerPositionSerializer(serializers.ModelSerializer[Player]):
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Player
-        fields = ["id", "nickname", "position", "profile_image_url"]
+        fields = ["id", "nickname", "position", "profile_image_url", "profile_image_srcset"]
 
     def get_profile_image_url(self, obj: Player) -> str | None:
-        image = obj.player_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Player) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
 
 # 선수 프로필 정보를 반환하는 시리얼라이저
 class PlayerDetailSerializer(serializers.ModelSerializer[Player]):
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
     background_image_url = serializers.SerializerMethodField()
+    background_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Player
@@ -83,27 +90,29 @@ class PlayerDetailSerializer(serializers.ModelSerializer[Player]):
             "agency",  # 소속 에이전시
             "nationality",  # 국적
             "profile_image_url",
+            "profile_image_srcset",
             "background_image_url",
+            "background_image_srcset",
         ]
 
     def get_profile_image_url(self, obj: Player) -> str | None:
-        image = obj.player_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Player) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
     def get_background_image_url(self, obj: Player) -> str | None:
-        image = obj.player_images.filter(category="background").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "background")
+
+    def get_background_image_srcset(self, obj: Player) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "background")
 
 
 # PlayerSchedule 모델의 데이터를 직렬화하는 시리얼라이저
 class PlayerScheduleSerializer(serializers.ModelSerializer[PlayerSchedule]):
     class Meta:
         model = PlayerSchedule
-        fields = "__all__"  # 모델의 모든 필드를 포함
+        exclude = ("search_vector",)  # 검색용 생성 컬럼을 제외한 모든 필드를 포함
 
 
 # 선수 등록용 시리얼라이저
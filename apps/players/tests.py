@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import date, timedelta
 from typing import ClassVar
 
@@ -9,7 +10,9 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from apps.players.models import Player, PlayerSchedule
+from apps.cloud_images.models import PlayerImage
+from apps.cloud_images.variants import generate_variants
+from apps.players.models import Player, PlayerSchedule, Position
 from apps.subscriptions.models import PlayerSubscription
 from apps.teams.models import Team
 from apps.users.models import User
@@ -76,12 +79,78 @@ class PlayerAPITestCase(APITestCase):
         token = str(RefreshToken.for_user(user).access_token)
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
 
+    def subscribe(self, user: User, player: Player) -> None:
+        # 구독 API 를 거쳐야 subscriber_count 가 함께 갱신됨
+        self.authenticate(user)
+        response = self.client.post(reverse("player_subscription", kwargs={"player_id": player.id}))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     # --- 선수 관련 API 테스트 ---
     def test_get_player_list(self) -> None:
         url = reverse("player-list")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), len(self.players))
+        self.assertEqual(len(response.data["results"]), len(self.players))
+        self.assertIsNone(response.data["next"])
+
+    def test_get_player_list_cursor_pagination(self) -> None:
+        url = reverse("player-list")
+        nicknames: list[str] = []
+        next_url: str | None = f"{url}?ordering=-nickname&page_size=2"
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            nicknames += [row["nickname"] for row in response.data["results"]]
+            next_url = response.data["next"]
+
+        self.assertEqual(nicknames, sorted((player.nickname for player in self.players), reverse=True))
+
+    def test_get_player_list_invalid_ordering(self) -> None:
+        response = self.client.get(reverse("player-list"), {"ordering": "realname"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_player_list_fields_projection(self) -> None:
+        response = self.client.get(reverse("player-list"), {"fields": "id,nickname"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data["results"][0]), {"id", "nickname"})
+
+    def test_get_player_list_stream(self) -> None:
+        response = self.client.get(reverse("player-list"), {"stream": "true", "fields": "id"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        data = json.loads(b"".join(response.streaming_content))  # type: ignore[attr-defined]
+        self.assertEqual(data, [{"id": player.id} for player in sorted(self.players, key=lambda p: p.id)])
+
+    def test_get_player_list_query_count_is_constant(self) -> None:
+        url = reverse("player-list")
+        for player in self.players:
+            PlayerImage.objects.create(player=player, category="profile", image_url=f"https://img.test/{player.id}.png")
+
+        # 선수 수와 관계없이 이미지 URL 을 포함해 1번의 쿼리로 조회되어야 함
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {row["profile_image_url"] for row in response.data["results"]},
+            {f"https://img.test/{player.id}.png" for player in self.players},
+        )
+
+        for i in range(5, 10):
+            player = Player.objects.create(
+                realname=f"RealName{i}",
+                nickname=f"Nick{i}",
+                gamename=f"GameName{i}",
+                position="mid",
+                date_of_birth=date(1990, 1, 1),
+                debut_date=date(2010, 1, 1),
+                agency="AgencyX",
+            )
+            PlayerImage.objects.create(player=player, category="profile", image_url=f"https://img.test/{player.id}.png")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["results"]), 10)
 
     def test_get_player_detail(self) -> None:
         player = self.players[0]
@@ -90,6 +159,35 @@ class PlayerAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["id"], player.id)
 
+    def test_get_player_detail_conditional_get(self) -> None:
+        player = self.players[0]
+        url = reverse("player-detail", kwargs={"pk": player.id})
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertTrue(response.has_header("Last-Modified"))
+
+        # 변경이 없으면 검증값 집계 쿼리 1번만으로 304 응답
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        # 이미지가 추가되면 검증값이 바뀌어 다시 200 응답
+        image = PlayerImage.objects.create(player=player, category="profile", image_url="https://example.com/new.png")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+        # 업로드 이후 파생 이미지가 채워져도 검증값이 바뀌어 srcset 이 담긴 응답을 다시 받음
+        etag = response["ETag"]
+        PlayerImage.objects.create(
+            player=self.players[1], category="gallery", image_url=image.image_url, variants={"webp": {"320": "v.webp"}}
+        )
+        generate_variants(PlayerImage, image.pk)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["profile_image_srcset"], {"webp": {"320": "v.webp"}})
+
     def test_create_player_by_admin(self) -> None:
         url = reverse("player-list")
         data = {
@@ -259,8 +357,6 @@ class PlayerAPITestCase(APITestCase):
 
     # --- 구독 기반 조회 테스트 ---
     def test_top_players_by_subscriptions(self) -> None:
-        from apps.subscriptions.models import PlayerSubscription
-
         # 각 선수에 대해 구독 수 부여
         for i in range(5):
             user = User.objects.create_user(
@@ -268,20 +364,20 @@ class PlayerAPITestCase(APITestCase):
                 password="pass",
                 nickname=f"sub_top_{i}",
             )
-            PlayerSubscription.objects.create(user=user, player=self.players[0])
+            self.subscribe(user, self.players[0])
         for i in range(3):
             user = User.objects.create_user(
                 email=f"sub_top_{i+5}_{i}@example.com",
                 password="pass",
                 nickname=f"sub_top_{i+5}",
             )
-            PlayerSubscription.objects.create(user=user, player=self.players[1])
+            self.subscribe(user, self.players[1])
         user = User.objects.create_user(
             email="sub_top_8_unique@example.com",
             password="pass",
             nickname="sub_top_8",
         )
-        PlayerSubscription.objects.create(user=user, player=self.players[2])
+        self.subscribe(user, self.players[2])
 
         url = reverse("top-players")
         self.authenticate(self.normal_user)
@@ -291,8 +387,6 @@ class PlayerAPITestCase(APITestCase):
         self.assertEqual(top_player["id"], self.players[0].id)
 
     def test_position_top_players_by_subscriptions(self) -> None:
-        from apps.subscriptions.models import PlayerSubscription
-
         # 각 포지션별 구독 수를 부여
         subs_counts = {"top": 4, "jungle": 3, "mid": 2, "bottom": 1, "support": 0}
         for player in self.players:
@@ -303,7 +397,7 @@ class PlayerAPITestCase(APITestCase):
                     password="pass",
                     nickname=f"pos_{player.position}_{i}",
                 )
-                PlayerSubscription.objects.create(user=user, player=player)
+                self.subscribe(user, player)
         url = reverse("position-top")
         self.authenticate(self.normal_user)
         response = self.client.get(url)
@@ -312,3 +406,35 @@ class PlayerAPITestCase(APITestCase):
         for position, players in data.items():
             for player in players:
                 self.assertEqual(player["position"], position)
+
+    def test_unsubscribe_decrements_subscriber_count(self) -> None:
+        user = User.objects.create_user(email="unsub@example.com", password="pass", nickname="unsub")
+        self.subscribe(user, self.players[3])
+        self.players[3].refresh_from_db()
+        self.assertEqual(self.players[3].subscriber_count, 1)
+
+        response = self.client.delete(reverse("player_subscription", kwargs={"player_id": self.players[3].id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.players[3].refresh_from_db()
+        self.assertEqual(self.players[3].subscriber_count, 0)
+        # soft delete 된 구독은 카운터에 포함되지 않음
+        self.assertTrue(PlayerSubscription.deleted_objects.filter(user=user, player=self.players[3]).exists())
+
+    def test_position_top_players_single_query(self) -> None:
+        for i in range(2):
+            Player.objects.create(
+                team=self.team,
+                realname=f"ExtraTop{i}",
+                nickname=f"ExtraTop{i}",
+                gamename=f"ExtraTop{i}",
+                position="top",
+                date_of_birth=date(1990, 1, 1),
+                debut_date=date(2010, 1, 1),
+                subscriber_count=10 - i,
+            )
+        url = reverse("position-top")
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p["nickname"] for p in response.data["top"][:2]], ["ExtraTop0", "ExtraTop1"])
+        self.assertEqual(set(response.data), {pos.value for pos in Position})
@@ -1,7 +1,8 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from django.db.models import Count
-from drf_spectacular.utils import OpenApiExample, extend_schema
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
@@ -10,6 +11,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.cloud_images.loaders import with_player_images
+from apps.cloud_images.models import PlayerImage
+from apps.common.cache import cached_response
+from apps.common.mixins import ConditionalGetMixin, ValidatorSource
+from apps.common.pagination import KeysetPagination
+from apps.common.utils import stream_json_list
+
 from .models import Player, PlayerSchedule, Position
 from .serializers import (
     PlayerCreateSerializer,
@@ -20,6 +28,16 @@ from .serializers import (
     PlayerTopSerializer,
 )
 
+# 선수 목록 정렬 기준 (keyset 페이지네이션의 커서가 됨)
+PLAYER_LIST_ORDERINGS: Dict[str, Tuple[str, ...]] = {
+    "id": ("id",),
+    "-id": ("-id",),
+    "nickname": ("nickname",),
+    "-nickname": ("-nickname",),
+}
+# 스트리밍 응답 시 서버 사이드 커서에서 한 번에 가져올 행 수
+PLAYER_STREAM_CHUNK_SIZE = 500
+
 
 class PlayerList(APIView):
 
@@ -46,18 +64,43 @@ class PlayerList(APIView):
 
     @extend_schema(
         summary="전체 선수 조회",
-        description="데이터베이스에 존재하는 모든 선수 정보를 조회합니다.",
+        description="선수 목록을 커서 기반으로 페이지네이션하여 조회합니다. "
+        "stream=true 이면 페이지네이션 없이 전체 선수를 JSON 배열로 스트리밍합니다.",
+        parameters=[
+            OpenApiParameter("cursor", type=str, description="이전 응답의 next 에 포함된 커서"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기 (기본 20, 최대 100)"),
+            OpenApiParameter("ordering", type=str, enum=list(PLAYER_LIST_ORDERINGS), description="정렬 기준"),
+            OpenApiParameter("fields", type=str, description="응답에 포함할 필드 (콤마 구분) ex) id,nickname"),
+            OpenApiParameter("stream", type=bool, description="전체 목록 스트리밍 여부"),
+        ],
         responses={200: PlayerSerializer(many=True)},
     )
     # 전체 선수 조회
-    def get(self, request: Any) -> Response:
-        # 모든 Player 객체를 데이터베이스에서 조회
-        players = Player.objects.all()
-        # 조회한 Player 객체들을 PlayerSerializer를 사용하여 직렬화
-        # many=True는 여러 개의 객체를 직렬화할 때 사용
-        serializer = PlayerSerializer(players, many=True)
-        # 직렬화된 데이터를 Response 객체로 반환
-        return Response(serializer.data)
+    @cached_response("player")
+    def get(self, request: Request) -> Response | StreamingHttpResponse:
+        # ?fields=id,nickname 처럼 필요한 필드만 요청할 수 있음
+        fields: Optional[List[str]] = None
+        if request.query_params.get("fields"):
+            fields = [field.strip() for field in request.query_params["fields"].split(",") if field.strip()]
+
+        players: QuerySet[Player] = Player.objects.all()
+        # 프로필 이미지가 필요한 경우에만 이미지 URL 서브쿼리를 붙임
+        if fields is None or {"profile_image_url", "profile_image_srcset"} & set(fields):
+            players = with_player_images(players)
+
+        # 스트리밍 모드: 서버 사이드 커서에서 chunk 단위로 읽으며 바로 응답에 씀
+        if request.query_params.get("stream") in ("true", "1"):
+            serializer = PlayerSerializer(fields=fields)
+            rows = players.order_by("id").iterator(chunk_size=PLAYER_STREAM_CHUNK_SIZE)
+            return StreamingHttpResponse(
+                stream_json_list(rows, serializer.to_representation), content_type="application/json"
+            )
+
+        # 커서 기반 페이지네이션 (id / nickname)
+        paginator = KeysetPagination(orderings=PLAYER_LIST_ORDERINGS, default_ordering="id")
+        page = paginator.paginate_queryset(players, request, view=self)
+        serializer = PlayerSerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
 
     @extend_schema(
         summary="선수 등록",
@@ -92,7 +135,13 @@ class PlayerList(APIView):
 # -----------------------------------------------------------------------------------------------------------------------
 
 
-class PlayerDetail(APIView):
+class PlayerDetail(ConditionalGetMixin, APIView):
+    def get_validator_sources(self, pk: int) -> Sequence[ValidatorSource]:
+        # 선수 정보 + 프로필 / 배경 이미지
+        return [
+            (Player.objects.filter(pk=pk), "updated_at"),
+            (PlayerImage.objects.filter(player_id=pk), "updated_at"),
+        ]
 
     def get_authenticators(self) -> List[Any]:
         if not hasattr(self, "request") or self.request is None:
@@ -119,10 +168,11 @@ class PlayerDetail(APIView):
         },
     )
     # 선수 프로필 조회
+    @cached_response("player")
     def get(self, request: Request, pk: int) -> Response:
         try:
             # 주어진 pk에 해당하는 Player 객체를 조회
-            player = Player.objects.get(pk=pk)
+            player = with_player_images(Player.objects.all()).get(pk=pk)
         # 해당 객체가 존재하지 않으면 Player.DoesNotExist 예외가 발생
         # DoesNotExist는 "해당 객체가 존재하지 않음"을 나타내는 Django의 기본 예외이며
         # 이를 통해 조회 실패 시 적절한 에러 처리를 할 수 있음
@@ -255,7 +305,7 @@ class TopPlayers(APIView):
 
     @extend_schema(
         summary="전체 선수 중 구독수 상위 10위",
-        description="각 선수의 구독자 수를 계산하여 내림차순 정렬 후 상위 10명의 정보를 반환합니다.",
+        description="선수의 구독자 수(subscriber_count) 기준 내림차순으로 상위 10명의 정보를 반환합니다.",
         responses={
             200: PlayerTopSerializer(many=True),
             500: OpenApiExample(
@@ -264,18 +314,12 @@ class TopPlayers(APIView):
             ),
         },
     )
+    @cached_response("player")
     def get(self, request: Request) -> Response:
         try:
-            """
-            어노테이션은 QuerySet에 새로운 필드(계산된 값)를 추가하기 위한 메서드,
-            subscriber_count는 각 선수의 구독자 수를 나타내는 동적으로 추가된 필드,
-            Count("player_subscriptions")는 각 Player 객체와 연결된 subscriptions의 개수를 계산
-            """
-            # 각 Player 객체에 대해 연결된 subscriptions의 개수를 어노테이션하여
-            # subscriber_count 필드에 저장한 후, 이를 기준으로 내림차순 정렬하고 상위 10개를 조회
-            top_players = Player.objects.annotate(subscriber_count=Count("player_subscriptions")).order_by(
-                "-subscriber_count"
-            )[:10]
+            # 구독/구독 취소 시 갱신되는 subscriber_count 컬럼을 기준으로 정렬하므로
+            # (-subscriber_count, id) 인덱스에서 상위 10개만 읽음
+            top_players = with_player_images(Player.objects.order_by("-subscriber_count", "id"))[:10]
             # 조회된 top_players 객체들을 PlayerTopSerializer를 사용하여 직렬화
             # many=True는 여러 개의 객체를 직렬화할 때 사용
             serializer = PlayerTopSerializer(top_players, many=True)
@@ -306,21 +350,26 @@ class PositionTop(APIView):
             ),
         },
     )
+    @cached_response("player")
     def get(self, request: Any) -> Response:
         try:
+            # 포지션 별 상위 5명 쿼리를 UNION ALL 로 묶어 한 번에 조회
+            # 각 부분 쿼리는 (position, -subscriber_count, id) 인덱스 범위 스캔으로 5행만 읽음
+            per_position = [
+                with_player_images(Player.objects.filter(position=pos.value).order_by("-subscriber_count", "id"))[:5]
+                for pos in Position
+            ]
+            players_qs = per_position[0].union(*per_position[1:], all=True)
+
+            grouped: Dict[str, List[Player]] = {pos.value: [] for pos in Position}
+            for player in players_qs:
+                grouped[player.position].append(player)
+
             result = {}
-            # Position Enum에 정의된 모든 포지션에 대해 반복
-            for pos in Position:
-                # 해당 포지션에 속하는 선수들을 필터링하고 구독자 수를 어노테이션한 후 내림차순 정렬하여 상위 5명을 선택
-                players_qs = (
-                    Player.objects.filter(position=pos.value)
-                    .annotate(subscriber_count=Count("player_subscriptions"))
-                    .order_by("-subscriber_count")[:5]
-                )
-                # 선택된 선수들을 직렬화
-                serializer = PlayerPositionSerializer(players_qs, many=True)
-                # 결과 딕셔너리에 포지션 값을 키로 하여 직렬화된 데이터를 저장
-                result[pos.value] = serializer.data
+            for position, players in grouped.items():
+                # UNION ALL 결과의 순서는 보장되지 않으므로 포지션 안에서 다시 정렬
+                players.sort(key=lambda player: (-player.subscriber_count, player.id))
+                result[position] = PlayerPositionSerializer(players, many=True).data
 
             # 모든 포지션에 대한 결과를 포함하는 딕셔너리를 반환
             return Response(result, status=status.HTTP_200_OK)
@@ -333,7 +382,10 @@ class PositionTop(APIView):
 # -----------------------------------------------------------------------------------------------------------------------
 
 
-class PlayerScheduleList(APIView):
+class PlayerScheduleList(ConditionalGetMixin, APIView):
+    def get_validator_sources(self, player_id: int) -> Sequence[ValidatorSource]:
+        return [(PlayerSchedule.objects.filter(player_id=player_id), "updated_at")]
+
     def get_authenticators(self) -> List[Any]:
         if not hasattr(self, "request") or self.request is None:
             return super().get_authenticators()
@@ -353,6 +405,7 @@ class PlayerScheduleList(APIView):
         responses={200: PlayerScheduleSerializer(many=True)},
     )
     # 특정 선수의 스케줄 목록 조회
+    @cached_response("player_schedule")
     def get(self, request: Request, player_id: int) -> Response:
         # 선수 ID에 해당하는 모든 스케줄 객체들을 필터링
         schedules = PlayerSchedule.objects.filter(player_id=player_id)
@@ -424,6 +477,7 @@ class PlayerScheduleDetail(APIView):
         },
     )
     # 특정 선수 스케줄 상세 조회
+    @cached_response("player_schedule")
     def get(self, request: Request, player_id: int, schedule_id: int) -> Response:
         try:
             # 데이터베이스에서 선수 ID와 스케줄 ID가 모두 일치하는 스케줄 객체를 조회
@@ -50,7 +50,8 @@ def hard_delete_selected(modeladmin, request, queryset):
 def restore_selected(modeladmin, request, queryset):
     count = 0
     for obj in queryset:
-        if isinstance(obj, SoftDeleteModel):
+        # 삭제되지 않은 항목은 건너뜀 (복구 시그널이 구독자 수를 한 번 더 올리지 않도록)
+        if isinstance(obj, SoftDeleteModel) and obj.is_deleted:
             obj.restore()
             count += 1
     modeladmin.message_user(request, f"{count}개 항목이 복구되었습니다.", messages.SUCCESS)
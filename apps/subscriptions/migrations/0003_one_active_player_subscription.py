@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:31
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Now
+
+
+def dedupe_active_player_subscriptions(apps, schema_editor):
+    # 제약 추가 전, 동시 요청으로 여러 선수를 구독 중인 유저는 가장 최근 구독만 남기고 취소 처리 후 구독자 수 재계산
+    Player = apps.get_model("players", "Player")
+    PlayerSubscription = apps.get_model("subscriptions", "PlayerSubscription")
+    duplicates = (
+        PlayerSubscription.objects.filter(deleted_at__isnull=True)
+        .values("user_id")
+        .annotate(keep_id=Max("id"), total=Count("id"))
+        .filter(total__gt=1)
+    )
+    if not duplicates.exists():
+        return
+    for row in duplicates:
+        PlayerSubscription.objects.filter(user_id=row["user_id"], deleted_at__isnull=True).exclude(
+            id=row["keep_id"]
+        ).update(deleted_at=Now())
+
+    active_counts = (
+        PlayerSubscription.objects.filter(player=OuterRef("pk"), deleted_at__isnull=True)
+        .order_by()
+        .values("player")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Player.objects.update(subscriber_count=Coalesce(Subquery(active_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("players", "0005_search_vector"),
+        ("subscriptions", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_active_player_subscriptions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="playersubscription",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("user",),
+                name="player_subscription_one_active_per_user",
+            ),
+        ),
+    ]
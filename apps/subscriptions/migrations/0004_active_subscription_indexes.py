@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("players", "0006_player_partial_indexes"),
+        ("subscriptions", "0003_one_active_player_subscription"),
+        ("teams", "0003_team_subscriber_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="playersubscription",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["player"],
+                name="player_subscription_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamsubscription",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)), fields=["user"], name="team_subscription_user_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamsubscription",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)), fields=["team"], name="team_subscription_active_idx"
+            ),
+        ),
+    ]
@@ -17,6 +17,22 @@ class PlayerSubscription(BaseModel, SoftDeleteModel):
     class Meta:
         db_table = "player_subscription"
         unique_together = ("user_id", "player_id")  # 유저와 선수의 조합이 유니크하도록 설정
+        constraints = [
+            # 유저는 한 번에 한 선수만 구독 가능 (동시 요청도 DB 에서 막음)
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="player_subscription_one_active_per_user",
+            ),
+        ]
+        indexes = [
+            # 선수 별 활성 구독 수 (구독자 수 보정)
+            models.Index(
+                fields=["player"],
+                name="player_subscription_active_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
 
 # 팀 구독 정보를 저장하는 모델
@@ -31,6 +47,20 @@ class TeamSubscription(BaseModel, SoftDeleteModel):
     class Meta:
         db_table = "team_subscription"
         unique_together = ("user_id", "team_id")  # 유저와 팀의 조합이 유니크하도록 설정
+        indexes = [
+            # 유저의 활성 구독 팀 조회 (최애 팀 조회)
+            models.Index(
+                fields=["user"],
+                name="team_subscription_user_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 팀 별 활성 구독 수 (구독자 수 보정)
+            models.Index(
+                fields=["team"],
+                name="team_subscription_active_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"User {self.user} - {self.team.name}"  # 객체의 문자열 표현
@@ -1,5 +1,9 @@
 from datetime import timedelta
+from io import StringIO
 
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.timezone import now
 from rest_framework import status
@@ -49,7 +53,7 @@ class PlayerSubscriptionTests(APITestCase):
         )
 
     def test_get_player_subscription_count(self) -> None:
-        PlayerSubscription.objects.create(user=self.user, player=self.player)
+        self.client.post(reverse("player_subscription", args=[self.player.id]))
         url = reverse("player_subscription_count", args=[self.player.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -71,6 +75,47 @@ class PlayerSubscriptionTests(APITestCase):
             PlayerSubscription.objects.filter(user=self.user, player=self.player, deleted_at__isnull=True).exists()
         )
 
+    def test_subscribe_is_single_statement_and_idempotent(self) -> None:
+        url = reverse("player_subscription", args=[self.player.id])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # 구독 생성 + 구독자 수 증가가 한 문장 (인증 유저 조회, savepoint 제외)
+        statements = [query["sql"] for query in queries.captured_queries if "player_subscription" in query["sql"]]
+        self.assertEqual(len(statements), 1)
+
+        # 같은 선수를 다시 구독해도 구독 / 카운터가 늘어나지 않음
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(PlayerSubscription.global_objects.filter(user=self.user).count(), 1)
+        self.player.refresh_from_db()
+        self.assertEqual(self.player.subscriber_count, 1)
+
+    def test_subscribe_second_player_rejected_by_constraint(self) -> None:
+        other = Player.objects.create(
+            realname="Other Realname",
+            nickname="Other Nickname",
+            gamename="Other Gamename",
+            position="top",
+            date_of_birth="1990-01-01",
+            debut_date="2010-01-01",
+            agency="Test Agency",
+        )
+        self.client.post(reverse("player_subscription", args=[self.player.id]))
+
+        response = self.client.post(reverse("player_subscription", args=[other.id]))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        other.refresh_from_db()
+        self.assertEqual(other.subscriber_count, 0)
+
+    def test_unsubscribe_twice_decrements_once(self) -> None:
+        url = reverse("player_subscription", args=[self.player.id])
+        self.client.post(url)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.player.refresh_from_db()
+        self.assertEqual(self.player.subscriber_count, 0)
+
 
 class TeamSubscriptionTests(APITestCase):
     def setUp(self) -> None:
@@ -98,12 +143,25 @@ class TeamSubscriptionTests(APITestCase):
         )
 
     def test_get_team_subscription_count(self) -> None:
-        TeamSubscription.objects.create(user=self.user, team=self.team)
+        self.client.post(reverse("team_subscription", args=[self.team.id]))
         url = reverse("team_subscription_count", args=[self.team.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 1)
 
+    def test_get_team_subscription_counts_in_batch(self) -> None:
+        other = Team.objects.create(name="Other Team")
+        self.client.post(reverse("team_subscription", args=[self.team.id]))
+        url = reverse("team_subscription_counts")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"ids": f"{other.id},{self.team.id},999999"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["counts"], {str(other.id): 0, str(self.team.id): 1})
+
+        response = self.client.get(url, {"ids": "1,a"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_team_resubscribe_within_24_hours(self) -> None:
         subscription = TeamSubscription.objects.create(user=self.user, team=self.team)
         subscription.delete()
@@ -119,3 +177,57 @@ class TeamSubscriptionTests(APITestCase):
         self.assertTrue(
             TeamSubscription.objects.filter(user=self.user, team=self.team, deleted_at__isnull=True).exists()
         )
+
+    def test_subscriber_count_follows_subscribe_and_unsubscribe(self) -> None:
+        url = reverse("team_subscription", args=[self.team.id])
+        self.client.post(url)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.subscriber_count, 1)
+
+        self.client.delete(url)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.subscriber_count, 0)
+
+    def test_rank_reads_counter_and_reconcile_fixes_drift(self) -> None:
+        other = Team.objects.create(name="Other Team")
+        # 카운터를 거치지 않은 구독 (드리프트)
+        TeamSubscription.objects.create(user=self.user, team=other)
+        Team.objects.filter(id=self.team.id).update(subscriber_count=3)
+
+        response = self.client.get(reverse("team-rank"))
+        self.assertEqual([team["id"] for team in response.data], [self.team.id, other.id])
+
+        call_command("reconcile_subscriber_counts", stdout=StringIO())
+        self.assertEqual(
+            dict(Team.objects.values_list("id", "subscriber_count")),
+            {self.team.id: 0, other.id: 1},
+        )
+        response = self.client.get(reverse("team-rank"))
+        self.assertEqual([team["id"] for team in response.data], [other.id, self.team.id])
+
+    def test_withdraw_decrements_subscriber_counts(self) -> None:
+        player = Player.objects.create(
+            realname="Test Realname",
+            nickname="Test Nickname",
+            gamename="Test Gamename",
+            position="mid",
+            date_of_birth="1990-01-01",
+            debut_date="2010-01-01",
+            agency="Test Agency",
+        )
+        self.client.post(reverse("team_subscription", args=[self.team.id]))
+        self.client.post(reverse("player_subscription", args=[player.id]))
+        # 이미 취소된 구독은 cascade 에서 다시 감소시키지 않음
+        other = Team.objects.create(name="Other Team", subscriber_count=1)
+        TeamSubscription.objects.create(user=self.user, team=other, deleted_at=now() - timedelta(days=1))
+
+        response = self.client.post(reverse("withdraw"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(TeamSubscription.objects.filter(user=self.user).exists())
+        self.assertEqual(Team.objects.get(id=self.team.id).subscriber_count, 0)
+        self.assertEqual(Team.objects.get(id=other.id).subscriber_count, 1)
+        self.assertEqual(Player.objects.get(id=player.id).subscriber_count, 0)
+
+        # 관리자에서 구독을 복구하면 구독자 수도 함께 복구
+        TeamSubscription.global_objects.get(user=self.user, team=self.team).restore()
+        self.assertEqual(Team.objects.get(id=self.team.id).subscriber_count, 1)
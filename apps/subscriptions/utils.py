@@ -0,0 +1,156 @@
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, IntegerField, Model, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+# 구독 취소 후 같은 대상을 다시 구독할 수 있기까지의 시간
+RESUBSCRIBE_COOLDOWN = timedelta(hours=24)
+
+# subscribe() 결과
+SUBSCRIBED = "subscribed"
+ALREADY_SUBSCRIBED = "already_subscribed"
+RESUBSCRIBE_TOO_SOON = "resubscribe_too_soon"
+OWNER_NOT_FOUND = "owner_not_found"
+# 유저 당 활성 구독 1개 제약(player_subscription_one_active_per_user) 위반
+ACTIVE_LIMIT_EXCEEDED = "active_limit_exceeded"
+
+
+def active_subscriber_count(subscription_model: Type[Model], owner_field: str) -> Coalesce:
+    """
+    구독 대상 별 활성(삭제되지 않은) 구독 수를 세는 상관 서브쿼리 (카운터 보정용)
+
+    Args:
+        subscription_model (Type[Model]): PlayerSubscription / TeamSubscription
+        owner_field (str): 구독 대상 FK 이름 ("player", "team")
+    """
+    counts = (
+        subscription_model._default_manager.filter(**{owner_field: OuterRef("pk")})
+        .order_by()
+        .values(owner_field)
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def get_subscriber_counts(model: Type[Model], ids: List[int]) -> Dict[int, int]:
+    # 구독 대상들의 subscriber_count 카운터를 pk 조회 1번으로 읽음 (없는 대상은 제외)
+    return dict(model._default_manager.filter(pk__in=ids).values_list("pk", "subscriber_count"))
+
+
+def adjust_subscriber_count(owner_model: Type[Model], owner_id: int, delta: int) -> None:
+    # 구독 API 를 거치지 않은 구독 삭제 / 복구(회원 탈퇴, 선수 / 팀 삭제의 soft delete cascade, 관리자)를 카운터에 반영
+    owner_model._base_manager.filter(pk=owner_id).update(subscriber_count=Greatest(F("subscriber_count") + delta, 0))
+
+
+def parse_ids(raw: Optional[str], limit: int) -> List[int]:
+    """
+    "1,2,3" 형태의 id 목록을 파싱 (중복 제거, 입력 순서 유지)
+
+    Raises:
+        ValueError: 정수가 아닌 값이 있거나 개수가 limit 를 넘는 경우
+    """
+    ids = list(dict.fromkeys(int(value) for value in (raw or "").split(",") if value.strip()))
+    if not ids or len(ids) > limit:
+        raise ValueError(f"ids 는 1 ~ {limit} 개여야 합니다.")
+    return ids
+
+
+def subscription_tables(subscription_model: Type[Model], owner_model: Type[Model], owner_field: str) -> Dict[str, str]:
+    # SQL 에 넣을 테이블 / 컬럼 이름 (모델 메타 정보에서 가져오므로 사용자 입력이 들어가지 않음)
+    quote = connection.ops.quote_name
+    return {
+        "table": quote(subscription_model._meta.db_table),
+        "owner_table": quote(owner_model._meta.db_table),
+        "owner_column": quote(f"{owner_field}_id"),
+        "columns": ", ".join(quote(str(field.column)) for field in subscription_model._meta.concrete_fields),
+    }
+
+
+def subscribe(
+    subscription_model: Type[Model], owner_model: Type[Model], owner_field: str, user_id: int, owner_id: int
+) -> Tuple[str, Optional[Any]]:
+    """
+    구독 생성 / 재구독과 구독자 수 증가를 SQL 1번으로 처리
+
+    (user, 대상) unique 제약에 대한 INSERT ... ON CONFLICT DO UPDATE 로 새 구독을 만들거나,
+    취소한 지 24시간이 지난 구독만 복구합니다. 구독이 만들어진 경우에만 같은 문장의 CTE 에서 대상의 subscriber_count 를 올리므로
+    잠금 없이 동시에 같은 요청이 들어와도 중복 구독이나 카운터 중복 증가가 생기지 않습니다.
+    구독이 만들어지지 않은 경우에만 원인을 구분하기 위해 추가로 조회합니다.
+
+    Args:
+        subscription_model (Type[Model]): PlayerSubscription / TeamSubscription
+        owner_model (Type[Model]): Player / Team
+        owner_field (str): 구독 대상 FK 이름 ("player", "team")
+
+    Returns:
+        Tuple[str, Optional[Any]]: (결과, 생성 / 복구된 구독 - SUBSCRIBED 인 경우만)
+    """
+    now = timezone.now()
+    sql = """
+        WITH owner AS (
+            SELECT id FROM {owner_table} WHERE id = %(owner_id)s AND deleted_at IS NULL
+        ), upserted AS (
+            INSERT INTO {table} (user_id, {owner_column}, created_at, updated_at)
+            SELECT %(user_id)s, owner.id, %(now)s, %(now)s FROM owner
+            ON CONFLICT (user_id, {owner_column}) DO UPDATE
+                SET deleted_at = NULL, restored_at = EXCLUDED.updated_at,
+                    updated_at = EXCLUDED.updated_at, transaction_id = NULL
+                WHERE {table}.deleted_at IS NOT NULL AND {table}.deleted_at <= %(resubscribable_at)s
+            RETURNING {columns}
+        ), counted AS (
+            UPDATE {owner_table} SET subscriber_count = subscriber_count + 1
+            WHERE id IN (SELECT {owner_column} FROM upserted)
+        )
+        SELECT {columns} FROM upserted
+    """.format(**subscription_tables(subscription_model, owner_model, owner_field))
+    params: Dict[str, Any] = {
+        "owner_id": owner_id,
+        "user_id": user_id,
+        "now": now,
+        "resubscribable_at": now - RESUBSCRIBE_COOLDOWN,
+    }
+    try:
+        # 제약 위반 시 바깥 트랜잭션을 깨뜨리지 않도록 savepoint
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+    except IntegrityError:
+        return ACTIVE_LIMIT_EXCEEDED, None
+    if row is not None:
+        field_names = [field.attname for field in subscription_model._meta.concrete_fields]
+        return SUBSCRIBED, subscription_model.from_db(connection.alias, field_names, row)
+
+    if not owner_model._default_manager.filter(pk=owner_id).exists():
+        return OWNER_NOT_FOUND, None
+    active = subscription_model._default_manager.filter(user_id=user_id, **{f"{owner_field}_id": owner_id}).exists()
+    return (ALREADY_SUBSCRIBED if active else RESUBSCRIBE_TOO_SOON), None
+
+
+def unsubscribe(
+    subscription_model: Type[Model], owner_model: Type[Model], owner_field: str, user_id: int, owner_id: int
+) -> bool:
+    """
+    활성 구독 soft delete 와 구독자 수 감소를 SQL 1번으로 처리하고, 취소한 구독이 있었는지 반환
+
+    활성 구독이 있는 경우에만 같은 문장의 CTE 에서 subscriber_count 를 내리므로 동시 취소 요청에도 한 번만 감소합니다.
+    """
+    now = timezone.now()
+    sql = """
+        WITH cancelled AS (
+            UPDATE {table} SET deleted_at = %(now)s, updated_at = %(now)s, restored_at = NULL
+            WHERE user_id = %(user_id)s AND {owner_column} = %(owner_id)s AND deleted_at IS NULL
+            RETURNING {owner_column}
+        ), counted AS (
+            UPDATE {owner_table} SET subscriber_count = GREATEST(subscriber_count - 1, 0)
+            WHERE id IN (SELECT {owner_column} FROM cancelled)
+        )
+        SELECT COUNT(*) FROM cancelled
+    """.format(**subscription_tables(subscription_model, owner_model, owner_field))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {"now": now, "user_id": user_id, "owner_id": owner_id})
+        (cancelled,) = cursor.fetchone()
+    return bool(cancelled)
@@ -1,15 +1,13 @@
-from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Type
 
-from django.db import transaction
-from django.shortcuts import get_object_or_404
-from django.utils import timezone
-from drf_spectacular.utils import OpenApiExample, extend_schema
+from django.db.models import Model
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common.cache import invalidate
 from apps.players.models import Player
 from apps.players.serializers import PlayerSerializer
 from apps.teams.models import Team
@@ -17,6 +15,46 @@ from apps.teams.serializers import TeamSerializer
 
 from .models import PlayerSubscription, TeamSubscription
 from .serializers import PlayerSubscriptionSerializer, TeamSubscriptionSerializer
+from .utils import (
+    ACTIVE_LIMIT_EXCEEDED,
+    ALREADY_SUBSCRIBED,
+    OWNER_NOT_FOUND,
+    SUBSCRIBED,
+    get_subscriber_counts,
+    parse_ids,
+    subscribe,
+    unsubscribe,
+)
+
+
+def subscribe_response(result: str, subscription: Optional[Any], serializer_class: Any, owner_field: str) -> Response:
+    # subscribe() 결과를 기존 API 응답 형식으로 변환
+    if result == SUBSCRIBED:
+        # SQL 로 직접 쓰므로 post_save 시그널 대신 여기서 랭킹 응답 캐시를 무효화
+        invalidate((owner_field,))
+        return Response(serializer_class(subscription).data, status=status.HTTP_201_CREATED)
+    if result == OWNER_NOT_FOUND:
+        return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+    if result == ALREADY_SUBSCRIBED:
+        return Response({"message": f"You are already subscribed to this {owner_field}."}, status=status.HTTP_200_OK)
+    if result == ACTIVE_LIMIT_EXCEEDED:
+        return Response(
+            {"error": f"You can only subscribe to one {owner_field} at a time. Unsubscribe first."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return Response(
+        {"error": "You cannot resubscribe within 24 hours of unsubscribing."},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def unsubscribe_response(
+    subscription_model: Type[Model], owner_model: Type[Model], owner_field: str, user_id: int, owner_id: int
+) -> Response:
+    if not unsubscribe(subscription_model, owner_model, owner_field, user_id, owner_id):
+        return Response(status=status.HTTP_404_NOT_FOUND)
+    invalidate((owner_field,))
+    return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class PlayerSubscriptionView(APIView):
@@ -35,57 +73,9 @@ class PlayerSubscriptionView(APIView):
             ),
         },
     )
-    @transaction.atomic  # 동시성 문제를 해결하기 위해 트랜잭션
     def post(self, request: Any, player_id: int) -> Response:
-        user = request.user
-        player = get_object_or_404(Player, id=player_id)
-        now = timezone.now()
-
-        # 이미 다른 선수를 구독 중인지 확인
-        existing_subscription = PlayerSubscription.objects.filter(user=user, deleted_at__isnull=True).first()
-        if existing_subscription:
-            return Response(
-                {"error": "You can only subscribe to one player at a time. Unsubscribe first."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # 이미 같은 선수를 구독 중인지 확인
-        active_subscription: Optional[PlayerSubscription] = PlayerSubscription.objects.filter(
-            user=user, player=player, deleted_at__isnull=True
-        ).first()
-        if active_subscription:
-            return Response(
-                {"message": "You are already subscribed to this player."},
-                status=status.HTTP_200_OK,
-            )
-
-        # Soft-delete된 구독이 있는지 확인 (deleted_objects 사용)
-        # Optional: 값이 존재할 수도 존재하지 않을 수도 있음
-        deleted_subscription: Optional[PlayerSubscription] = PlayerSubscription.deleted_objects.filter(
-            user=user, player=player
-        ).first()
-
-        # 구독을 취소한 지 24시간이 지났는 지 유효성 검사
-        if (
-            deleted_subscription
-            and deleted_subscription.deleted_at
-            and now - deleted_subscription.deleted_at < timedelta(hours=24)
-        ):
-            return Response(
-                {"error": "You cannot resubscribe within 24 hours of unsubscribing."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # 새로운 구독자가 이전과 같으면 restore, 아니면 새로 생성
-        if deleted_subscription and deleted_subscription.player.id == player.id:
-            deleted_subscription.restore()
-            deleted_subscription.save()
-            serializer = PlayerSubscriptionSerializer(deleted_subscription)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        else:
-            subscription = PlayerSubscription.objects.create(user=user, player=player)
-            serializer = PlayerSubscriptionSerializer(subscription)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        result, subscription = subscribe(PlayerSubscription, Player, "player", request.user.id, player_id)
+        return subscribe_response(result, subscription, PlayerSubscriptionSerializer, "player")
 
     @extend_schema(
         summary="선수 구독 취소",
@@ -100,16 +90,8 @@ class PlayerSubscriptionView(APIView):
             ),
         },
     )
-    @transaction.atomic
     def delete(self, request: Any, player_id: int) -> Response:
-        user = request.user
-        subscription: Optional[PlayerSubscription] = get_object_or_404(
-            PlayerSubscription, user=user, player_id=player_id
-        )
-        if subscription:
-            subscription.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        return Response(status=status.HTTP_404_NOT_FOUND)
+        return unsubscribe_response(PlayerSubscription, Player, "player", request.user.id, player_id)
 
 
 class PlayerSubscriptionDetailView(APIView):
@@ -141,36 +123,9 @@ class TeamSubscriptionView(APIView):
             ),
         },
     )
-    @transaction.atomic  # 동시성 문제를 해결하기 위해 트랜잭션
     def post(self, request: Any, team_id: int) -> Response:
-        user = request.user
-        team = get_object_or_404(Team, id=team_id)
-        now = timezone.now()
-
-        active_subscription: Optional[TeamSubscription] = TeamSubscription.objects.filter(user=user, team=team).first()
-        if active_subscription:
-            return Response(
-                {"message": "You are already subscribed to this team."},
-                status=status.HTTP_200_OK,
-            )
-
-        # Soft-delete된 구독이 있는지 확인 (all_objects 사용)
-        deleted_subscription = TeamSubscription.deleted_objects.filter(user=user, team=team).first()
-
-        if deleted_subscription:
-            if deleted_subscription.deleted_at and now - deleted_subscription.deleted_at < timedelta(hours=24):
-                return Response(
-                    {"error": "You cannot resubscribe within 24 hours of unsubscribing."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            deleted_subscription.restore()
-            deleted_subscription.save()
-            serializer = TeamSubscriptionSerializer(deleted_subscription)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        else:
-            subscription = TeamSubscription.objects.create(user=user, team=team)
-            serializer = TeamSubscriptionSerializer(subscription)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        result, subscription = subscribe(TeamSubscription, Team, "team", request.user.id, team_id)
+        return subscribe_response(result, subscription, TeamSubscriptionSerializer, "team")
 
     @extend_schema(
         summary="팀 구독 취소",
@@ -185,14 +140,8 @@ class TeamSubscriptionView(APIView):
             ),
         },
     )
-    @transaction.atomic
     def delete(self, request: Any, team_id: int) -> Response:
-        user = request.user
-        subscription: Optional[TeamSubscription] = get_object_or_404(TeamSubscription, user=user, team_id=team_id)
-        if subscription:
-            subscription.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        return Response(status=status.HTTP_404_NOT_FOUND)
+        return unsubscribe_response(TeamSubscription, Team, "team", request.user.id, team_id)
 
 
 class TeamSubscriptionDetailView(APIView):
@@ -209,14 +158,47 @@ class TeamSubscriptionDetailView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+# 구독 수 일괄 조회 최대 id 수
+SUBSCRIPTION_COUNT_MAX_IDS = 100
+
+
+def subscriber_count_response(model: Type[Model], pk: int) -> Response:
+    # COUNT(*) 대신 구독 / 구독 취소 시 갱신되는 카운터를 읽음 (없는 대상은 0)
+    return Response({"count": get_subscriber_counts(model, [pk]).get(pk, 0)})
+
+
+def subscriber_counts_response(request: Any, model: Type[Model]) -> Response:
+    try:
+        ids = parse_ids(request.query_params.get("ids"), SUBSCRIPTION_COUNT_MAX_IDS)
+    except ValueError:
+        return Response(
+            {"error": f"ids must be 1 to {SUBSCRIPTION_COUNT_MAX_IDS} comma separated integers."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    counts = get_subscriber_counts(model, ids)
+    return Response({"counts": {str(pk): counts[pk] for pk in ids if pk in counts}})
+
+
 class PlayerSubscriptionCountView(APIView):
     permission_classes = (AllowAny,)
     authentication_classes = ()
 
     @extend_schema(summary="선수 구독 수")
     def get(self, request: Any, player_id: int) -> Response:
-        count = PlayerSubscription.objects.filter(player_id=player_id, deleted_at__isnull=True).count()
-        return Response({"count": count})
+        return subscriber_count_response(Player, player_id)
+
+
+class PlayerSubscriptionCountsView(APIView):
+    permission_classes = (AllowAny,)
+    authentication_classes = ()
+
+    @extend_schema(
+        summary="선수 구독 수 일괄 조회",
+        parameters=[OpenApiParameter("ids", type=str, description="선수 id 목록 (ex. 1,2,3)", required=True)],
+        responses={200: OpenApiExample("성공 응답 예시", value={"counts": {"1": 120, "2": 45}})},
+    )
+    def get(self, request: Any) -> Response:
+        return subscriber_counts_response(request, Player)
 
 
 class TeamSubscriptionCountView(APIView):
@@ -225,5 +207,17 @@ class TeamSubscriptionCountView(APIView):
 
     @extend_schema(summary="팀 구독 수")
     def get(self, request: Any, team_id: int) -> Response:
-        count = TeamSubscription.objects.filter(team_id=team_id, deleted_at__isnull=True).count()
-        return Response({"count": count})
+        return subscriber_count_response(Team, team_id)
+
+
+class TeamSubscriptionCountsView(APIView):
+    permission_classes = (AllowAny,)
+    authentication_classes = ()
+
+    @extend_schema(
+        summary="팀 구독 수 일괄 조회",
+        parameters=[OpenApiParameter("ids", type=str, description="팀 id 목록 (ex. 1,2,3)", required=True)],
+        responses={200: OpenApiExample("성공 응답 예시", value={"counts": {"1": 1200, "2": 450}})},
+    )
+    def get(self, request: Any) -> Response:
+        return subscriber_counts_response(request, Team)
@@ -0,0 +1,25 @@
+from django.db.models import Prefetch, QuerySet
+
+from apps.cloud_images.loaders import with_player_images, with_team_images
+from apps.players.models import Player
+
+from .models import Team
+
+
+def with_team_aggregate(queryset: QuerySet[Team], roster: bool = True, tags: bool = True) -> QuerySet[Team]:
+    """
+    팀 응답에 필요한 연관 데이터를 고정된 쿼리 수로 불러오도록 queryset 을 구성
+
+    - 팀 프로필 / 배경 이미지: 팀 조회 쿼리에 annotate
+    - 소속 선수 목록 (soft delete 된 선수 제외) + 선수 이미지: prefetch 쿼리 1번
+    - 태그: prefetch 쿼리 1번
+
+    팀 수와 선수 수에 상관없이 최대 3번 (팀 / 선수 / 태그) 조회합니다.
+    """
+    queryset = with_team_images(queryset)
+    if roster:
+        players = with_player_images(Player.objects.order_by("id"))
+        queryset = queryset.prefetch_related(Prefetch("player_set", queryset=players))
+    if tags:
+        queryset = queryset.prefetch_related("tags")  # type: ignore[misc]
+    return queryset
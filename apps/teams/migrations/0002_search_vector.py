@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+        ("teams", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="team",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector("name", config="simple", weight="A"),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="teamschedule",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector("title", config="simple", weight="A"),
+                    "||",
+                    django.contrib.postgres.search.SearchVector("place", "detail", config="simple", weight="B"),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="team_search_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="teamschedule",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="team_schedule_search_idx"),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:27
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_subscriber_count(apps, schema_editor):
+    # 기존 활성 구독(삭제되지 않은 구독) 수로 카운터를 채움
+    Team = apps.get_model("teams", "Team")
+    TeamSubscription = apps.get_model("subscriptions", "TeamSubscription")
+    active_counts = (
+        TeamSubscription.objects.filter(team=OuterRef("pk"), deleted_at__isnull=True)
+        .order_by()
+        .values("team")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Team.objects.update(subscriber_count=Coalesce(Subquery(active_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+        ("teams", "0002_search_vector"),
+        ("subscriptions", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="team",
+            name="subscriber_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["-subscriber_count", "id"],
+                name="team_subscriber_rank_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_subscriber_count, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django_softdelete.models import SoftDeleteModel
 from taggit.managers import TaggableManager
@@ -14,12 +16,30 @@ class Team(BaseModel, SoftDeleteModel):
         default=dict, blank=True, null=True, help_text="소셜 미디어 URL (insta, facebook, youtube, twitter)"
     )
     tags = TaggableManager(blank=True)
+    # 활성(삭제되지 않은) 구독 수 - 구독 / 구독 취소 SQL 에서 함께 증감 (subscriptions.utils), reconcile_subscriber_counts 로 보정
+    subscriber_count = models.PositiveIntegerField(default=0)
+
+    # 통합 검색용 tsvector (팀 이름 A)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("name", weight="A", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     def __str__(self) -> str:
         return self.name
 
     class Meta:
         db_table = "team"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="team_search_idx"),
+            # 구독자 수 상위 N팀 조회 (TeamRank)
+            models.Index(
+                fields=["-subscriber_count", "id"],
+                name="team_subscriber_rank_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
 
 # 팀 일정을 저장하는 모델
@@ -39,8 +59,19 @@ class TeamSchedule(BaseModel):
     # 일정에 대한 상세 내용
     detail = models.CharField(max_length=255, blank=True, null=True, help_text="내용")
 
+    # 통합 검색용 tsvector (제목 A, 장소 / 내용 B)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config="simple")
+        + SearchVector("place", "detail", weight="B", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     def __str__(self) -> str:
         return f"{self.team.name} - {self.title}"
 
     class Meta:
         db_table = "team_schedule"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="team_schedule_search_idx"),
+        ]
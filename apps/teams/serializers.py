@@ -2,6 +2,7 @@ from typing import Any, Dict
 
 from rest_framework import serializers
 
+from apps.cloud_images.loaders import get_image_srcset, get_image_url
 from apps.players.models import Player  # Player 모델 import
 from apps.subscriptions.models import TeamSubscription
 
@@ -11,17 +12,18 @@ from .models import Team, TeamSchedule
 # 소속된 선수 정보를 위한 시리얼라이저
 class PlayerForTeamSerializer(serializers.ModelSerializer[Player]):
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Player
         # 선수의 주요 정보만 제공
-        fields = ["id", "nickname", "position", "realname", "social", "profile_image_url"]
+        fields = ["id", "nickname", "position", "realname", "social", "profile_image_url", "profile_image_srcset"]
 
     def get_profile_image_url(self, obj: Player) -> str | None:
-        image = obj.player_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Player) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
 
 # 소셜 미디어 정보를 직렬화하는 시리얼라이저
@@ -39,7 +41,10 @@ class TeamDetailSerializer(serializers.ModelSerializer[Team]):
     social = TeamSocialSerializer()
     players = PlayerForTeamSerializer(many=True, source="player_set")  # 팀에 소속된 선수 목록 추가
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
     background_image_url = serializers.SerializerMethodField()
+    background_image_srcset = serializers.SerializerMethodField()
+    tags = serializers.SerializerMethodField()
 
     class Meta:
         model = Team
@@ -49,36 +54,44 @@ class TeamDetailSerializer(serializers.ModelSerializer[Team]):
             "social",
             "players",
             "profile_image_url",
+            "profile_image_srcset",
             "background_image_url",
+            "background_image_srcset",
+            "tags",
         ]
 
     def get_profile_image_url(self, obj: Team) -> str | None:
-        image = obj.team_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Team) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
     def get_background_image_url(self, obj: Team) -> str | None:
-        image = obj.team_images.filter(category="background").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "background")
+
+    def get_background_image_srcset(self, obj: Team) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "background")
+
+    def get_tags(self, obj: Team) -> list[str]:
+        # with_team_aggregate 로 prefetch 된 태그를 사용 (all() 이어야 prefetch 캐시를 탐)
+        return sorted(tag.name for tag in obj.tags.all())
 
 
 # 팀 전제 조회용 시리얼라이저
 class TeamSerializer(serializers.ModelSerializer[Team]):
     social = TeamSocialSerializer()
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Team
-        fields = ["id", "name", "social", "profile_image_url"]
+        fields = ["id", "name", "social", "profile_image_url", "profile_image_srcset"]
 
     def get_profile_image_url(self, obj: Team) -> str | None:
-        image = obj.team_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Team) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
 
 # 팀 등록용 시리얼라이저
@@ -96,20 +109,21 @@ class TeamCreateSerializer(serializers.ModelSerializer[Team]):
 # 상위 5팀 정보를 직렬화하는 시리얼라이저
 class TeamTopSerializer(serializers.ModelSerializer[Team]):
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Team
-        fields = ["id", "name", "profile_image_url"]
+        fields = ["id", "name", "profile_image_url", "profile_image_srcset"]
 
     def get_profile_image_url(self, obj: Team) -> str | None:
-        image = obj.team_images.filter(category="profile").first()
-        if image:
-            return image.image_url
-        return None
+        return get_image_url(obj, "profile")
+
+    def get_profile_image_srcset(self, obj: Team) -> Dict[str, Dict[str, str]]:
+        return get_image_srcset(obj, "profile")
 
 
 # 팀 스케줄 정보를 위한 시리얼라이저
 class TeamScheduleSerializer(serializers.ModelSerializer[TeamSchedule]):
     class Meta:
         model = TeamSchedule
-        fields = "__all__"
+        exclude = ("search_vector",)  # 검색용 생성 컬럼 제외
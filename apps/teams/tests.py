@@ -1,3 +1,75 @@
-from django.test import TestCase
+from __future__ import annotations
 
-# Create your tests here.
+from datetime import date
+from typing import ClassVar
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.cloud_images.models import PlayerImage, TeamImage
+from apps.players.models import Player
+
+from .loaders import with_team_aggregate
+from .models import Team
+from .serializers import TeamDetailSerializer
+
+
+class TeamAggregateTest(APITestCase):
+    team: ClassVar[Team]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.team = Team.objects.create(name="T1")
+        cls.team.tags.add("티원", "SKT")
+        TeamImage.objects.create(team=cls.team, category="profile", image_url="https://img.test/t1.png")
+        TeamImage.objects.create(team=cls.team, category="background", image_url="https://img.test/t1-bg.png")
+        for i in range(4):
+            player = Player.objects.create(
+                team=cls.team,
+                realname=f"RealName{i}",
+                nickname=f"Nick{i}",
+                gamename=f"GameName{i}",
+                position="mid",
+                date_of_birth=date(1996, 5, 7),
+                debut_date=date(2013, 2, 13),
+            )
+            PlayerImage.objects.create(player=player, category="profile", image_url=f"https://img.test/{i}.png")
+        # 은퇴(soft delete)한 선수는 로스터에서 제외
+        player.delete()
+
+    def test_team_detail_loads_in_fixed_queries(self) -> None:
+        # 팀(이미지 annotate) + 선수(이미지 annotate) + 태그
+        with self.assertNumQueries(3):
+            data = TeamDetailSerializer(with_team_aggregate(Team.objects.all()).get(pk=self.team.pk)).data
+
+        self.assertEqual([p["nickname"] for p in data["players"]], ["Nick0", "Nick1", "Nick2"])
+        self.assertEqual(data["players"][0]["profile_image_url"], "https://img.test/0.png")
+        self.assertEqual(data["background_image_url"], "https://img.test/t1-bg.png")
+        self.assertEqual(data["tags"], ["SKT", "티원"])
+
+    def test_team_detail_view(self) -> None:
+        response = self.client.get(reverse("team-detail", args=[self.team.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["players"]), 3)
+        self.assertEqual(response.data["profile_image_url"], "https://img.test/t1.png")
+
+    @override_settings(RESPONSE_CACHE_ENABLED=True)
+    def test_team_detail_reflects_tag_changes(self) -> None:
+        cache.clear()
+        url = reverse("team-detail", args=[self.team.pk])
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        self.team.tags.add("LCK")
+        # 캐시 / 304 가 아니라 새 태그가 포함된 응답
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["tags"], ["LCK", "SKT", "티원"])
+        self.assertNotEqual(response["ETag"], etag)
+
+        self.team.tags.remove("LCK")
+        response = self.client.get(url)
+        self.assertEqual(response.data["tags"], ["SKT", "티원"])
@@ -1,6 +1,6 @@
-from typing import Any, List
+from typing import Any, List, Sequence
 
-from django.db.models import Count
+from django.contrib.contenttypes.models import ContentType
 from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound
@@ -8,7 +8,15 @@ from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from taggit.models import TaggedItem
 
+from apps.cloud_images.loaders import with_team_images
+from apps.cloud_images.models import PlayerImage, TeamImage
+from apps.common.cache import cached_response
+from apps.common.mixins import ConditionalGetMixin, ValidatorSource
+from apps.players.models import Player
+
+from .loaders import with_team_aggregate
 from .models import Team, TeamSchedule
 from .serializers import (
     TeamCreateSerializer,
@@ -19,7 +27,13 @@ from .serializers import (
 )
 
 
-class TeamList(APIView):
+class TeamList(ConditionalGetMixin, APIView):
+    def get_validator_sources(self) -> Sequence[ValidatorSource]:
+        return [
+            (Team.objects.all(), "updated_at"),
+            (TeamImage.objects.filter(category="profile"), "updated_at"),
+        ]
+
     def get_authenticators(self) -> List[Any]:
         if not hasattr(self, "request") or self.request is None:
             return super().get_authenticators()
@@ -39,8 +53,9 @@ class TeamList(APIView):
         responses={200: TeamSerializer(many=True)},
     )
     # 팀 전체 조회
+    @cached_response("team")
     def get(self, request: Any) -> Response:
-        teams = Team.objects.all()
+        teams = with_team_aggregate(Team.objects.order_by("id"), roster=False, tags=False)
         serializer = TeamSerializer(teams, many=True)
         return Response(serializer.data)
 
@@ -72,7 +87,17 @@ class TeamList(APIView):
 # -----------------------------------------------------------------------------------------------------------------------
 
 
-class TeamDetail(APIView):
+class TeamDetail(ConditionalGetMixin, APIView):
+    def get_validator_sources(self, pk: int) -> Sequence[ValidatorSource]:
+        # 팀 정보 + 팀 이미지 + 소속 선수 목록과 선수 프로필 이미지 + 팀 태그
+        return [
+            (Team.objects.filter(pk=pk), "updated_at"),
+            (TeamImage.objects.filter(team_id=pk), "updated_at"),
+            (Player.objects.filter(team_id=pk), "updated_at"),
+            (PlayerImage.objects.filter(player__team_id=pk), "updated_at"),
+            (TaggedItem.objects.filter(content_type=ContentType.objects.get_for_model(Team), object_id=pk), "id"),
+        ]
+
     def get_authenticators(self) -> List[Any]:
         if not hasattr(self, "request") or self.request is None:
             return super().get_authenticators()
@@ -98,9 +123,10 @@ class TeamDetail(APIView):
         },
     )
     # 팀 상세 페이지 조회
+    @cached_response("team", "player", "tag")
     def get(self, request: Any, pk: int) -> Response:
         try:
-            team = Team.objects.prefetch_related("player_set").get(pk=pk)
+            team = with_team_aggregate(Team.objects.all()).get(pk=pk)
         except Team.DoesNotExist:
             raise NotFound(detail="해당 팀을 찾을 수 없습니다.")
 
@@ -184,11 +210,11 @@ class TeamRank(APIView):
             ),
         },
     )
+    @cached_response("team")
     def get(self, request: Any) -> Response:
         try:
-            top_teams = Team.objects.annotate(subscriber_count=Count("team_subscriptions")).order_by(
-                "-subscriber_count"
-            )[:5]
+            # 구독 / 구독 취소 시 갱신되는 subscriber_count 를 인덱스(team_subscriber_rank_idx) 순서로 읽음
+            top_teams = with_team_images(Team.objects.order_by("-subscriber_count", "id"))[:5]
             serializer = TeamTopSerializer(top_teams, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception as e:
@@ -199,7 +225,9 @@ class TeamRank(APIView):
 # -----------------------------------------------------------------------------------------------------------------------
 
 
-class TeamScheduleList(APIView):
+class TeamScheduleList(ConditionalGetMixin, APIView):
+    def get_validator_sources(self, team_id: int) -> Sequence[ValidatorSource]:
+        return [(TeamSchedule.objects.filter(team_id=team_id), "updated_at")]
 
     def get_authenticators(self) -> List[Any]:
         if not hasattr(self, "request") or self.request is None:
@@ -220,6 +248,7 @@ class TeamScheduleList(APIView):
         responses={200: TeamScheduleSerializer(many=True)},
     )
     # 특정 팀의 스케줄 조회
+    @cached_response("team_schedule")
     def get(self, request: Any, team_id: int) -> Response:
         schedules = TeamSchedule.objects.filter(team_id=team_id)
         serializer = TeamScheduleSerializer(schedules, many=True)
@@ -281,6 +310,7 @@ class TeamScheduleDetail(APIView):
         },
     )
     # 특정 팀 스케줄 상세 조회
+    @cached_response("team_schedule")
     def get(self, request: Any, team_id: int, schedule_id: int) -> Response:
         try:
             schedule = TeamSchedule.objects.get(pk=schedule_id, team_id=team_id)
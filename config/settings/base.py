@@ -56,6 +56,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 PACKAGE = [
@@ -123,6 +124,48 @@ DATABASES = {
     }
 }
 
+# Cache
+# 공개 GET 응답 캐시의 공유 저장소 (REDIS_URL 이 있으면 Redis, CACHE_DIR 이 있으면 파일 캐시, 없으면 프로세스 메모리)
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+elif os.getenv("CACHE_DIR"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.getenv("CACHE_DIR"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# 응답 캐시 사용 여부 (테스트 설정에서는 끔 - config/settings/test.py)
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_ALIAS = "default"
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "60"))
+RESPONSE_CACHE_LOCAL_MAX_SIZE = int(os.getenv("RESPONSE_CACHE_LOCAL_MAX_SIZE", "512"))
+# 자동완성 인덱스를 DB 에서 다시 만드는 주기 (초) - 다른 프로세스에서 일어난 변경 반영용
+AUTOCOMPLETE_REBUILD_INTERVAL = int(os.getenv("AUTOCOMPLETE_REBUILD_INTERVAL", "300"))
+
+# Community
+# 게시글 / 댓글 응답에 포함할 댓글 트리의 최대 깊이와 단계 별 최대 댓글 수 (나머지는 댓글 목록 API 로 조회)
+COMMENT_TREE_MAX_DEPTH = 3
+COMMENT_TREE_PAGE_SIZE = 20
+# 좋아요 write-behind 모드: 좋아요 / 취소를 캐시에 모아 두었다가 flush_like_buffer 명령어로 DB 에 일괄 반영
+# 여러 프로세스가 버퍼를 공유해야 하므로 Redis 캐시(REDIS_URL)와 함께 사용 (프로세스 메모리 / 파일 캐시면 시스템 체크 오류)
+LIKE_WRITE_BEHIND = os.getenv("LIKE_WRITE_BEHIND", "false").lower() == "true"
+LIKE_BUFFER_CACHE_ALIAS = "default"
+# 버퍼 기록 보관 시간 (초) - flush 주기보다 충분히 길어야 함
+LIKE_BUFFER_TIMEOUT = int(os.getenv("LIKE_BUFFER_TIMEOUT", str(60 * 60 * 24)))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -186,6 +229,12 @@ s3_client = boto3.client(
     region_name=AWS_S3_REGION_NAME,
 )
 
+# 업로드된 이미지의 크기 별 파생 이미지 (WebP / AVIF) - 너비(px), 인코딩 품질
+IMAGE_VARIANT_WIDTHS = (64, 256, 1024)
+IMAGE_VARIANT_QUALITY = 80
+# 파생 이미지를 만드는 프로세스 내 워커 스레드 수 (0 이면 커밋 직후 같은 스레드에서 생성)
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = ["http://localhost:3000", "https://choeaelol.umdoong.shop", "https://api.umdoong.shop"]
 CORS_ALLOW_CREDENTIALS = True
@@ -10,3 +10,6 @@ DATABASES = {
         "PORT": os.getenv("DB_PORT", "5432"),
     }
 }
+
+# 캐시된 응답이 다른 테스트에 섞이지 않도록 끔 (캐시를 검증하는 테스트는 override_settings 로 켬)
+RESPONSE_CACHE_ENABLED = False